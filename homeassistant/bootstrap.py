@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Mapping
 import contextlib
 from functools import partial
 from itertools import chain
@@ -86,7 +87,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .setup import (
@@ -95,7 +96,9 @@ from .setup import (
     # that it is not part of the public API and should not be used
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
+    SetupReport,
     _setup_started,
+    async_get_setup_report,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
@@ -127,6 +130,11 @@ DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 
+SETUP_REPORT_STORAGE_KEY = "core.setup_report"
+SETUP_REPORT_STORAGE_VERSION = 1
+# Setup time of an integration which was not set up in the previous startup
+SETUP_PRIORITY_DEFAULT_SECONDS = 0.01
+
 STAGE_1_TIMEOUT = 120
 STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
@@ -730,10 +738,87 @@ class _WatchPendingSetups:
             self._handle = None
 
 
+class _SetupScheduler:
+    """Order the setup of integrations along the critical path of the startup.
+
+    async_setup_component waits for the dependencies of an integration, so
+    all integrations of a stage are started at once. Integrations at the
+    head of the longest chain of dependants are started first so their
+    imports are not queued behind integrations which nothing waits for.
+    The length of a chain is measured with the import and setup times of the
+    previous startup, which are stored with the setup report. The time an
+    integration waited for its dependencies is not counted.
+    """
+
+    def __init__(self, hass: core.HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._store: Store[SetupReport] = Store(
+            hass, SETUP_REPORT_STORAGE_VERSION, SETUP_REPORT_STORAGE_KEY
+        )
+        self._previous_report: SetupReport | None = None
+        self.priorities: dict[str, float] = {}
+
+    async def async_load(self) -> None:
+        """Load the setup report of the previous startup."""
+        self._previous_report = await self._store.async_load()
+
+    @core.callback
+    def async_prioritize(
+        self,
+        domains_to_setup: set[str],
+        integration_cache: dict[str, loader.Integration],
+    ) -> None:
+        """Calculate the length of the chain of dependants of each domain."""
+        durations: dict[str, float] = {}
+        if self._previous_report:
+            durations = {
+                domain: timings["import_seconds"] + timings["setup_seconds"]
+                for domain, timings in self._previous_report["integrations"].items()
+            }
+        dependants: dict[str, list[str]] = {domain: [] for domain in domains_to_setup}
+        for domain in domains_to_setup:
+            if (integration := integration_cache.get(domain)) is None:
+                continue
+            for dep in chain(integration.dependencies, integration.after_dependencies):
+                if dep in dependants:
+                    dependants[dep].append(domain)
+
+        priorities = self.priorities
+        visiting: set[str] = set()
+
+        def _priority(domain: str) -> float:
+            """Return the priority of a domain."""
+            if (priority := priorities.get(domain)) is not None:
+                return priority
+            if domain in visiting:
+                # after_dependencies can form a cycle
+                return 0.0
+            visiting.add(domain)
+            priority = durations.get(domain, SETUP_PRIORITY_DEFAULT_SECONDS) + max(
+                (_priority(dependant) for dependant in dependants[domain]),
+                default=0.0,
+            )
+            visiting.discard(domain)
+            priorities[domain] = priority
+            return priority
+
+        for domain in domains_to_setup:
+            _priority(domain)
+
+    @core.callback
+    def async_save_report(self, report: SetupReport) -> None:
+        """Save the setup report for the next startup."""
+        self._hass.async_create_background_task(
+            self._store.async_save(report), "save setup report", eager_start=True
+        )
+
+
 async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
     config: dict[str, Any],
+    priorities: Mapping[str, float] | None = None,
 ) -> None:
     """Set up multiple domains. Log on failure."""
     # Avoid creating tasks for domains that were setup in a previous stage
@@ -741,6 +826,7 @@ async def async_setup_multi_components(
     # Create setup tasks for base platforms first since everything will have
     # to wait to be imported, and the sooner we can get the base platforms
     # loaded the sooner we can start loading the rest of the integrations.
+    # Within that, domains with the longest chain of dependants go first.
     futures = {
         domain: hass.async_create_task_internal(
             async_setup_component(hass, domain, config),
@@ -748,7 +834,11 @@ async def async_setup_multi_components(
             eager_start=True,
         )
         for domain in sorted(
-            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
+            domains_not_yet_setup,
+            key=SETUP_ORDER_SORT_KEY
+            if priorities is None
+            else lambda domain: (domain in BASE_PLATFORMS, priorities.get(domain, 0)),
+            reverse=True,
         )
     }
     results = await asyncio.gather(*futures.values(), return_exceptions=True)
@@ -927,9 +1017,17 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
+    scheduler = _SetupScheduler(hass)
+    load_report_task = create_eager_task(
+        scheduler.async_load(), name="load setup report", loop=hass.loop
+    )
+
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
+    await load_report_task
+    scheduler.async_prioritize(domains_to_setup, integration_cache)
+    priorities = scheduler.priorities
 
     # Initialize recorder
     if "recorder" in domains_to_setup:
@@ -975,7 +1073,7 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            await async_setup_multi_components(hass, domain_group, config, priorities)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -987,7 +1085,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_1_domains, config, priorities
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1003,7 +1103,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_2_domains, config, priorities
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1023,6 +1125,14 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    report = async_get_setup_report(hass)
+    scheduler.async_save_report(report)
+    _LOGGER.info(
+        "Startup critical path (%.2f seconds): %s",
+        report["seconds"],
+        report["critical_path"],
+    )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import Counter, deque
 from copy import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial
+from itertools import pairwise
 import logging
+import math
 from numbers import Number
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -297,6 +299,70 @@ class SensorFilter(SensorEntity):
         if update_ha:
             self.async_write_ha_state()
 
+    @callback
+    def _replay_history(self, history_list: list[State]) -> None:
+        """Replay recorded states through the filter chain.
+
+        A change of the unit of measurement resets the filters, so such a
+        state is replayed on its own. The runs of states in between are
+        pushed through the chain in bulk.
+        """
+        idx = 0
+        count = len(history_list)
+        while idx < count:
+            unit = history_list[idx].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            if unit != self._attr_native_unit_of_measurement:
+                self._update_filter_sensor_state(history_list[idx], False)
+                idx += 1
+                continue
+            end = idx + 1
+            while (
+                end < count
+                and history_list[end].attributes.get(ATTR_UNIT_OF_MEASUREMENT) == unit
+            ):
+                end += 1
+            self._update_filter_sensor_state_bulk(history_list[idx:end])
+            idx = end
+
+    @callback
+    def _update_filter_sensor_state_bulk(self, new_states: list[State]) -> None:
+        """Process states which share the current unit of measurement.
+
+        The states are pushed through the chain one filter at a time instead
+        of one state at a time. The filters are independent of each other,
+        so the result is the same as processing the states one by one.
+        """
+        self._attr_available = True
+
+        batch = [
+            (_State(new_state.last_updated, new_state.state), new_state)
+            for new_state in new_states
+        ]
+        for filt in self._filters:
+            filtered_batch: list[tuple[_State, State]] = []
+            for temp_state, new_state in batch:
+                try:
+                    filtered_state = filt.filter_state(copy(temp_state))
+                except ValueError:
+                    _LOGGER.error(
+                        "Could not convert state: %s (%s) to number",
+                        new_state.state,
+                        type(new_state.state),
+                    )
+                    continue
+                if not filt.skip_processing:
+                    filtered_batch.append((filtered_state, new_state))
+            batch = filtered_batch
+
+        if not batch:
+            return
+
+        temp_state, new_state = batch[-1]
+        self._state = temp_state.state
+        self._attr_icon = new_state.attributes.get(ATTR_ICON, ICON)
+        self._attr_device_class = new_state.attributes.get(ATTR_DEVICE_CLASS)
+        self._attr_state_class = new_state.attributes.get(ATTR_STATE_CLASS)
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
 
@@ -341,25 +407,31 @@ class SensorFilter(SensorEntity):
                     )
                 )
                 if self._entity in filter_history:
+                    seen = {(state.state, state.last_updated) for state in history_list}
                     history_list.extend(
                         [
                             state
                             for state in filter_history[self._entity]
-                            if state not in history_list
+                            if (state.state, state.last_updated) not in seen
                         ]
                     )
 
             # Sort the window states
             history_list = sorted(history_list, key=lambda s: s.last_updated)
-            _LOGGER.debug(
-                "Loading from history: %s",
-                [(s.state, s.last_updated) for s in history_list],
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Loading from history: %s",
+                    [(s.state, s.last_updated) for s in history_list],
+                )
 
             # Replay history through the filter chain
-            for state in history_list:
-                if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]:
-                    self._update_filter_sensor_state(state, False)
+            self._replay_history(
+                [
+                    state
+                    for state in history_list
+                    if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]
+                ]
+            )
 
         @callback
         def _async_hass_started(hass: HomeAssistant) -> None:
@@ -474,6 +546,10 @@ class Filter:
         """Implement filter."""
         raise NotImplementedError
 
+    def _store_state(self, state: FilterState) -> None:
+        """Store a state in the window of previous states."""
+        self.states.append(state)
+
     def filter_state(self, new_state: _State) -> _State:
         """Implement a common interface for filters."""
         fstate = FilterState(new_state)
@@ -484,9 +560,9 @@ class Filter:
         filtered.set_precision(self.filter_precision)
 
         if self._store_raw:
-            self.states.append(copy(FilterState(new_state)))
+            self._store_state(copy(FilterState(new_state)))
         else:
-            self.states.append(copy(filtered))
+            self._store_state(copy(filtered))
         new_state.state = filtered.state
         return new_state
 
@@ -575,15 +651,52 @@ class OutlierFilter(Filter, SensorEntity):
         self._radius = radius
         self._stats_internal: Counter = Counter()
         self._store_raw = True
+        # The values of self.states kept sorted to find the median
+        self._sorted_values: list[float] = []
+        # nan does not compare with anything, so it is counted instead of
+        # being kept in the sorted values where it would break the bisection
+        self._nan_values = 0
+
+    def reset(self) -> None:
+        """Reset filter."""
+        super().reset()
+        self._sorted_values.clear()
+        self._nan_values = 0
+
+    def _store_state(self, state: FilterState) -> None:
+        """Store a state in the window of previous states."""
+        sorted_values = self._sorted_values
+        if self.states and len(self.states) == self.states.maxlen:
+            # The oldest state is about to fall out of the window
+            oldest_value = cast(float, self.states[0].state)
+            if math.isnan(oldest_value):
+                self._nan_values -= 1
+            else:
+                del sorted_values[bisect_left(sorted_values, oldest_value)]
+        # We can cast safely here thanks to self._only_numbers = True
+        if math.isnan(value := cast(float, state.state)):
+            self._nan_values += 1
+        else:
+            insort(sorted_values, value)
+        super()._store_state(state)
 
     def _filter_state(self, new_state: FilterState) -> FilterState:
         """Implement the outlier filter."""
 
         # We can cast safely here thanks to self._only_numbers = True
-        previous_state_values = [cast(float, s.state) for s in self.states]
         new_state_value = cast(float, new_state.state)
 
-        median = statistics.median(previous_state_values) if self.states else 0
+        sorted_values = self._sorted_values
+        median: float = 0
+        if self._nan_values:
+            median = math.nan
+        elif count := len(sorted_values):
+            middle = count // 2
+            median = (
+                sorted_values[middle]
+                if count % 2
+                else (sorted_values[middle - 1] + sorted_values[middle]) / 2
+            )
         if (
             len(self.states) == self.states.maxlen
             and abs(new_state_value - median) > self._radius
@@ -659,12 +772,55 @@ class TimeSMAFilter(Filter, SensorEntity):
         self._time_window = window_size
         self.last_leak: FilterState | None = None
         self.queue = deque[FilterState]()
+        # Time weighted sum of the values between the first and last queued state
+        self._queue_sum: float = 0
+        # A non-finite value turns the sum into inf or nan for good, as
+        # subtracting it again does not restore the previous sum. These
+        # values are counted and the sum is rebuilt once the last of them
+        # leaks. To bound the rounding drift of the running sum it is also
+        # rebuilt after as many leaks as there are queued states.
+        self._queue_sum_nonfinite = 0
+        self._leaks_since_rebuild = 0
+
+    def _rebuild_queue_sum(self) -> None:
+        """Recalculate the time weighted sum of the queued states."""
+        queue_sum = 0.0
+        nonfinite = 0
+        for state, next_state in pairwise(self.queue):
+            # We can cast safely here thanks to self._only_numbers = True
+            value = cast(float, state.state)
+            if not math.isfinite(value):
+                nonfinite += 1
+            queue_sum += (
+                next_state.timestamp - state.timestamp
+            ).total_seconds() * value
+        self._queue_sum = queue_sum
+        self._queue_sum_nonfinite = nonfinite
+        self._leaks_since_rebuild = 0
 
     def _leak(self, left_boundary: datetime) -> None:
         """Remove timeouted elements."""
         while self.queue:
             if self.queue[0].timestamp + self._time_window <= left_boundary:
-                self.last_leak = self.queue.popleft()
+                leaked = self.last_leak = self.queue.popleft()
+                if not self.queue:
+                    self._queue_sum = 0
+                    self._queue_sum_nonfinite = 0
+                    self._leaks_since_rebuild = 0
+                    return
+                # We can cast safely here thanks to self._only_numbers = True
+                leaked_value = cast(float, leaked.state)
+                self._leaks_since_rebuild += 1
+                if not math.isfinite(leaked_value):
+                    self._queue_sum_nonfinite -= 1
+                    if not self._queue_sum_nonfinite:
+                        self._rebuild_queue_sum()
+                elif self._leaks_since_rebuild >= len(self.queue):
+                    self._rebuild_queue_sum()
+                else:
+                    self._queue_sum -= (
+                        self.queue[0].timestamp - leaked.timestamp
+                    ).total_seconds() * leaked_value
             else:
                 return
 
@@ -672,17 +828,23 @@ class TimeSMAFilter(Filter, SensorEntity):
         """Implement the Simple Moving Average filter."""
 
         self._leak(new_state.timestamp)
+        if self.queue:
+            last_state = self.queue[-1]
+            # We can cast safely here thanks to self._only_numbers = True
+            last_value = cast(float, last_state.state)
+            if not math.isfinite(last_value):
+                self._queue_sum_nonfinite += 1
+            self._queue_sum += (
+                new_state.timestamp - last_state.timestamp
+            ).total_seconds() * last_value
         self.queue.append(copy(new_state))
 
-        moving_sum: float = 0
+        first_state = self.queue[0]
         start = new_state.timestamp - self._time_window
-        prev_state = self.last_leak if self.last_leak is not None else self.queue[0]
-        for state in self.queue:
-            # We can cast safely here thanks to self._only_numbers = True
-            prev_state_value = cast(float, prev_state.state)
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state_value
-            start = state.timestamp
-            prev_state = state
+        prev_state = self.last_leak if self.last_leak is not None else first_state
+        moving_sum = (first_state.timestamp - start).total_seconds() * cast(
+            float, prev_state.state
+        ) + self._queue_sum
 
         new_state.state = moving_sum / self._time_window.total_seconds()
 
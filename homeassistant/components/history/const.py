@@ -5,3 +5,8 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# A chunked history response waits to read the next chunk from the
+# database until the websocket writer has fewer pending messages than this
+MAX_PENDING_HISTORY_CHUNKS = 16
+HISTORY_CHUNK_DRAIN_INTERVAL = 0.05
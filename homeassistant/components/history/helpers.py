@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -31,3 +33,65 @@ def has_recorder_run_after(hass: HomeAssistant, run_time: dt) -> bool:
     return run_time >= process_timestamp(
         get_instance(hass).recorder_runs_manager.first.start
     )
+
+
+def downsample_compressed_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Downsample a numeric series of compressed states to about max_points.
+
+    The time range is split into max_points // 2 equal buckets and only
+    the minimum and maximum state of each bucket are kept, in time order,
+    so peaks survive. The first and last states are always kept, as are
+    states that are not numeric since they mark gaps in the graph.
+    Series that have no numeric states are returned unchanged.
+    """
+    if len(states) <= max_points or max_points < 4:
+        return states
+    values: list[float | None] = []
+    has_numeric = False
+    for state in states:
+        try:
+            values.append(float(state[COMPRESSED_STATE_STATE]))
+            has_numeric = True
+        except (TypeError, ValueError):
+            values.append(None)
+    if not has_numeric:
+        return states
+
+    last_idx = len(states) - 1
+    first_ts: float = states[1][COMPRESSED_STATE_LAST_UPDATED]
+    span = states[last_idx - 1][COMPRESSED_STATE_LAST_UPDATED] - first_ts
+    bucket_count = (max_points - 2) // 2
+    keep = [False] * len(states)
+    keep[0] = keep[last_idx] = True
+    bucket_min: dict[int, int] = {}
+    bucket_max: dict[int, int] = {}
+    for idx in range(1, last_idx):
+        if (value := values[idx]) is None:
+            keep[idx] = True
+            continue
+        bucket = (
+            min(
+                int(
+                    (states[idx][COMPRESSED_STATE_LAST_UPDATED] - first_ts)
+                    / span
+                    * bucket_count
+                ),
+                bucket_count - 1,
+            )
+            if span > 0
+            else 0
+        )
+        if (min_idx := bucket_min.get(bucket)) is None:
+            bucket_min[bucket] = bucket_max[bucket] = idx
+            continue
+        if value < values[min_idx]:  # type: ignore[operator]
+            bucket_min[bucket] = idx
+        elif value > values[bucket_max[bucket]]:  # type: ignore[operator]
+            bucket_max[bucket] = idx
+    for idx in bucket_min.values():
+        keep[idx] = True
+    for idx in bucket_max.values():
+        keep[idx] = True
+    return [state for state, kept in zip(states, keep, strict=True) if kept]
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Iterable
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
+import threading
 from typing import Any, cast
 
 import voluptuous as vol
@@ -36,11 +38,20 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.async_ import create_eager_task, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_DRAIN_INTERVAL,
+    MAX_PENDING_HISTORY_CHUNKS,
+    MAX_PENDING_HISTORY_STATES,
+)
+from .helpers import (
+    downsample_compressed_states,
+    entities_may_have_state_changes_after,
+    has_recorder_run_after,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +74,109 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    closed: threading.Event,
+) -> None:
+    """Fetch history significant_states and send them in chunks from the executor.
+
+    Each chunk is sent as a partial event message once the next one has
+    been read, so the last one can be marked as not partial. After each
+    chunk the database read waits until the websocket writer has caught up,
+    and it stops once the connection is closed.
+    """
+    previous: dict[str, list[Any]] = {}
+    with closing(
+        history.stream_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+            chunk_size,
+        )
+    ) as chunks:
+        for chunk in chunks:
+            if previous:
+                message = json_bytes(
+                    messages.event_message(
+                        msg_id, {"states": previous, "partial": True}
+                    )
+                )
+                if not _send_chunk_when_drained(hass, connection, closed, message):
+                    return
+            previous = chunk
+    message = _generate_last_chunk_message(msg_id, previous)
+    _send_chunk_when_drained(hass, connection, closed, message)
+
+
+def _send_chunk_when_drained(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    closed: threading.Event,
+    message: bytes,
+) -> bool:
+    """Send a chunk once the pending messages are below the limit.
+
+    Returns False if the connection was closed.
+    """
+    while (
+        pending := run_callback_threadsafe(
+            hass.loop, _async_pending_messages, connection, closed
+        ).result()
+    ) is not None:
+        if pending < MAX_PENDING_HISTORY_CHUNKS:
+            run_callback_threadsafe(
+                hass.loop, connection.send_message, message
+            ).result()
+            return True
+        closed.wait(HISTORY_CHUNK_DRAIN_INTERVAL)
+    return False
+
+
+@callback
+def _async_pending_messages(
+    connection: ActiveConnection, closed: threading.Event
+) -> int | None:
+    """Return the pending messages of the connection or None if it is closed."""
+    if closed.is_set():
+        return None
+    return connection.pending_messages()
+
+
+def _generate_last_chunk_message(msg_id: int, states: dict[str, list[Any]]) -> bytes:
+    """Generate the final chunk message of a chunked history response."""
+    return json_bytes(
+        messages.event_message(msg_id, {"states": states, "partial": False})
+    )
+
+
+@callback
+def _async_send_empty_history(
+    connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send an empty history during period response."""
+    if "chunk_size" not in msg:
+        connection.send_result(msg["id"], {})
+        return
+    connection.send_result(msg["id"])
+    connection.send_message(_generate_last_chunk_message(msg["id"], {}))
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -73,25 +187,29 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None = None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
     )
+    if max_points is not None:
+        states = {
+            entity_id: downsample_compressed_states(
+                cast(list[dict[str, Any]], entity_states), max_points
+            )
+            for entity_id, entity_states in states.items()
+        }
+    return json_bytes(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -104,6 +222,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Exclusive("chunk_size", "response_size"): vol.All(int, vol.Range(min=1)),
+        vol.Exclusive("max_points", "response_size"): vol.All(int, vol.Range(min=4)),
     }
 )
 @websocket_api.async_response
@@ -130,7 +250,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -150,12 +270,36 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if (chunk_size := msg.get("chunk_size")) is not None:
+        connection.send_result(msg["id"])
+        closed = threading.Event()
+        connection.subscriptions[msg["id"]] = closed.set
+        try:
+            await get_instance(hass).async_add_executor_job(
+                _ws_stream_significant_states,
+                hass,
+                connection,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                chunk_size,
+                closed,
+            )
+        finally:
+            connection.subscriptions.pop(msg["id"], None)
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -168,6 +312,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 import datetime
+from operator import attrgetter
 
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
+from . import DOMAIN
 from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+DATA_HISTORY_BACKFILL: HassKey[HistoryBackfill] = HassKey(f"{DOMAIN}_backfill")
+
 
 @dataclass
 class HistoryStatsState:
@@ -32,6 +39,112 @@ class HistoryState:
     last_changed: float
 
 
+_last_changed = attrgetter("last_changed")
+
+
+def _history_states_in_period(
+    states: list[HistoryState], start_ts: float, end_ts: float
+) -> list[HistoryState]:
+    """Return the states of a period from the states of a period containing it.
+
+    The last state before the start of the period becomes the state at the
+    start of the period, like include_start_time_state does for the query.
+    """
+    start_idx = bisect_right(states, start_ts, key=_last_changed)
+    period_states = states[start_idx : bisect_left(states, end_ts, key=_last_changed)]
+    if start_idx:
+        period_states.insert(0, HistoryState(states[start_idx - 1].state, start_ts))
+    return period_states
+
+
+class HistoryBackfill:
+    """Share the history backfill queries of history stats.
+
+    Backfills requested for the same entity in the same event loop iteration,
+    such as when many sensors tracking the same entity are set up together,
+    are answered by a single query covering all of their periods.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init the history backfill."""
+        self.hass = hass
+        self._pending: dict[
+            str, list[tuple[float, float, asyncio.Future[list[HistoryState]]]]
+        ] = {}
+
+    async def async_get(
+        self, entity_id: str, start_ts: float, end_ts: float
+    ) -> list[HistoryState]:
+        """Return the history of an entity for a period."""
+        if (pending := self._pending.get(entity_id)) is not None:
+            future: asyncio.Future[list[HistoryState]] = self.hass.loop.create_future()
+            pending.append((start_ts, end_ts, future))
+            return await future
+
+        requests = self._pending[entity_id] = []
+        try:
+            # Give the other backfills of this event loop iteration
+            # a chance to join this query
+            await asyncio.sleep(0)
+        except BaseException:
+            # The backfills which joined would never be answered
+            for _, _, future in requests:
+                future.cancel()
+            raise
+        finally:
+            del self._pending[entity_id]
+
+        query_start_ts = min([start_ts, *(request[0] for request in requests)])
+        query_end_ts = max([end_ts, *(request[1] for request in requests)])
+        try:
+            states = await self._async_query(entity_id, query_start_ts, query_end_ts)
+        except BaseException as err:
+            for _, _, future in requests:
+                if not future.done():
+                    future.set_exception(err)
+            raise
+
+        def _states_in_period(
+            period_start_ts: float, period_end_ts: float
+        ) -> list[HistoryState]:
+            """Return a copy of the states of a period the caller can extend."""
+            if period_start_ts == query_start_ts and period_end_ts == query_end_ts:
+                return states.copy()
+            return _history_states_in_period(states, period_start_ts, period_end_ts)
+
+        for request_start_ts, request_end_ts, future in requests:
+            if not future.done():
+                future.set_result(_states_in_period(request_start_ts, request_end_ts))
+        return _states_in_period(start_ts, end_ts)
+
+    async def _async_query(
+        self, entity_id: str, start_ts: float, end_ts: float
+    ) -> list[HistoryState]:
+        """Query the history of an entity for a period from the database."""
+        states = await get_instance(self.hass).async_add_executor_job(
+            self._state_changes_during_period, entity_id, start_ts, end_ts
+        )
+        return [
+            HistoryState(state.state, state.last_changed.timestamp())
+            for state in states
+        ]
+
+    def _state_changes_during_period(
+        self, entity_id: str, start_ts: float, end_ts: float
+    ) -> list[State]:
+        """Return state changes during a period."""
+        start = dt_util.utc_from_timestamp(start_ts)
+        end = dt_util.utc_from_timestamp(end_ts)
+        return history.state_changes_during_period(
+            self.hass,
+            start,
+            end,
+            entity_id,
+            include_start_time_state=True,
+            no_attributes=True,
+        ).get(entity_id, [])
+
+
 class HistoryStats:
     """Manage history stats."""
 
@@ -51,6 +164,7 @@ class HistoryStats:
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
         self._history_current_period: list[HistoryState] = []
         self._previous_run_before_start = False
+        self._previous_update_timestamp = 0.0
         self._entity_states = set(entity_states)
         self._duration = duration
         self._start = start
@@ -80,6 +194,8 @@ class HistoryStats:
         previous_period_end_timestamp = floored_timestamp(previous_period_end)
         utc_now = dt_util.utcnow()
         now_timestamp = floored_timestamp(utc_now)
+        previous_update_timestamp = self._previous_update_timestamp
+        self._previous_update_timestamp = now_timestamp
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
@@ -91,13 +207,21 @@ class HistoryStats:
         # We avoid querying the database if the below did NOT happen:
         #
         # - The previous run happened before the start time
-        # - The start time changed
+        # - The start time moved backwards or past the previous period
+        # - The start time moved forward after the previous period had
+        #   already ended, the state changes since then were not kept
         # - The period shrank in size
         # - The previous period ended before now
         #
         if (
             not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
+            and previous_period_start_timestamp
+            <= current_period_start_timestamp
+            <= previous_period_end_timestamp
+            and (
+                current_period_start_timestamp == previous_period_start_timestamp
+                or previous_period_end_timestamp >= previous_update_timestamp
+            )
             and (
                 current_period_end_timestamp == previous_period_end_timestamp
                 or (
@@ -107,6 +231,11 @@ class HistoryStats:
             )
         ):
             new_data = False
+            if current_period_start_timestamp != previous_period_start_timestamp:
+                # The period slid forward, the history we already have
+                # covers the rest of it
+                self._async_trim_history(current_period_start_timestamp)
+                new_data = True
             if event and (new_state := event.data["new_state"]) is not None:
                 if (
                     current_period_start_timestamp
@@ -137,37 +266,36 @@ class HistoryStats:
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
+    def _async_trim_history(self, start_timestamp: float) -> None:
+        """Drop the history before a new start of the period."""
+        history_current_period = self._history_current_period
+        if not (
+            start_idx := bisect_right(
+                history_current_period, start_timestamp, key=_last_changed
+            )
+        ):
+            return
+        # The last state before the new start is the state at the start
+        self._history_current_period = [
+            HistoryState(history_current_period[start_idx - 1].state, start_timestamp),
+            *history_current_period[start_idx:],
+        ]
+
     async def _async_history_from_db(
         self,
         current_period_start_timestamp: float,
         current_period_end_timestamp: float,
     ) -> None:
         """Update history data for the current period from the database."""
-        instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
-            self._state_changes_during_period,
+        if (backfill := self.hass.data.get(DATA_HISTORY_BACKFILL)) is None:
+            backfill = self.hass.data[DATA_HISTORY_BACKFILL] = HistoryBackfill(
+                self.hass
+            )
+        self._history_current_period = await backfill.async_get(
+            self.entity_id,
             current_period_start_timestamp,
             current_period_end_timestamp,
         )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
-
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
 
     def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
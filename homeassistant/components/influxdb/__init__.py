@@ -5,8 +5,10 @@ from __future__ import annotations
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import datetime
 import logging
 import math
+import os
 import queue
 import threading
 import time
@@ -14,7 +16,7 @@ from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
-from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
+from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import requests.exceptions
 import urllib3.exceptions
@@ -47,10 +49,13 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
 from .const import (
     API_VERSION_2,
+    BATCH_BUFFER_BYTES,
     BATCH_BUFFER_SIZE,
     BATCH_TIMEOUT,
     CATCHING_UP_MESSAGE,
@@ -96,6 +101,11 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_FILE,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_MAX_BYTES,
+    SPOOL_REPLAYED_MESSAGE,
+    SPOOLED_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
@@ -105,6 +115,17 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_util.UTC)
+_NANOSECONDS_PER_UNIT = {
+    None: 1,
+    "n": 1,
+    "ns": 1,
+    "u": 10**3,
+    "us": 10**3,
+    "ms": 10**6,
+    "s": 10**9,
+}
+
 
 def create_influx_url(conf: dict) -> dict:
     """Build URL used from config inputs and default when necessary."""
@@ -321,6 +342,78 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
     return event_to_json
 
 
+def _escape_key(key: Any) -> str:
+    """Escape a measurement, tag key, tag value or field key."""
+    return (
+        str(key)
+        .replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+def _encode_field_value(value: Any) -> str:
+    """Encode a field value for the line protocol."""
+    if isinstance(value, str):
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{escaped}"'
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+def _json_to_line(json: dict[str, Any], nanoseconds_per_unit: int) -> str:
+    """Encode a point built by event_to_json as a line protocol line.
+
+    Produces the same output as the line protocol encoder of the influxdb
+    client, without going through its generic per point machinery.
+    """
+    line = _escape_key(json[INFLUX_CONF_MEASUREMENT])
+    tags = json[INFLUX_CONF_TAGS]
+    for key in sorted(tags):
+        if (value := tags[key]) is None:
+            continue
+        if (escaped_key := _escape_key(key)) and (escaped_value := _escape_key(value)):
+            line += f",{escaped_key}={escaped_value}"
+
+    separator = " "
+    fields = json[INFLUX_CONF_FIELDS]
+    for key in sorted(fields):
+        if (value := fields[key]) is None:
+            continue
+        if (escaped_key := _escape_key(key)) and (
+            encoded_value := _encode_field_value(value)
+        ):
+            line += f"{separator}{escaped_key}={encoded_value}"
+            separator = ","
+
+    delta = json[INFLUX_CONF_TIME] - _EPOCH
+    nanoseconds = (
+        (delta.days * 86400 + delta.seconds) * 10**6 + delta.microseconds
+    ) * 1000
+    return f"{line} {nanoseconds // nanoseconds_per_unit}"
+
+
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:
+    """Build event to line protocol converter."""
+    event_to_json = _generate_event_to_json(conf)
+    nanoseconds_per_unit = _NANOSECONDS_PER_UNIT[conf.get(CONF_PRECISION)]
+
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a line protocol line."""
+        if (json := event_to_json(event)) is None or not json[INFLUX_CONF_FIELDS]:
+            return None
+        return _json_to_line(json, nanoseconds_per_unit)
+
+    return event_to_line
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
@@ -349,14 +442,15 @@ def get_influx_connection(  # noqa: C901
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
         bucket = conf.get(CONF_BUCKET)
-        influx = InfluxDBClientV2(**kwargs)
+        influx = InfluxDBClientV2(**kwargs, enable_gzip=True)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
-        write_api = influx.write_api(write_options=initial_write_mode)
+        # Writes are made from the InfluxThread, which batches them itself.
+        # They are synchronous so failed writes are retried and spooled.
+        write_api = influx.write_api(write_options=SYNCHRONOUS)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write line protocol lines to V2 influx."""
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -367,7 +461,7 @@ def get_influx_connection(  # noqa: C901
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -391,7 +485,6 @@ def get_influx_connection(  # noqa: C901
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -429,12 +522,12 @@ def get_influx_connection(  # noqa: C901
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
-    influx = InfluxDBClient(**kwargs)
+    influx = InfluxDBClient(**kwargs, gzip=True)
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write line protocol lines to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -443,7 +536,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -491,9 +584,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_line = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_line, max_tries)
     instance.start()
 
     def shutdown(event):
@@ -510,16 +603,21 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_line, max_tries):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
             queue.SimpleQueue()
         )
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
         self.write_errors = 0
+        self.connection_lost = False
+        self.spool_path = hass.config.path(STORAGE_DIR, SPOOL_FILE)
+        self.spool_pending = False
+        self.spool_offset = 0
+        self.spool_replayed = 0
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
@@ -534,18 +632,29 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
+    def get_events_lines(self):
+        """Return a batch of events encoded for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
-        json = []
+        size = 0
+        lines = []
 
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
+            while (
+                len(lines) < BATCH_BUFFER_SIZE
+                and size < BATCH_BUFFER_BYTES
+                and not self.shutdown
+            ):
+                if count:
+                    timeout = self.batch_timeout()
+                elif self.spool_pending and not self.connection_lost:
+                    # Do not wait for events while the spool is replayed
+                    timeout = 0
+                else:
+                    timeout = None
                 item = self.queue.get(timeout=timeout)
                 count += 1
 
@@ -556,8 +665,9 @@ class InfluxThread(threading.Thread):
                     age = time.monotonic() - timestamp
 
                     if age < queue_seconds:
-                        if event_json := self.event_to_json(event):
-                            json.append(event_json)
+                        if line := self.event_to_line(event):
+                            lines.append(line)
+                            size += len(line) + 1
                     else:
                         dropped += 1
                 elif isinstance(item, threading.Event):
@@ -566,19 +676,25 @@ class InfluxThread(threading.Thread):
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
-        return count, json
+        return count, lines
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+    def write_to_influxdb(self, lines):
+        """Write encoded events to influxdb, with retry.
+
+        Events which still can't be written after the last retry are
+        spooled to disk and replayed once a write succeeds again.
+        """
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
+                self.influx.write(lines)
 
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
+                if self.connection_lost:
+                    self.connection_lost = False
+                    if self.write_errors:
+                        _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+                        self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                _LOGGER.debug(WROTE_MESSAGE, len(lines))
                 break
             except ValueError as err:
                 _LOGGER.error(err)
@@ -587,16 +703,96 @@ class InfluxThread(threading.Thread):
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
                 else:
-                    if not self.write_errors:
+                    if not self.connection_lost:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+                        self.connection_lost = True
+                    self.write_errors += self.spool(lines)
+
+    def spool(self, lines):
+        """Append lines to the spool, return the number of lost events."""
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        try:
+            spool_size = 0
+            with suppress(FileNotFoundError):
+                spool_size = os.path.getsize(self.spool_path)
+            if spool_size + len(data) > SPOOL_MAX_BYTES:
+                _LOGGER.warning(SPOOL_FULL_MESSAGE, len(lines))
+                return len(lines)
+            os.makedirs(os.path.dirname(self.spool_path), exist_ok=True)
+            with open(self.spool_path, "ab") as spool:
+                spool.write(data)
+        except OSError as err:
+            _LOGGER.error("Error spooling events to %s: %s", self.spool_path, err)
+            return len(lines)
+
+        self.spool_pending = True
+        _LOGGER.debug(SPOOLED_MESSAGE, len(lines))
+        return 0
+
+    def replay_spool(self):
+        """Write the next batch of spooled events.
+
+        The spool is replayed one batch at a time between the batches of
+        live events, so a large spool does not hold the live events back
+        until they are dropped as too old.
+        """
+        lines = []
+        size = 0
+        try:
+            with open(self.spool_path, "rb") as spool:
+                spool.seek(self.spool_offset)
+                while size < BATCH_BUFFER_BYTES and (line := spool.readline()):
+                    size += len(line)
+                    if line := line.rstrip(b"\n"):
+                        lines.append(line.decode("utf-8", "replace"))
+                offset = spool.tell()
+                replayed_all = offset >= os.fstat(spool.fileno()).st_size
+        except FileNotFoundError:
+            self.spool_pending = False
+            self.spool_offset = 0
+            return
+        except OSError as err:
+            _LOGGER.error(
+                "Error reading spooled events from %s: %s", self.spool_path, err
+            )
+            self.spool_pending = False
+            return
+
+        if lines:
+            try:
+                self.influx.write(lines)
+            except ValueError as err:
+                _LOGGER.error(err)
+            except ConnectionError as err:
+                if not self.connection_lost:
+                    _LOGGER.error(err)
+                    self.connection_lost = True
+                return
+            else:
+                self.spool_replayed += len(lines)
+
+        self.spool_offset = offset
+        if not replayed_all:
+            return
+
+        try:
+            os.unlink(self.spool_path)
+        except OSError as err:
+            _LOGGER.error("Error removing spool %s: %s", self.spool_path, err)
+        self.spool_pending = False
+        self.spool_offset = 0
+        _LOGGER.debug(SPOOL_REPLAYED_MESSAGE, self.spool_replayed)
+        self.spool_replayed = 0
 
     def run(self):
         """Process incoming events."""
+        self.spool_pending = os.path.exists(self.spool_path)
         while not self.shutdown:
-            _, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+            _, lines = self.get_events_lines()
+            if lines:
+                self.write_to_influxdb(lines)
+            if self.spool_pending and not self.connection_lost:
+                self.replay_spool()
 
     def block_till_done(self):
         """Block till all events processed.
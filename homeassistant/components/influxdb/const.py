@@ -78,6 +78,9 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+BATCH_BUFFER_BYTES = 512 * 1024
+SPOOL_FILE = "influxdb.spool"
+SPOOL_MAX_BYTES = 64 * 1024 * 1024
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -120,6 +123,9 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+SPOOLED_MESSAGE = "Spooled %d events to disk until the connection recovers."
+SPOOL_FULL_MESSAGE = "Spool is full, lost %d events."
+SPOOL_REPLAYED_MESSAGE = "Replayed %d spooled events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
@@ -6,7 +6,7 @@ import asyncio
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
+from functools import partial
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any
 import uuid
 
 import certifi
+from lru import LRU
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -73,6 +74,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
+from .topic_trie import TopicTrie
 from .util import get_file_path, get_mqtt_data, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
@@ -98,6 +100,10 @@ SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
 RECONNECT_INTERVAL_SECONDS = 10
+# Maximum number of packets to read from the socket in one batch
+MAX_PACKETS_TO_READ = 500
+# Number of topics for which the matching subscriptions are cached
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
 
 type SocketType = socket.socket | ssl.SSLSocket | Any
 
@@ -238,7 +244,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -406,6 +411,10 @@ class MQTT:
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
         self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions_trie: TopicTrie[Subscription] = TopicTrie()
+        self._matching_subscriptions_cache: LRU[str, list[Subscription]] = LRU(
+            MATCHING_SUBSCRIPTIONS_CACHE_SIZE
+        )
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -438,6 +447,7 @@ class MQTT:
             )
         )
         self._socket_buffersize: int | None = None
+        self._messages_received = 0
 
     @callback
     def _async_ha_started(self, _hass: HomeAssistant) -> None:
@@ -525,9 +535,28 @@ class MQTT:
 
     @callback
     def _async_reader_callback(self, client: mqtt.Client) -> None:
-        """Handle reading data from the socket."""
-        if (status := client.loop_read()) != 0:
-            self._async_on_disconnect(status)
+        """Handle reading data from the socket.
+
+        Reads packets until no message was received or MAX_PACKETS_TO_READ
+        is reached, so the coalesced state writes requested by the messages
+        of the batch are done once per entity and the discovered entities
+        are added at once.
+        """
+        state_write_requests = self._mqtt_data.state_write_requests
+        state_write_requests.batch = True
+        try:
+            for _ in range(MAX_PACKETS_TO_READ):
+                messages_received = self._messages_received
+                if (status := client.loop_read()) != 0:
+                    self._async_on_disconnect(status)
+                    break
+                if self._messages_received == messages_received:
+                    break
+        finally:
+            state_write_requests.batch = False
+            state_write_requests.message = None
+            state_write_requests.process_add_entity_requests()
+            state_write_requests.process_coalesced_write_state_requests()
 
     @callback
     def _async_start_misc_loop(self) -> None:
@@ -744,30 +773,27 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
-        if _is_simple_match(subscription.topic):
-            self._simple_subscriptions.setdefault(subscription.topic, []).append(
-                subscription
-            )
+        topic = subscription.topic
+        if _is_simple_match(topic):
+            self._simple_subscriptions.setdefault(topic, []).append(subscription)
+            self._matching_subscriptions_cache.pop(topic, None)
         else:
             self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions_trie.add(topic, subscription)
+            self._matching_subscriptions_cache.clear()
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -776,8 +802,11 @@ class MQTT:
                 simple_subscriptions[topic].remove(subscription)
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
+                self._matching_subscriptions_cache.pop(topic, None)
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions_trie.remove(topic, subscription)
+                self._matching_subscriptions_cache.clear()
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -812,11 +841,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -826,7 +852,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -1006,22 +1031,23 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        """Return the subscriptions which match a topic."""
+        cache = self._matching_subscriptions_cache
+        if (subscriptions := cache.get(topic)) is not None:
+            return subscriptions
+        subscriptions = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            if subscription.matcher(topic)
-        )
+        subscriptions.extend(self._wildcard_subscriptions_trie.match(topic))
+        cache[topic] = subscriptions
         return subscriptions
 
     @callback
     def _async_mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
+        self._messages_received += 1
         try:
             # msg.topic is a property that decodes the topic to a string
             # every time it is accessed. Save the result to avoid
@@ -1046,6 +1072,8 @@ class MQTT:
         )
         subscriptions = self._matching_subscriptions(topic)
         msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
+        state_write_requests = self._mqtt_data.state_write_requests
+        state_write_requests.message = msg
 
         for subscription in subscriptions:
             if msg.retain:
@@ -1087,7 +1115,8 @@ class MQTT:
             else:
                 receive_msg = msg_cache_by_subscription_topic[subscription_topic]
             self.hass.async_run_hass_job(subscription.job, receive_msg)
-        self._mqtt_data.state_write_requests.process_write_state_requests(msg)
+        state_write_requests.process_write_state_requests(msg)
+        state_write_requests.message = None
 
     @callback
     def _async_mqtt_on_callback(
@@ -1200,13 +1229,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
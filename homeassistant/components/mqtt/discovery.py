@@ -113,7 +113,9 @@ class MQTTDiscoveryPayload(dict[str, Any]):
 
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry from already discovered list."""
-    get_mqtt_data(hass).discovery_already_discovered.remove(discovery_hash)
+    mqtt_data = get_mqtt_data(hass)
+    mqtt_data.discovery_already_discovered.remove(discovery_hash)
+    mqtt_data.discovery_payloads.pop(discovery_hash, None)
 
 
 def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
@@ -204,6 +206,25 @@ async def async_start(  # noqa: C901
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        # The broker sends all retained discovery messages again after
+        # reconnecting, skip those which did not change since they were processed
+        if (
+            payload
+            and mqtt_data.discovery_payloads.get(discovery_hash) == payload
+            and discovery_hash in mqtt_data.discovery_already_discovered
+            and discovery_hash not in mqtt_data.discovery_pending_discovered
+        ):
+            _LOGGER.debug(
+                "Ignoring unchanged discovery payload for %s %s",
+                component,
+                discovery_id,
+            )
+            return
+
         if payload:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
@@ -271,11 +292,8 @@ async def async_start(  # noqa: C901
                         if topic[-1] == TOPIC_BASE:
                             availability_conf[CONF_TOPIC] = f"{topic[:-1]}{base}"
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if discovery_payload:
+            mqtt_data.discovery_payloads[discovery_hash] = payload
             # Attach MQTT topic to the payload, used for debug prints
             setattr(
                 discovery_payload,
@@ -290,6 +308,8 @@ async def async_start(  # noqa: C901
             setattr(discovery_payload, "discovery_data", discovery_data)
 
             discovery_payload[CONF_PLATFORM] = "mqtt"
+        else:
+            mqtt_data.discovery_payloads.pop(discovery_hash, None)
 
         if discovery_hash in mqtt_data.discovery_pending_discovered:
             pending = mqtt_data.discovery_pending_discovered[discovery_hash]["pending"]
@@ -373,8 +373,9 @@ async def async_setup_entity_entry_helper(
             entity_class = schema_class_mapping[config[CONF_SCHEMA]]
         if TYPE_CHECKING:
             assert entity_class is not None
-        async_add_entities(
-            [entity_class(hass, config, entry, discovery_payload.discovery_data)]
+        mqtt_data.state_write_requests.add_entity_request(
+            async_add_entities,
+            entity_class(hass, config, entry, discovery_payload.discovery_data),
         )
 
     mqtt_data.reload_dispatchers.append(
@@ -466,9 +467,12 @@ def init_entity_id_from_config(
 
 
 def write_state_on_attr_change(
-    entity: Entity, attributes: set[str]
+    entity: Entity, attributes: set[str], coalesce: bool = False
 ) -> Callable[[MessageCallbackType], MessageCallbackType]:
-    """Wrap an MQTT message callback to track state attribute changes."""
+    """Wrap an MQTT message callback to track state attribute changes.
+
+    With coalesce set the state writes of a batch of messages are combined.
+    """
 
     def _attrs_have_changed(tracked_attrs: dict[str, Any]) -> bool:
         """Return True if attributes on entity changed or if update is forced."""
@@ -497,7 +501,7 @@ def write_state_on_attr_change(
                 return
 
             mqtt_data = get_mqtt_data(entity.hass)
-            mqtt_data.state_write_requests.write_state_request(entity)
+            mqtt_data.state_write_requests.write_state_request(entity, coalesce)
 
         return wrapper
 
@@ -537,7 +541,9 @@ class MqttAttributes(Entity):
 
         @callback
         @log_messages(self.hass, self.entity_id)
-        @write_state_on_attr_change(self, {"_attr_extra_state_attributes"})
+        @write_state_on_attr_change(
+            self, {"_attr_extra_state_attributes"}, coalesce=True
+        )
         def attributes_message_received(msg: ReceiveMessage) -> None:
             """Update extra state attributes."""
             payload = attr_tpl(msg.payload)
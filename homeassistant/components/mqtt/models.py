@@ -18,6 +18,7 @@ from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError, TemplateError
 from homeassistant.helpers import template
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, TemplateVarsType
 
@@ -362,32 +363,92 @@ class MqttValueTemplate:
 
 
 class EntityTopicState:
-    """Manage entity state write requests for subscribed topics."""
+    """Manage entity state write requests for subscribed topics.
+
+    The state of an entity is written once after each message which
+    requested it. Writes which are coalesced are held back until the end
+    of the batch of messages the client is processing. An entity which
+    requests several of those in a batch writes its state once with the
+    latest values. The entities discovered in a batch are added at once
+    per platform.
+    """
 
     def __init__(self) -> None:
         """Register topic."""
         self.subscribe_calls: dict[str, Entity] = {}
+        self.coalesced_calls: dict[str, Entity] = {}
+        # The message which is being processed and the last message
+        # which requested a coalesced write for each entity
+        self.message: MQTTMessage | None = None
+        self.messages: dict[str, MQTTMessage] = {}
+        self.batch = False
+        self.add_entities_calls: dict[AddEntitiesCallback, list[Entity]] = {}
 
     @callback
     def process_write_state_requests(self, msg: MQTTMessage) -> None:
         """Process the write state requests."""
         while self.subscribe_calls:
             _, entity = self.subscribe_calls.popitem()
-            try:
-                entity.async_write_ha_state()
-            except Exception:
-                _LOGGER.exception(
-                    "Exception raised when updating state of %s, topic: "
-                    "'%s' with payload: %s",
-                    entity.entity_id,
-                    msg.topic,
-                    msg.payload,
-                )
+            self._async_write_state(entity, msg)
+
+    @callback
+    def process_coalesced_write_state_requests(self) -> None:
+        """Process the write state requests held back until the end of a batch."""
+        while self.coalesced_calls:
+            entity_id, entity = self.coalesced_calls.popitem()
+            self._async_write_state(entity, self.messages.pop(entity_id, None))
+
+    @callback
+    def process_add_entity_requests(self) -> None:
+        """Add the entities discovered in the batch."""
+        while self.add_entities_calls:
+            async_add_entities, entities = self.add_entities_calls.popitem()
+            async_add_entities(entities)
+
+    @callback
+    def add_entity_request(
+        self, async_add_entities: AddEntitiesCallback, entity: Entity
+    ) -> None:
+        """Register a discovered entity to be added to its platform."""
+        if not self.batch:
+            async_add_entities([entity])
+            return
+        self.add_entities_calls.setdefault(async_add_entities, []).append(entity)
 
     @callback
-    def write_state_request(self, entity: Entity) -> None:
-        """Register write state request."""
-        self.subscribe_calls[entity.entity_id] = entity
+    def _async_write_state(self, entity: Entity, msg: MQTTMessage | None) -> None:
+        """Write the state of an entity and log exceptions."""
+        try:
+            entity.async_write_ha_state()
+        except Exception:
+            _LOGGER.exception(
+                "Exception raised when updating state of %s, topic: "
+                "'%s' with payload: %s",
+                entity.entity_id,
+                msg and msg.topic,
+                msg and msg.payload,
+            )
+
+    @callback
+    def write_state_request(self, entity: Entity, coalesce: bool = False) -> None:
+        """Register write state request.
+
+        Updates which do not need to be recorded one by one, like those of
+        the state attributes, can set coalesce to write the state once at
+        the end of a batch of messages. Entities which force updates are
+        never coalesced.
+        """
+        entity_id = entity.entity_id
+        if coalesce and self.batch and not entity.force_update:
+            if entity_id not in self.subscribe_calls:
+                self.coalesced_calls[entity_id] = entity
+                if self.message is not None:
+                    self.messages[entity_id] = self.message
+            return
+        # The write after this message includes the coalesced changes
+        if self.coalesced_calls.pop(entity_id, None) is not None:
+            self.messages.pop(entity_id, None)
+        self.subscribe_calls[entity_id] = entity
 
 
 @dataclass
@@ -403,6 +464,9 @@ class MqttData:
     device_triggers: dict[str, Trigger] = field(default_factory=dict)
     data_config_flow_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     discovery_already_discovered: set[tuple[str, str]] = field(default_factory=set)
+    discovery_payloads: dict[tuple[str, str], ReceivePayloadType] = field(
+        default_factory=dict
+    )
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
@@ -0,0 +1,91 @@
+"""Prefix tree of MQTT topic filters."""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+class _Node(Generic[_T]):
+    """Level of a topic filter in the tree."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _Node[_T]] = {}
+        self.values: list[_T] = []
+
+
+class TopicTrie(Generic[_T]):
+    """Topic filters with their values, stored by level.
+
+    Matching a topic walks the levels of the topic once and only follows
+    the branches for the level itself and the + and # wildcards, so the
+    cost depends on the depth of the topic instead of the number of
+    filters. Matches the MQTT specification like paho's MQTTMatcher: a
+    topic starting with $ is not matched by a wildcard at the first level
+    and a filter ending with # also matches its parent level.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the tree."""
+        self._root: _Node[_T] = _Node()
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _Node()
+            node = child
+        node.values.append(value)
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value of a topic filter.
+
+        Raises ValueError if the value was not added for the filter.
+        """
+        path: list[tuple[_Node[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise ValueError(f"{topic_filter} has no value {value}")
+            path.append((node, level))
+            node = child
+        node.values.remove(value)
+        # Prune the levels which are no longer used
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all filters which match a topic."""
+        matches: list[_T] = []
+        nodes = [self._root]
+        wildcards = not topic.startswith("$")
+        for level in topic.split("/"):
+            next_nodes: list[_Node[_T]] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if wildcards:
+                    if (child := children.get("+")) is not None:
+                        next_nodes.append(child)
+                    if (child := children.get("#")) is not None:
+                        matches.extend(child.values)
+            if not next_nodes:
+                return matches
+            nodes = next_nodes
+            wildcards = True
+        for node in nodes:
+            matches.extend(node.values)
+            if (child := node.children.get("#")) is not None:
+                matches.extend(child.values)
+        return matches
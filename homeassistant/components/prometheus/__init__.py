@@ -61,6 +61,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import MetricsExposition
+
 _MetricBaseT = TypeVar("_MetricBaseT", bound=MetricWrapperBase)
 _LOGGER = logging.getLogger(__name__)
 
@@ -108,8 +110,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -131,6 +131,10 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
+    hass.http.register_view(
+        PrometheusView(conf[CONF_REQUIRES_AUTH], metrics.exposition)
+    )
+
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED,
@@ -177,6 +181,7 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
+        self.exposition = MetricsExposition()
         self._climate_units = climate_units
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
@@ -271,6 +276,7 @@ class PrometheusMetrics:
                     )
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
+                    self.exposition.invalidate(metric)
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -298,18 +304,24 @@ class PrometheusMetrics:
             labels.extend(extra_labels)
 
         try:
-            return cast(_MetricBaseT, self._metrics[metric])
+            existing_metric = self._metrics[metric]
         except KeyError:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
+            # The metrics are exposed through the exposition cache,
+            # the other collectors through the default registry
             self._metrics[metric] = factory(
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=None,
             )
+            self.exposition.add_metric(self._metrics[metric])
             return cast(_MetricBaseT, self._metrics[metric])
+        # The metric is returned to be updated, so it has to be rendered again
+        self.exposition.invalidate(existing_metric)
+        return cast(_MetricBaseT, existing_metric)
 
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
@@ -722,15 +734,20 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, exposition: MetricsExposition) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._exposition = exposition
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=prometheus_client.generate_latest(prometheus_client.REGISTRY),
+        response = web.Response(
+            body=prometheus_client.generate_latest(prometheus_client.REGISTRY)
+            + self._exposition.generate(),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
+            zlib_executor_size=32768,
         )
+        response.enable_compression()
+        return response
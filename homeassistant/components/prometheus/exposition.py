@@ -0,0 +1,50 @@
+"""Cached text exposition of the Home Assistant Prometheus metrics.
+
+prometheus_client renders every series of every metric on each scrape. The
+metrics of this integration can have a series for every entity, but most
+metric families do not change between two scrapes. The exposition keeps
+the output of each metric family and only renders the families which were
+changed since the previous scrape again.
+"""
+
+from __future__ import annotations
+
+from prometheus_client import CollectorRegistry, generate_latest
+from prometheus_client.metrics import MetricWrapperBase
+
+
+class _MetricFamily:
+    """Registry and rendered output of a single metric."""
+
+    __slots__ = ("registry", "output")
+
+    def __init__(self, metric: MetricWrapperBase) -> None:
+        """Initialize the family."""
+        self.registry = CollectorRegistry()
+        self.registry.register(metric)
+        self.output: bytes | None = None
+
+
+class MetricsExposition:
+    """Text exposition of metrics which caches the rendered metric families."""
+
+    def __init__(self) -> None:
+        """Initialize the exposition."""
+        self._families: dict[MetricWrapperBase, _MetricFamily] = {}
+
+    def add_metric(self, metric: MetricWrapperBase) -> None:
+        """Add a metric to the exposition."""
+        self._families[metric] = _MetricFamily(metric)
+
+    def invalidate(self, metric: MetricWrapperBase) -> None:
+        """Render a metric again on the next scrape as it was changed."""
+        self._families[metric].output = None
+
+    def generate(self) -> bytes:
+        """Return the metrics in the Prometheus text format."""
+        output: list[bytes] = []
+        for family in self._families.values():
+            if family.output is None:
+                family.output = generate_latest(family.registry)
+            output.append(family.output)
+        return b"".join(output)
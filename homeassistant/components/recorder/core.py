@@ -218,6 +218,9 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Insert states in bulk instead of flushing them with the ORM,
+        # enabled when the database supports it
+        self._bulk_insert_states = False
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -1166,7 +1169,11 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if self._bulk_insert_states:
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_insert(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1206,6 +1213,7 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        self.states_manager.insert_pending(session)
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1279,6 +1287,10 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        assert self.engine is not None
+        self._bulk_insert_states = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
 
     def _post_schema_migration(self, old_version: int, new_version: int) -> None:
         """Run post schema migration tasks."""
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -11,13 +13,18 @@ from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
 from ..filters import Filters
-from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .const import (
+    DEFAULT_HISTORY_CHUNK_SIZE,
+    NEED_ATTRIBUTE_DOMAINS,
+    SIGNIFICANT_DOMAINS,
+)
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states as _modern_stream_significant_states,
 )
 
 # These are the APIs of this package
@@ -29,6 +36,7 @@ __all__ = [
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states",
 ]
 
 
@@ -152,6 +160,52 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_HISTORY_CHUNK_SIZE,
+) -> Iterator[dict[str, list[State | dict[str, Any]]]]:
+    """Yield significant states during a time period in bounded-size chunks."""
+    if recorder.get_instance(hass).states_meta_manager.active:
+        yield from _modern_stream_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            chunk_size,
+        )
+        return
+    # The legacy schema has no cursor based path, chunk the full result
+    # so callers see the same shape of response.
+    for entity_id, states in get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    ).items():
+        states_iter = iter(states)
+        while batch := list(islice(states_iter, chunk_size)):
+            yield {entity_id: batch}
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -19,3 +19,5 @@ NEED_ATTRIBUTE_DOMAINS = {
     "thermostat",
     "water_heater",
 }
+
+DEFAULT_HISTORY_CHUNK_SIZE = 1024
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import groupby, islice
 from operator import itemgetter
 from typing import Any, cast
 
@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -39,6 +40,7 @@ from ..models import (
 )
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
+    DEFAULT_HISTORY_CHUNK_SIZE,
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
@@ -227,6 +229,109 @@ def get_significant_states_with_session(
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    assert entity_ids is not None
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_HISTORY_CHUNK_SIZE,
+) -> Iterator[dict[str, list[State | dict[str, Any]]]]:
+    """Yield significant states during a period in bounded-size chunks.
+
+    Produces the same states as get_significant_states, but rows are read
+    from the database cursor in batches of chunk_size and each yielded dict
+    holds at most chunk_size states, so the memory used does not grow with
+    the size of the time window. An entity may span multiple chunks; its
+    states are always yielded in order and entities never interleave.
+
+    The generator owns its session and must be exhausted or closed in
+    the thread that started it.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return
+        stmt, entity_id_to_metadata_id, start_time_ts = query
+        rows = session.connection().execute(stmt).yield_per(chunk_size)
+        chunk: dict[str, list[State | dict[str, Any]]] = {}
+        chunk_len = 0
+        for entity_id, states in _sorted_states_to_entity_iter(
+            rows,
+            start_time_ts,
+            entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes,
+        ):
+            while batch := list(islice(states, chunk_size - chunk_len)):
+                chunk[entity_id] = batch
+                chunk_len += len(batch)
+                if chunk_len < chunk_size:
+                    break
+                yield chunk
+                chunk = {}
+                chunk_len = 0
+        if chunk:
+            yield chunk
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Build the significant states statement.
+
+    Returns the statement, the entity_id to metadata_id map and the
+    start time timestamp to use for the start time states, or None
+    if none of the entities have been recorded.
+    """
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
@@ -237,7 +342,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +380,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -692,31 +793,48 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
-    field_map = _FIELD_MAP
-    state_class: Callable[
-        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
-        State | dict[str, Any],
-    ]
-    if compressed_state_format:
-        state_class = row_to_compressed_state
-        attr_time = COMPRESSED_STATE_LAST_UPDATED
-        attr_state = COMPRESSED_STATE_STATE
-    else:
-        state_class = LazyState
-        attr_time = LAST_CHANGED_KEY
-        attr_state = STATE_KEY
-
     # Set all entity IDs to empty lists in result set to maintain the order
     result: dict[str, list[State | dict[str, Any]]] = {
         entity_id: [] for entity_id in entity_ids
     }
-    metadata_id_to_entity_id: dict[int, str] = {}
+    for entity_id, entity_states in _sorted_states_to_entity_iter(
+        states,
+        start_time_ts,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+    ):
+        result[entity_id].extend(entity_states)
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_entity_iter(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> Iterator[tuple[str, Iterator[State | dict[str, Any]]]]:
+    """Convert SQL results into an iterator of states per entity.
+
+    States must be sorted by entity_id and last_updated. The states
+    of each entity are converted lazily, so each entity's iterator
+    must be consumed before advancing to the next entity.
+    """
+    field_map = _FIELD_MAP
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
     }
-    # Get the states at the start time
-    if len(entity_ids) == 1:
-        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
+    if len(entity_id_to_metadata_id) == 1:
+        metadata_id = next(iter(entity_id_to_metadata_id.values()))
         assert metadata_id is not None  # should not be possible if we got here
         states_iter: Iterable[tuple[int, Iterator[Row]]] = (
             (metadata_id, iter(states)),
@@ -725,86 +843,99 @@ def _sorted_states_to_dict(
         key_func = itemgetter(field_map["metadata_id"])
         states_iter = groupby(states, key_func)
 
-    state_idx = field_map["state"]
-    last_updated_ts_idx = field_map["last_updated_ts"]
-
-    # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
-        attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
-        if (
-            not minimal_response
-            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
-        ):
-            ent_results.extend(
-                state_class(
-                    db_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    db_state[state_idx],
-                    db_state[last_updated_ts_idx],
-                    False,
-                )
-                for db_state in group
-            )
-            continue
-
-        prev_state: str | None = None
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
-                )
-            )
+        yield (
+            entity_id,
+            _entity_rows_to_states(
+                group,
+                start_time_ts,
+                entity_id,
+                minimal_response
+                and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS,
+                compressed_state_format,
+                no_attributes,
+            ),
+        )
+
+
+def _entity_rows_to_states(
+    group: Iterator[Row],
+    start_time_ts: float | None,
+    entity_id: str,
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> Iterator[State | dict[str, Any]]:
+    """Convert the SQL rows of a single entity into states."""
+    field_map = _FIELD_MAP
+    state_class: Callable[
+        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
+        State | dict[str, Any],
+    ]
+    if compressed_state_format:
+        state_class = row_to_compressed_state
+        attr_time = COMPRESSED_STATE_LAST_UPDATED
+        attr_state = COMPRESSED_STATE_STATE
+    else:
+        state_class = LazyState
+        attr_time = LAST_CHANGED_KEY
+        attr_state = STATE_KEY
 
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: row[last_updated_ts_idx],
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    attr_cache: dict[str, dict[str, Any]] = {}
+    if not minimal_response:
+        for db_state in group:
+            yield state_class(
+                db_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                db_state[state_idx],
+                db_state[last_updated_ts_idx],
+                False,
             )
-            continue
+        return
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if (first_state := next(group, None)) is None:
+        return
+    prev_state: str = first_state[state_idx]
+    yield state_class(
+        first_state,
+        attr_cache,
+        start_time_ts,
+        entity_id,
+        prev_state,
+        first_state[last_updated_ts_idx],
+        no_attributes,
+    )
 
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            {
-                attr_state: (prev_state := state),
+    #
+    # minimal_response only makes sense with last_updated == last_updated
+    #
+    # We use last_updated for for last_changed since its the same
+    #
+    # With minimal response we do not care about attribute
+    # changes so we can filter out duplicate states
+    if compressed_state_format:
+        # Compressed state format uses the timestamp directly
+        for row in group:
+            if (state := row[state_idx]) != prev_state:
+                prev_state = state
+                yield {attr_state: state, attr_time: row[last_updated_ts_idx]}
+        return
+
+    # Non-compressed state format returns an ISO formatted string
+    _utc_from_timestamp = dt_util.utc_from_timestamp
+    for row in group:
+        if (state := row[state_idx]) != prev_state:
+            prev_state = state
+            yield {
+                attr_state: state,
                 attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
             }
-            for row in group
-            if (state := row[state_idx]) != prev_state
-        )
-
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
@@ -21,20 +21,29 @@ from .queries import (
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
+    delete_events_id_range,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
+    delete_states_id_range,
     delete_states_meta_rows,
     delete_states_rows,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
+    disconnect_states_id_range,
     disconnect_states_rows,
+    find_attributes_ids_in_state_id_range,
+    find_data_ids_in_event_id_range,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
+    find_first_event_id_to_keep,
+    find_first_state_id_to_keep,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_min_event_id,
+    find_min_state_id,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -191,13 +200,18 @@ def _purge_states_and_attributes_ids(
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(states_batch_size):
-        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
+        if state_id_range := _select_state_id_range_to_purge(
             session, purge_before, max_bind_vars
-        )
-        if not state_ids:
-            has_remaining_state_ids_to_purge = False
-            break
-        _purge_state_ids(instance, session, state_ids)
+        ):
+            attributes_ids = _purge_state_id_range(instance, session, *state_id_range)
+        else:
+            state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
+                session, purge_before, max_bind_vars
+            )
+            if not state_ids:
+                has_remaining_state_ids_to_purge = False
+                break
+            _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
@@ -226,13 +240,18 @@ def _purge_events_and_data_ids(
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(events_batch_size):
-        event_ids, data_ids = _select_event_data_ids_to_purge(
+        if event_id_range := _select_event_id_range_to_purge(
             session, purge_before, max_bind_vars
-        )
-        if not event_ids:
-            has_remaining_event_ids_to_purge = False
-            break
-        _purge_event_ids(session, event_ids)
+        ):
+            data_ids = _purge_event_id_range(session, *event_id_range)
+        else:
+            event_ids, data_ids = _select_event_data_ids_to_purge(
+                session, purge_before, max_bind_vars
+            )
+            if not event_ids:
+                has_remaining_event_ids_to_purge = False
+                break
+            _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
@@ -243,6 +262,52 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _select_state_id_range_to_purge(
+    session: Session, purge_before: datetime, max_bind_vars: int
+) -> tuple[int, int] | None:
+    """Return a range of the oldest state ids that can all be purged.
+
+    States are inserted in time order, so the oldest states form a
+    contiguous range of state ids. Purging them by range avoids selecting
+    and sending every state_id to the database.
+
+    Returns None if the range of the next max_bind_vars state ids contains
+    any state that must be kept, in which case the states are purged by
+    id with _select_state_attributes_ids_to_purge instead.
+    """
+    if (start_state_id := session.execute(find_min_state_id()).scalar()) is None:
+        return None
+    end_state_id: int = start_state_id + max_bind_vars
+    if session.execute(
+        find_first_state_id_to_keep(
+            start_state_id, end_state_id, purge_before.timestamp()
+        )
+    ).scalar():
+        return None
+    _LOGGER.debug("Selected state ids %s-%s to remove", start_state_id, end_state_id)
+    return start_state_id, end_state_id
+
+
+def _select_event_id_range_to_purge(
+    session: Session, purge_before: datetime, max_bind_vars: int
+) -> tuple[int, int] | None:
+    """Return a range of the oldest event ids that can all be purged.
+
+    See _select_state_id_range_to_purge.
+    """
+    if (start_event_id := session.execute(find_min_event_id()).scalar()) is None:
+        return None
+    end_event_id: int = start_event_id + max_bind_vars
+    if session.execute(
+        find_first_event_id_to_keep(
+            start_event_id, end_event_id, purge_before.timestamp()
+        )
+    ).scalar():
+        return None
+    _LOGGER.debug("Selected event ids %s-%s to remove", start_event_id, end_event_id)
+    return start_event_id, end_event_id
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -526,6 +591,35 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     instance.states_manager.evict_purged_state_ids(state_ids)
 
 
+def _purge_state_id_range(
+    instance: Recorder, session: Session, start_state_id: int, end_state_id: int
+) -> set[int]:
+    """Disconnect and delete a range of states.
+
+    Returns the attributes_ids used by the deleted states.
+    """
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            find_attributes_ids_in_state_id_range(start_state_id, end_state_id)
+        ).all()
+        if attributes_id
+    }
+
+    # See _purge_state_ids for why the states are disconnected first
+    disconnected_rows = session.execute(
+        disconnect_states_id_range(start_state_id, end_state_id)
+    )
+    _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+
+    deleted_rows = session.execute(delete_states_id_range(start_state_id, end_state_id))
+    _LOGGER.debug("Deleted %s states", deleted_rows)
+
+    # Evict eny entries in the old_states cache referring to a purged state
+    instance.states_manager.evict_purged_state_id_range(start_state_id, end_state_id)
+    return attributes_ids
+
+
 def _purge_batch_attributes_ids(
     instance: Recorder, session: Session, attributes_ids: set[int]
 ) -> None:
@@ -576,6 +670,25 @@ def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
 
+def _purge_event_id_range(
+    session: Session, start_event_id: int, end_event_id: int
+) -> set[int]:
+    """Delete a range of events.
+
+    Returns the data_ids used by the deleted events.
+    """
+    data_ids = {
+        data_id
+        for (data_id,) in session.execute(
+            find_data_ids_in_event_id_range(start_event_id, end_event_id)
+        ).all()
+        if data_id
+    }
+    deleted_rows = session.execute(delete_events_id_range(start_event_id, end_event_id))
+    _LOGGER.debug("Deleted %s events", deleted_rows)
+    return data_ids
+
+
 def _purge_old_recorder_runs(
     instance: Recorder, session: Session, purge_before: datetime
 ) -> None:
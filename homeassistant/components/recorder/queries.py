@@ -5,7 +5,16 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    delete,
+    distinct,
+    func,
+    lambda_stmt,
+    or_,
+    select,
+    union_all,
+    update,
+)
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -636,6 +645,111 @@ def find_states_to_purge(
     )
 
 
+def find_min_state_id() -> StatementLambdaElement:
+    """Find the oldest state_id."""
+    return lambda_stmt(lambda: select(func.min(States.state_id)))
+
+
+def find_first_state_id_to_keep(
+    start_state_id: int, end_state_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Find the first state_id in a range that must not be purged yet."""
+    return lambda_stmt(
+        lambda: select(func.min(States.state_id))
+        .filter(States.state_id >= start_state_id)
+        .filter(States.state_id < end_state_id)
+        # Rows without a timestamp are never selected for purging
+        .filter(
+            or_(
+                States.last_updated_ts >= purge_before,
+                States.last_updated_ts.is_(None),
+            )
+        )
+    )
+
+
+def find_attributes_ids_in_state_id_range(
+    start_state_id: int, end_state_id: int
+) -> StatementLambdaElement:
+    """Find the attributes_ids used by a range of states."""
+    return lambda_stmt(
+        lambda: select(distinct(States.attributes_id))
+        .filter(States.state_id >= start_state_id)
+        .filter(States.state_id < end_state_id)
+    )
+
+
+def disconnect_states_id_range(
+    start_state_id: int, end_state_id: int
+) -> StatementLambdaElement:
+    """Disconnect states rows from a range of old states."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.old_state_id >= start_state_id)
+        .where(States.old_state_id < end_state_id)
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_id_range(
+    start_state_id: int, end_state_id: int
+) -> StatementLambdaElement:
+    """Delete a range of states rows."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.state_id >= start_state_id)
+        .where(States.state_id < end_state_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_min_event_id() -> StatementLambdaElement:
+    """Find the oldest event_id."""
+    return lambda_stmt(lambda: select(func.min(Events.event_id)))
+
+
+def find_first_event_id_to_keep(
+    start_event_id: int, end_event_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Find the first event_id in a range that must not be purged yet."""
+    return lambda_stmt(
+        lambda: select(func.min(Events.event_id))
+        .filter(Events.event_id >= start_event_id)
+        .filter(Events.event_id < end_event_id)
+        # Rows without a timestamp are never selected for purging
+        .filter(
+            or_(
+                Events.time_fired_ts >= purge_before,
+                Events.time_fired_ts.is_(None),
+            )
+        )
+    )
+
+
+def find_data_ids_in_event_id_range(
+    start_event_id: int, end_event_id: int
+) -> StatementLambdaElement:
+    """Find the data_ids used by a range of events."""
+    return lambda_stmt(
+        lambda: select(distinct(Events.data_id))
+        .filter(Events.event_id >= start_event_id)
+        .filter(Events.event_id < end_event_id)
+    )
+
+
+def delete_events_id_range(
+    start_event_id: int, end_event_id: int
+) -> StatementLambdaElement:
+    """Delete a range of events rows."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.event_id >= start_event_id)
+        .where(Events.event_id < end_event_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -2,15 +2,37 @@
 
 from __future__ import annotations
 
+from functools import cache
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
 from ..db_schema import States
 
 
+@cache
+def _bulk_insert_columns(states_cls: type[States]) -> tuple[str, ...]:
+    """Return the columns that are written when states are inserted in bulk.
+
+    state_id is assigned by the database and old_state_id, attributes_id
+    and metadata_id are resolved from the related objects at insert time.
+    """
+    return tuple(
+        column.key
+        for column in states_cls.__table__.columns
+        if column.key
+        not in ("state_id", "old_state_id", "attributes_id", "metadata_id")
+    )
+
+
 class StatesManager:
     """Manage the states table."""
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_inserts: list[States] = []
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
 
@@ -45,6 +67,78 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state to be inserted in bulk by insert_pending.
+
+        States added here are not added to the session.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def insert_pending(self, session: Session) -> None:
+        """Insert the states added with add_pending_insert.
+
+        Instead of letting the ORM flush the states one row at a time,
+        which it does since the old_state relationship references the
+        states table itself, the rows are written with one multi-row
+        INSERT ... RETURNING per generation. The first generation
+        contains the first state of each entity in the commit, the second
+        one the states that follow them, and so on, so the old_state_id
+        of each generation is known when it is inserted.
+
+        The database must support RETURNING with executemany in
+        parameter order.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._pending_inserts:
+            return
+        # Assign ids to pending StateAttributes and StatesMeta
+        session.flush()
+        generation_of: dict[int, int] = {}
+        generations: list[list[States]] = []
+        for state in self._pending_inserts:
+            old_state = state.old_state
+            generation = (
+                generation_of.get(id(old_state), -1) + 1 if old_state is not None else 0
+            )
+            generation_of[id(state)] = generation
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(state)
+
+        # Use the class of the pending states as the schema may be
+        # replaced with an older one when testing migrations
+        states_cls = type(self._pending_inserts[0])
+        columns = _bulk_insert_columns(states_cls)
+        stmt = insert(states_cls).returning(
+            states_cls.state_id, sort_by_parameter_order=True
+        )
+        for generation_states in generations:
+            rows: list[dict[str, Any]] = []
+            for state in generation_states:
+                row = {key: getattr(state, key) for key in columns}
+                if (old_state := state.old_state) is not None:
+                    row["old_state_id"] = old_state.state_id
+                else:
+                    row["old_state_id"] = state.old_state_id
+                if (state_attributes := state.state_attributes) is not None:
+                    row["attributes_id"] = state_attributes.attributes_id
+                else:
+                    row["attributes_id"] = state.attributes_id
+                if (states_meta := state.states_meta_rel) is not None:
+                    row["metadata_id"] = states_meta.metadata_id
+                else:
+                    row["metadata_id"] = state.metadata_id
+                rows.append(row)
+            for state, state_id in zip(
+                generation_states, session.execute(stmt, rows).scalars(), strict=True
+            ):
+                state.state_id = state_id
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -64,6 +158,7 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._pending_inserts.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -74,6 +169,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -93,6 +189,22 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_id_range(
+        self, start_state_id: int, end_state_id: int
+    ) -> None:
+        """Evict a purged range of states from the committed states.
+
+        When we purge states we need to make sure the next call to record a state
+        does not link the old_state_id to the purged state.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id in [
+            entity_id
+            for entity_id, state_id in last_committed_ids.items()
+            if start_state_id <= state_id < end_state_id
+        ]:
+            del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -5,7 +5,6 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 import datetime
-import itertools
 import logging
 import math
 from typing import Any
@@ -92,42 +91,52 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
-def _time_weighted_average(
+def _time_weighted_average_min_max(
     fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
-) -> float:
-    """Calculate a time weighted average.
+) -> tuple[float, float, float]:
+    """Calculate a time weighted average, the minimum and the maximum.
 
     The average is calculated by weighting the states by duration in seconds between
     state changes.
     Note: there's no interpolation of values between state changes.
+
+    All three values are calculated in a single pass over the states using
+    the float timestamps of the states to avoid creating datetime and timedelta
+    objects for every state.
     """
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
     old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    old_start_time_ts: float | None = None
     accumulated = 0.0
+    min_fstate = max_fstate = fstates[0][0]
 
     for fstate, state in fstates:
+        if fstate < min_fstate:
+            min_fstate = fstate
+        elif fstate > max_fstate:
+            max_fstate = fstate
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
+        if (start_time_ts := state.last_updated_timestamp) < start_ts:
+            start_time_ts = start_ts
+        if old_start_time_ts is None:
             # Adjust start time, if there was no last known state
-            start = start_time
+            start_ts = start_time_ts
         else:
-            duration = start_time - old_start_time
             # Accumulate the value, weighted by duration until next state change
             assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
+            accumulated += old_fstate * (start_time_ts - old_start_time_ts)
 
         old_fstate = fstate
-        old_start_time = start_time
+        old_start_time_ts = start_time_ts
 
     if old_fstate is not None:
         # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+        assert old_start_time_ts is not None
+        accumulated += old_fstate * (end_ts - old_start_time_ts)
 
-    period_seconds = (end - start).total_seconds()
+    period_seconds = end_ts - start_ts
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -135,8 +144,8 @@ def _time_weighted_average(
         # we can measure. This probably means the precision of statistics
         # column schema in the database is incorrect but it is actually possible
         # to happen if the state change event fired at the exact microsecond
-        return 0.0
-    return accumulated / period_seconds
+        return 0.0, min_fstate, max_fstate
+    return accumulated / period_seconds, min_fstate, max_fstate
 
 
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
@@ -510,17 +519,16 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
+        if not wanted_statistics[entity_id].isdisjoint(("mean", "min", "max")):
+            mean, min_value, max_value = _time_weighted_average_min_max(
+                valid_float_states, start, end
             )
-
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = mean
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min_value
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max_value
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
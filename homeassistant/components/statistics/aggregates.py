@@ -0,0 +1,442 @@
+"""Incrementally maintained aggregates for the statistics sensor.
+
+The statistics sensor keeps its samples in a window which only ever grows
+at the end and shrinks at the start. The aggregates below are updated on
+every change of that window so a characteristic can be read in O(1) or
+O(log n) instead of being recalculated over the whole buffer.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+from itertools import islice
+import math
+
+
+class _CompensatedSum:
+    """Running sum using Neumaier compensation to limit the rounding drift."""
+
+    __slots__ = ("_sum", "_compensation")
+
+    def __init__(self) -> None:
+        """Initialize the sum."""
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a value to the sum."""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def reset(self) -> None:
+        """Reset the sum to zero."""
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    @property
+    def value(self) -> float:
+        """Return the sum."""
+        return self._sum + self._compensation
+
+
+class WindowAggregate:
+    """An aggregate over the window of samples of a statistics sensor.
+
+    add() is called after a sample was appended to the window and
+    remove() is called right before the oldest sample is removed.
+    """
+
+    __slots__ = ()
+
+    def add(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the aggregate for the newest sample."""
+        raise NotImplementedError
+
+    def remove(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the aggregate for the removal of the oldest sample."""
+        raise NotImplementedError
+
+
+class _SummingAggregate(WindowAggregate):
+    """An aggregate built from running sums.
+
+    A non-finite sample turns a running sum into inf or nan for good, as
+    subtracting it again does not restore the previous value. The number of
+    non-finite samples in the window is counted instead and the sums are
+    rebuilt from the window once the last of them is removed.
+    """
+
+    __slots__ = ("_nonfinite",)
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self._nonfinite = 0
+
+    def add(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the aggregate for the newest sample."""
+        if not math.isfinite(states[-1]):
+            self._nonfinite += 1
+        self._add(states, ages)
+
+    def remove(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the aggregate for the removal of the oldest sample."""
+        if self._nonfinite and not math.isfinite(states[0]):
+            self._nonfinite -= 1
+            if not self._nonfinite:
+                self._rebuild(states, ages)
+                return
+        self._remove(states, ages)
+
+    def _rebuild(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Rebuild the sums from all but the oldest sample."""
+        self._reset()
+        window_states: deque[float] = deque()
+        window_ages: deque[datetime] = deque()
+        for value, age in zip(
+            islice(states, 1, None), islice(ages, 1, None), strict=True
+        ):
+            window_states.append(value)
+            window_ages.append(age)
+            self._add(window_states, window_ages)
+
+    def _add(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the newest sample."""
+        raise NotImplementedError
+
+    def _remove(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the removal of the oldest sample."""
+        raise NotImplementedError
+
+    def _reset(self) -> None:
+        """Reset the sums to an empty window."""
+        raise NotImplementedError
+
+
+class RunningSum(_SummingAggregate):
+    """Sum of the samples in the window."""
+
+    __slots__ = ("_sum",)
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._sum = _CompensatedSum()
+
+    def _add(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the newest sample."""
+        self._sum.add(states[-1])
+
+    def _remove(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the removal of the oldest sample."""
+        if len(states) == 1:
+            self._sum.reset()
+        else:
+            self._sum.add(-states[0])
+
+    def _reset(self) -> None:
+        """Reset the sums to an empty window."""
+        self._sum.reset()
+
+    @property
+    def value(self) -> float:
+        """Return the sum of the samples."""
+        return self._sum.value
+
+
+class RunningVariance(_SummingAggregate):
+    """Mean and sample variance of the window using Welford's algorithm."""
+
+    __slots__ = ("_count", "_mean", "_m2")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _add(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the newest sample."""
+        value = states[-1]
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def _remove(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the removal of the oldest sample."""
+        if self._count <= 1:
+            self._reset()
+            return
+        value = states[0]
+        old_mean = self._mean
+        self._mean -= (value - old_mean) / (self._count - 1)
+        self._m2 -= (value - old_mean) * (value - self._mean)
+        self._count -= 1
+
+    def _reset(self) -> None:
+        """Reset the sums to an empty window."""
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        # Removing samples can leave a tiny negative rounding error behind
+        return max(self._m2, 0.0) / (self._count - 1)
+
+
+class SlidingExtremes(WindowAggregate):
+    """Minimum and maximum of the window using monotonic queues.
+
+    Each queue holds (value, sequence number, age) tuples. When several
+    samples share the extreme value the oldest one is reported, like
+    list.index() would.
+    """
+
+    __slots__ = ("_maxima", "_minima", "_added", "_removed")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self._maxima: deque[tuple[float, int, datetime]] = deque()
+        self._minima: deque[tuple[float, int, datetime]] = deque()
+        self._added = 0
+        self._removed = 0
+
+    def add(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the aggregate for the newest sample."""
+        value = states[-1]
+        entry = (value, self._added, ages[-1])
+        self._added += 1
+        maxima = self._maxima
+        while maxima and maxima[-1][0] < value:
+            maxima.pop()
+        maxima.append(entry)
+        minima = self._minima
+        while minima and minima[-1][0] > value:
+            minima.pop()
+        minima.append(entry)
+
+    def remove(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the aggregate for the removal of the oldest sample."""
+        sequence = self._removed
+        self._removed += 1
+        if self._maxima and self._maxima[0][1] == sequence:
+            self._maxima.popleft()
+        if self._minima and self._minima[0][1] == sequence:
+            self._minima.popleft()
+
+    @property
+    def max_value(self) -> float:
+        """Return the maximum of the samples."""
+        return self._maxima[0][0]
+
+    @property
+    def max_age(self) -> datetime:
+        """Return the age of the oldest sample with the maximum value."""
+        return self._maxima[0][2]
+
+    @property
+    def min_value(self) -> float:
+        """Return the minimum of the samples."""
+        return self._minima[0][0]
+
+    @property
+    def min_age(self) -> datetime:
+        """Return the age of the oldest sample with the minimum value."""
+        return self._minima[0][2]
+
+
+class SortedWindow(WindowAggregate):
+    """Sorted copy of the window for order statistics."""
+
+    __slots__ = ("_sorted", "_nan")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self._sorted: list[float] = []
+        # nan does not compare with anything, so it is counted instead of
+        # being kept in the sorted list where it would break the bisection
+        self._nan = 0
+
+    def add(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the aggregate for the newest sample."""
+        value = states[-1]
+        if math.isnan(value):
+            self._nan += 1
+        else:
+            insort(self._sorted, value)
+
+    def remove(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the aggregate for the removal of the oldest sample."""
+        value = states[0]
+        if math.isnan(value):
+            self._nan -= 1
+        else:
+            del self._sorted[bisect_left(self._sorted, value)]
+
+    @property
+    def median(self) -> float:
+        """Return the median, matches statistics.median."""
+        if self._nan:
+            return math.nan
+        data = self._sorted
+        count = len(data)
+        if count % 2 == 1:
+            return data[count // 2]
+        i = count // 2
+        return (data[i - 1] + data[i]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile, requires at least two samples.
+
+        Matches statistics.quantiles(n=100, method="exclusive") but only
+        interpolates the requested cut point.
+        """
+        if self._nan:
+            return math.nan
+        data = self._sorted
+        count = len(data)
+        m = count + 1
+        j = percentile * m // 100
+        j = 1 if j < 1 else count - 1 if j > count - 1 else j
+        delta = percentile * m - j * 100
+        return (data[j - 1] * (100 - delta) + data[j] * delta) / 100
+
+
+class RunningDifferences(_SummingAggregate):
+    """Sums of the differences between consecutive samples."""
+
+    __slots__ = ("_absolute", "_nonnegative")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._absolute = _CompensatedSum()
+        self._nonnegative = _CompensatedSum()
+
+    def _add(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the newest sample."""
+        if len(states) < 2:
+            return
+        previous = states[-2]
+        value = states[-1]
+        self._absolute.add(abs(value - previous))
+        self._nonnegative.add(value - previous if value >= previous else value)
+
+    def _remove(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the removal of the oldest sample."""
+        if len(states) <= 2:
+            self._reset()
+            return
+        oldest = states[0]
+        value = states[1]
+        self._absolute.add(-abs(value - oldest))
+        self._nonnegative.add(-(value - oldest if value >= oldest else value))
+
+    def _reset(self) -> None:
+        """Reset the sums to an empty window."""
+        self._absolute.reset()
+        self._nonnegative.reset()
+
+    @property
+    def absolute(self) -> float:
+        """Return the sum of the absolute differences."""
+        return self._absolute.value
+
+    @property
+    def nonnegative(self) -> float:
+        """Return the sum of the differences, counting a drop as a reset to 0."""
+        return self._nonnegative.value
+
+
+class RunningCircularSum(_SummingAggregate):
+    """Sums of the sine and cosine of the samples, given in degrees."""
+
+    __slots__ = ("_sin", "_cos")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._sin = _CompensatedSum()
+        self._cos = _CompensatedSum()
+
+    def _add(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the newest sample."""
+        radians = math.radians(states[-1])
+        self._sin.add(math.sin(radians))
+        self._cos.add(math.cos(radians))
+
+    def _remove(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the removal of the oldest sample."""
+        if len(states) == 1:
+            self._reset()
+            return
+        radians = math.radians(states[0])
+        self._sin.add(-math.sin(radians))
+        self._cos.add(-math.cos(radians))
+
+    def _reset(self) -> None:
+        """Reset the sums to an empty window."""
+        self._sin.reset()
+        self._cos.reset()
+
+    @property
+    def mean(self) -> float:
+        """Return the circular mean in degrees."""
+        return (math.degrees(math.atan2(self._sin.value, self._cos.value)) + 360) % 360
+
+
+class RunningArea(_SummingAggregate):
+    """Area under the samples over time.
+
+    With linear set the samples are interpolated linearly, otherwise each
+    sample is held until the next one arrives.
+    """
+
+    __slots__ = ("_area", "_linear")
+
+    def __init__(self, linear: bool) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._area = _CompensatedSum()
+        self._linear = linear
+
+    def _segment(self, first: float, second: float, seconds: float) -> float:
+        """Return the area of a segment between two samples."""
+        if self._linear:
+            return 0.5 * (first + second) * seconds
+        return first * seconds
+
+    def _add(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the newest sample."""
+        if len(states) < 2:
+            return
+        self._area.add(
+            self._segment(states[-2], states[-1], (ages[-1] - ages[-2]).total_seconds())
+        )
+
+    def _remove(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Update the sums for the removal of the oldest sample."""
+        if len(states) <= 2:
+            self._reset()
+            return
+        self._area.add(
+            -self._segment(states[0], states[1], (ages[1] - ages[0]).total_seconds())
+        )
+
+    def _reset(self) -> None:
+        """Reset the sums to an empty window."""
+        self._area.reset()
+
+    @property
+    def area(self) -> float:
+        """Return the area in value seconds."""
+        return self._area.value
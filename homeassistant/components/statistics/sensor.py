@@ -8,7 +8,6 @@ import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -54,6 +53,16 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .aggregates import (
+    RunningArea,
+    RunningCircularSum,
+    RunningDifferences,
+    RunningSum,
+    RunningVariance,
+    SlidingExtremes,
+    SortedWindow,
+    WindowAggregate,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -180,6 +189,40 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Incrementally maintained aggregates backing the numeric statistics
+STATS_NUMERIC_AGGREGATES: dict[str, Callable[[], WindowAggregate]] = {
+    STAT_AVERAGE_LINEAR: lambda: RunningArea(linear=True),
+    STAT_AVERAGE_STEP: lambda: RunningArea(linear=False),
+    STAT_AVERAGE_TIMELESS: RunningSum,
+    STAT_DATETIME_VALUE_MAX: SlidingExtremes,
+    STAT_DATETIME_VALUE_MIN: SlidingExtremes,
+    STAT_DISTANCE_95P: RunningVariance,
+    STAT_DISTANCE_99P: RunningVariance,
+    STAT_DISTANCE_ABSOLUTE: SlidingExtremes,
+    STAT_MEAN: RunningSum,
+    STAT_MEAN_CIRCULAR: RunningCircularSum,
+    STAT_MEDIAN: SortedWindow,
+    STAT_NOISINESS: RunningDifferences,
+    STAT_PERCENTILE: SortedWindow,
+    STAT_STANDARD_DEVIATION: RunningVariance,
+    STAT_SUM: RunningSum,
+    STAT_SUM_DIFFERENCES: RunningDifferences,
+    STAT_SUM_DIFFERENCES_NONNEGATIVE: RunningDifferences,
+    STAT_TOTAL: RunningSum,
+    STAT_VALUE_MAX: SlidingExtremes,
+    STAT_VALUE_MIN: SlidingExtremes,
+    STAT_VARIANCE: RunningVariance,
+}
+
+# Incrementally maintained aggregates backing the binary statistics
+STATS_BINARY_AGGREGATES: dict[str, Callable[[], WindowAggregate]] = {
+    STAT_AVERAGE_STEP: lambda: RunningArea(linear=False),
+    STAT_AVERAGE_TIMELESS: RunningSum,
+    STAT_COUNT_BINARY_ON: RunningSum,
+    STAT_COUNT_BINARY_OFF: RunningSum,
+    STAT_MEAN: RunningSum,
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -321,6 +364,13 @@ class StatisticsSensor(SensorEntity):
         self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
         self.attributes: dict[str, StateType] = {}
 
+        aggregate_factory = (
+            STATS_BINARY_AGGREGATES if self.is_binary else STATS_NUMERIC_AGGREGATES
+        ).get(self._state_characteristic)
+        self._aggregate: WindowAggregate | None = (
+            aggregate_factory() if aggregate_factory else None
+        )
+
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
             self._callable_characteristic_fn(self._state_characteristic)
         )
@@ -372,10 +422,10 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value: float | bool = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
+            self._append_sample(value, new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -388,6 +438,22 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _append_sample(self, value: float | bool, age: datetime) -> None:
+        """Append a sample, dropping the oldest one if the buffer is full."""
+        if len(self.states) == self._samples_max_buffer_size:
+            self._remove_oldest_sample()
+        self.states.append(value)
+        self.ages.append(age)
+        if self._aggregate is not None:
+            self._aggregate.add(self.states, self.ages)
+
+    def _remove_oldest_sample(self) -> None:
+        """Remove the oldest sample."""
+        if self._aggregate is not None:
+            self._aggregate.remove(self.states, self.ages)
+        self.ages.popleft()
+        self.states.popleft()
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -499,8 +565,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest_sample()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -654,25 +719,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            area = cast(RunningArea, self._aggregate).area
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            area = cast(RunningArea, self._aggregate).area
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
@@ -712,12 +766,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return cast(SlidingExtremes, self._aggregate).max_age
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return cast(SlidingExtremes, self._aggregate).min_age
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -732,24 +786,23 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            extremes = cast(SlidingExtremes, self._aggregate)
+            return extremes.max_value - extremes.min_value
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return cast(RunningSum, self._aggregate).value / len(self.states)
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
-            return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
+            return cast(RunningCircularSum, self._aggregate).mean
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return cast(SortedWindow, self._aggregate).median
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -759,34 +812,27 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return cast(SortedWindow, self._aggregate).percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(cast(RunningVariance, self._aggregate).variance)
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return cast(RunningSum, self._aggregate).value
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return cast(RunningDifferences, self._aggregate).absolute
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return cast(RunningDifferences, self._aggregate).nonnegative
         return None
 
     def _stat_total(self) -> StateType:
@@ -794,27 +840,24 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return cast(SlidingExtremes, self._aggregate).max_value
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return cast(SlidingExtremes, self._aggregate).min_value
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return cast(RunningVariance, self._aggregate).variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
+            on_seconds = cast(RunningArea, self._aggregate).area
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return 100 / age_range_seconds * on_seconds
         return None
@@ -826,10 +869,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return round(cast(RunningSum, self._aggregate).value)
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - round(cast(RunningSum, self._aggregate).value)
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -839,5 +882,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * cast(RunningSum, self._aggregate).value
         return None
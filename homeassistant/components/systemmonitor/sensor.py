@@ -757,6 +757,8 @@ class SystemMonitorSensor(CoordinatorEntity[SystemMonitorCoordinator], SensorEnt
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Most resources are unchanged between two refreshes
+    _cache_calculated_state = True
     entity_description: SysMonitorSensorEntityDescription
     argument: str
 
@@ -32,6 +32,7 @@ AUTH_MESSAGE_SCHEMA: Final = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        vol.Optional("supported_features"): {str: int},
     }
 )
 
@@ -57,11 +58,13 @@ class AuthPhase:
         cancel_ws: CALLBACK_TYPE,
         request: Request,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        pending_messages: Callable[[], int],
     ) -> None:
         """Initialize the authenticated connection."""
         self._hass = hass
         # send_message will send a message to the client via the queue.
         self._send_message = send_message
+        self._pending_messages = pending_messages
         self._cancel_ws = cancel_ws
         self._logger = logger
         self._request = request
@@ -89,7 +92,10 @@ class AuthPhase:
                 self._send_message,
                 refresh_token.user,
                 refresh_token,
+                self._pending_messages,
             )
+            if (features := valid_msg.get("supported_features")) is not None:
+                conn.set_supported_features(features)
             conn.subscriptions["auth"] = (
                 self._hass.auth.async_register_revoke_token_callback(
                     refresh_token.id, self._cancel_ws
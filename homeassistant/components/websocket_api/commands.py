@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -39,6 +40,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_call_later,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -55,7 +57,11 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.setup import (
+    async_get_loaded_integrations,
+    async_get_setup_report,
+    async_get_setup_timings,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -82,6 +88,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_report)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -363,6 +370,24 @@ def _send_handle_get_states_response(
     )
 
 
+@callback
+def _entity_change_allowed(
+    entity_ids: set[str], user: User, event: Event[EventStateChangedData]
+) -> bool:
+    """Return if a state changed event should be forwarded to the user."""
+    entity_id = event.data["entity_id"]
+    if entity_ids and entity_id not in entity_ids:
+        return False
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    permissions = user.permissions
+    return (
+        user.is_admin
+        or permissions.access_all_entities(POLICY_READ)
+        or permissions.check_entity(entity_id, POLICY_READ)
+    )
+
+
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any] | Callable[[], str]], None],
@@ -372,26 +397,99 @@ def _forward_entity_changes(
     event: Event[EventStateChangedData],
 ) -> None:
     """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
+    if not _entity_change_allowed(entity_ids, user, event):
         return
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
+class _CoalescingEntityChangesForwarder:
+    """Forward entity state changes, merging them while the client is behind.
+
+    While more than COALESCE_ENTITIES_PENDING_MSG messages are waiting to
+    be written to the client, state changes are held back and only the
+    latest change per entity is kept. Once the client has caught up, the
+    held back changes are sent as a single message.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_connection",
+        "_entity_ids",
+        "_msg_id",
+        "_message_id_as_bytes",
+        "_pending",
+        "_flush_unsub",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: ActiveConnection,
+        entity_ids: set[str],
+        msg_id: int,
+    ) -> None:
+        """Initialize the forwarder."""
+        self._hass = hass
+        self._connection = connection
+        self._entity_ids = entity_ids
+        self._msg_id = msg_id
+        self._message_id_as_bytes = str(msg_id).encode()
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._flush_unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward or hold back a state changed event."""
+        connection = self._connection
+        if not _entity_change_allowed(self._entity_ids, connection.user, event):
+            return
+        if (
+            not self._pending
+            and connection.pending_messages() <= const.COALESCE_ENTITIES_PENDING_MSG
+        ):
+            connection.send_message(
+                messages.cached_state_diff_message(self._message_id_as_bytes, event)
+            )
+            return
+        data = event.data
+        entity_id = data["entity_id"]
+        if (pending := self._pending.get(entity_id)) is None:
+            self._pending[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            self._pending[entity_id] = (pending[0], data["new_state"])
+        if self._flush_unsub is None:
+            self._flush_unsub = async_call_later(
+                self._hass, const.COALESCE_ENTITIES_INTERVAL, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: Any) -> None:
+        """Send the held back changes once the client has caught up."""
+        if self._connection.pending_messages() > const.COALESCE_ENTITIES_PENDING_MSG:
+            self._flush_unsub = async_call_later(
+                self._hass, const.COALESCE_ENTITIES_INTERVAL, self._async_flush
+            )
+            return
+        self._flush_unsub = None
+        pending, self._pending = self._pending, {}
+        if message := messages.coalesced_state_diff_message(self._msg_id, pending):
+            self._connection.send_message(message)
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop sending held back changes."""
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+        self._pending.clear()
+
+
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce", default=False): bool,
     }
 )
 def handle_subscribe_entities(
@@ -403,17 +501,31 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            message_id_as_bytes,
-        ),
-    )
+    if msg["coalesce"]:
+        forwarder = _CoalescingEntityChangesForwarder(
+            hass, connection, entity_ids, msg["id"]
+        )
+        unsub_state_changed = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, forwarder.async_forward
+        )
+
+        @callback
+        def _unsub_coalescing() -> None:
+            unsub_state_changed()
+            forwarder.async_unsubscribe()
+
+        connection.subscriptions[msg["id"]] = _unsub_coalescing
+    else:
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                _forward_entity_changes,
+                connection.send_message,
+                entity_ids,
+                connection.user,
+                str(msg["id"]).encode(),
+            ),
+        )
     connection.send_result(msg["id"])
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -550,6 +662,15 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_report"})
+def handle_integration_setup_report(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration setup report command."""
+    connection.send_result(msg["id"], async_get_setup_report(hass))
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -37,11 +37,13 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "pending_messages",
         "user",
         "refresh_token_id",
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "can_compress",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -54,16 +56,20 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        pending_messages: Callable[[], int] = lambda: 0,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Number of messages queued for the client but not yet written
+        self.pending_messages = pending_messages
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.can_compress = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
@@ -79,6 +85,7 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.can_compress = const.FEATURE_COMPRESSED_MESSAGES in features
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -26,6 +26,13 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Number of pending messages above which subscribe_entities subscriptions
+# in coalesce mode hold back state changes and only keep the latest change
+# per entity. It is below PENDING_MSG_PEAK so a client that falls behind
+# gets fewer updates instead of being disconnected.
+COALESCE_ENTITIES_PENDING_MSG: Final = 256
+# Seconds between checks if a client has caught up with pending messages
+COALESCE_ENTITIES_INTERVAL: Final = 1
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -51,3 +58,11 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_COMPRESSED_MESSAGES = "compressed_messages"
+
+# Messages of at least this size are sent as zlib compressed binary frames
+# to clients that support compressed messages and did not negotiate
+# permessage-deflate, such as the initial get_states or subscribe_entities
+# snapshot.
+COMPRESS_MESSAGE_MIN_SIZE: Final = 64 * 1024
+COMPRESS_MESSAGE_LEVEL: Final = 1
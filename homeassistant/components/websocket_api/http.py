@@ -9,6 +9,7 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 
@@ -22,6 +23,8 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESS_MESSAGE_LEVEL,
+    COMPRESS_MESSAGE_MIN_SIZE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
@@ -119,7 +122,9 @@ class WebSocketHandler:
         return "finished connection"
 
     async def _writer(
-        self, send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]]
+        self,
+        send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -152,7 +157,12 @@ class WebSocketHandler:
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
+                    if len(message) < COMPRESS_MESSAGE_MIN_SIZE:
+                        await send_bytes_text(message)
+                    else:
+                        await self._send_large(
+                            send_bytes_text, send_bytes_binary, message
+                        )
                     continue
 
                 messages: list[bytes] = [message]
@@ -166,7 +176,12 @@ class WebSocketHandler:
                 coalesced_messages = b"".join((b"[", b",".join(messages), b"]"))
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                if len(coalesced_messages) < COMPRESS_MESSAGE_MIN_SIZE:
+                    await send_bytes_text(coalesced_messages)
+                else:
+                    await self._send_large(
+                        send_bytes_text, send_bytes_binary, coalesced_messages
+                    )
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -177,6 +192,30 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    async def _send_large(
+        self,
+        send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
+        message: bytes,
+    ) -> None:
+        """Send a large message, compressed if the client asked for it.
+
+        When permessage-deflate was negotiated the transport already
+        compresses every frame, so the message is sent as is.
+        """
+        if (
+            not (connection := self._connection)
+            or not connection.can_compress
+            or self._wsock.compress
+        ):
+            await send_bytes_text(message)
+            return
+        await send_bytes_binary(
+            await self._hass.async_add_executor_job(
+                zlib.compress, message, COMPRESS_MESSAGE_LEVEL
+            )
+        )
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -235,6 +274,11 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _pending_messages(self) -> int:
+        """Return the number of messages waiting to be written."""
+        return len(self._message_queue)
+
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
@@ -300,8 +344,15 @@ class WebSocketHandler:
             assert writer is not None
 
         send_bytes_text = partial(writer.send, binary=False)
+        send_bytes_binary = partial(writer.send, binary=True)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._pending_messages,
         )
         connection = None
         disconnect_warn = None
@@ -338,7 +389,9 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
-            self._writer_task = create_eager_task(self._writer(send_bytes_text))
+            self._writer_task = create_eager_task(
+                self._writer(send_bytes_text, send_bytes_binary)
+            )
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
 
@@ -199,6 +199,39 @@ def _state_diff_event(event: Event[EventStateChangedData]) -> dict:
     return _state_diff(event_old_state, event_new_state)
 
 
+def coalesced_state_diff_message(
+    iden: int, changes: dict[str, tuple[State | None, State | None]]
+) -> bytes | None:
+    """Return an event message that merges state changes of many entities.
+
+    Each change holds the state before the first and the state after
+    the last state_changed event that was coalesced for the entity.
+    Returns None when the changes cancel out, for example an entity
+    which was added and removed again.
+    """
+    added: dict[str, dict[str, Any]] = {}
+    changed: dict[str, Any] = {}
+    removed: list[str] = []
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            added[entity_id] = new_state.as_compressed_state
+        else:
+            changed.update(_state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE])
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    if not event:
+        return None
+    return message_to_json_bytes(event_message(iden, event))
+
+
 def _state_diff(
     old_state: State, new_state: State
 ) -> dict[str, dict[str, dict[str, dict[str, str | list[str]]]]]:
@@ -12,13 +12,14 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 import datetime
 import enum
@@ -26,6 +27,7 @@ import functools
 from functools import cached_property
 import inspect
 import logging
+import operator
 import os
 import pathlib
 import re
@@ -1408,6 +1410,39 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+@dataclass(slots=True)
+class _KeyedListeners(Generic[_DataT]):
+    """Index of listeners for one event type by a value from the event data.
+
+    A single filterable job is registered on the bus for each index. Its
+    filter is one dict lookup no matter how many listeners are in the index.
+    """
+
+    hass: HomeAssistant
+    key_value: Callable[[_DataT], Any]
+    jobs: defaultdict[Any, list[HassJob[[Event[_DataT]], Any]]]
+    remove: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_filter(self, event_data: _DataT) -> bool:
+        """Return if there are listeners for the key of the event."""
+        return self.key_value(event_data) in self.jobs
+
+    @callback
+    def __call__(self, event: Event[_DataT]) -> None:
+        """Dispatch the event to the listeners for its key."""
+        key_value = self.key_value(event.data)
+        if not (jobs := self.jobs.get(key_value)):
+            return
+        for job in jobs.copy():
+            try:
+                self.hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s", key_value, job
+                )
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
@@ -1422,13 +1457,23 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[EventType[Any] | str, list[_FilterableJobType[Any]]] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._keyed_listeners: dict[
+            tuple[EventType[Any] | str, str | Callable[[Any], Any]],
+            _KeyedListeners[Any],
+        ] = {}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1624,6 +1669,101 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str | Callable[[_DataT], Any],
+        values: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        job_type: HassJobType | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with specific event data values.
+
+        The listener is called when the value of ``key`` in the event data,
+        for example ``entity_id`` or ``device_id``, is one of ``values``.
+
+        This is equivalent to calling async_listen with an event_filter
+        that checks ``event_data.get(key) in values``, but all listeners
+        for the same event type and key share a single index. The matching
+        listeners are found with one dict lookup instead of calling a filter
+        for every listener, which matters for event types with thousands of
+        listeners such as state_changed.
+
+        ``key`` may also be a callable which returns the value to match from
+        the event data. Listeners only share an index if they pass the same
+        callable.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(
+                f"Keyed listeners are not supported for event {MATCH_ALL}"
+            )
+        if isinstance(values, str):
+            values = (values,)
+        else:
+            values = tuple(values)
+
+        index_key = (event_type, key)
+        keyed_listeners: _KeyedListeners[_DataT] | None
+        if (keyed_listeners := self._keyed_listeners.get(index_key)) is None:
+            keyed_listeners = _KeyedListeners(
+                self._hass,
+                operator.methodcaller("get", key) if isinstance(key, str) else key,
+                defaultdict(list),
+            )
+            self._keyed_listeners[index_key] = keyed_listeners
+            keyed_listeners.remove = self._async_listen_filterable_job(
+                event_type,
+                (
+                    HassJob(
+                        keyed_listeners,
+                        f"keyed listen {event_type} {key}",
+                        job_type=HassJobType.Callback,
+                    ),
+                    keyed_listeners.async_filter,
+                ),
+            )
+
+        job = HassJob(
+            listener, f"keyed listen {event_type} {key} {values}", job_type=job_type
+        )
+        for value in values:
+            keyed_listeners.jobs[value].append(job)
+
+        return functools.partial(
+            self._async_remove_keyed_listener, index_key, values, job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        index_key: tuple[EventType[_DataT] | str, str | Callable[[_DataT], Any]],
+        values: tuple[str, ...],
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> None:
+        """Remove a keyed listener.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[index_key]
+            jobs = keyed_listeners.jobs
+            for value in values:
+                jobs[value].remove(job)
+                if not jobs[value]:
+                    del jobs[value]
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown keyed listener %s", job)
+            return
+
+        if not jobs:
+            del self._keyed_listeners[index_key]
+            if TYPE_CHECKING:
+                assert keyed_listeners.remove is not None
+            keyed_listeners.remove()
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -2011,10 +2151,17 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+# Arguments entity_id, new_state, attributes, force_update, context and
+# state_info of StateMachine.async_set
+type _StateWrite = tuple[
+    str, str, Mapping[str, Any] | None, bool, Context | None, StateInfo | None
+]
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop", "_batch")
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2025,6 +2172,8 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # States collected by async_batch_writes
+        self._batch: list[_StateWrite] | None = None
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2129,6 +2278,10 @@ class StateMachine:
 
         This method must be run in the event loop.
         """
+        if self._batch:
+            # Set the collected states first, they could include this entity
+            batch, self._batch = self._batch, []
+            self.async_set_many(batch)
         entity_id = entity_id.lower()
         old_state = self._states.pop(entity_id, None)
         self._reservations.discard(entity_id)
@@ -2218,9 +2371,117 @@ class StateMachine:
         If you just update the attributes and not the state, last changed will
         not be affected.
 
+        Inside async_batch_writes the state is collected and set when the
+        batch exits, with the timestamp of the batch. The timestamp argument
+        is ignored there.
+
         This method must be run in the event loop.
         """
         new_state = str(new_state)
+        if self._batch is not None:
+            # Raise for an invalid state now, the caller can handle it
+            validate_state(new_state)
+            self._batch.append(
+                (entity_id, new_state, attributes, force_update, context, state_info)
+            )
+            return
+        # It is much faster to convert a timestamp to a utc datetime object
+        # than converting a utc datetime object to a timestamp since cpython
+        # does not have a fast path for handling the UTC timezone and has to do
+        # multiple local timezone conversions.
+        #
+        # from_timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
+        #
+        # timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+        if timestamp is None:
+            timestamp = time.time()
+        self._async_set(
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+            timestamp,
+            dt_util.utc_from_timestamp(timestamp),
+        )
+
+    @callback
+    def async_set_many(
+        self, states: Iterable[_StateWrite], timestamp: float | None = None
+    ) -> None:
+        """Set the states of several entities at once.
+
+        Each item is a tuple of the arguments entity_id, new_state, attributes,
+        force_update, context and state_info of async_set. All states are set
+        with the same timestamp and their events are fired together.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+        ) in states:
+            self._async_set(
+                entity_id,
+                str(new_state),
+                attributes,
+                force_update,
+                context,
+                state_info,
+                timestamp,
+                now,
+            )
+
+    @contextmanager
+    def async_batch_writes(self) -> Generator[None]:
+        """Collect the states set in the block and set them when it exits.
+
+        Used when many entities write their state together, for example when
+        a coordinator updates its listeners. The collected states are set with
+        async_set_many, all with the time the block exits. A timestamp passed
+        to async_set in the block is ignored. Until then, reading the state
+        machine returns the previous states of the entities.
+
+        This method must be run in the event loop.
+        """
+        if self._batch is not None:
+            # Already collecting the states
+            yield
+            return
+        self._batch = []
+        try:
+            yield
+        finally:
+            batch, self._batch = self._batch, None
+            self.async_set_many(batch)
+
+    @callback
+    def _async_set(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        state_info: StateInfo | None,
+        timestamp: float,
+        now: datetime.datetime,
+    ) -> None:
+        """Set the state of an entity, add entity if it does not exist.
+
+        The state is set at timestamp, now is the same time as a datetime.
+        """
         attributes = attributes or {}
         old_state = self._states_data.get(entity_id)
         if old_state is None:
@@ -2238,21 +2499,6 @@ class StateMachine:
             same_attr = old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        if timestamp is None:
-            timestamp = time.time()
-        now = dt_util.utc_from_timestamp(timestamp)
-
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
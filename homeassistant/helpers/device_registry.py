@@ -401,9 +401,11 @@ def format_mac(mac: str) -> str:
     return mac
 
 
-class DeviceRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
+class DeviceRegistryStore(storage.JournaledStore[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
+    journal_collections = ("devices", "deleted_devices")
+
     async def _async_migrate_func(
         self,
         old_major_version: int,
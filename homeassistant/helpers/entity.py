@@ -265,6 +265,10 @@ class CalculatedState:
     shadowed_attributes: Mapping[str, Any]
 
 
+# Instance attribute holding the state cached by Entity._async_write_ha_state
+_CALCULATED_STATE_ATTR = "_Entity__calculated_state"
+
+
 class CachedProperties(type):
     """Metaclass which invalidates cached entity properties on write to _attr_.
 
@@ -278,6 +282,8 @@ class CachedProperties(type):
       data, which will be stored in an attribute prefixed with __attr_
     - The _attr_-property setter will invalidate the @cached_property by calling
       delattr on it
+    - The _attr_-property setter and deleter also invalidate the state cached by
+      entities which set _cache_calculated_state
     """
 
     def __new__(
@@ -322,6 +328,7 @@ class CachedProperties(type):
                 """
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                o.__dict__.pop(_CALCULATED_STATE_ATTR, None)
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
 
@@ -342,6 +349,7 @@ class CachedProperties(type):
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                o.__dict__.pop(_CALCULATED_STATE_ATTR, None)
 
             return _setter
 
@@ -500,6 +508,11 @@ class Entity(
     # Additional integration specific attributes to exclude from recording, set by
     # platforms, e.g. a derived class in hue.light
     _unrecorded_attributes: frozenset[str] = frozenset()
+    # Set by entities which only derive their state and attributes from _attr_
+    # properties and assign new objects instead of mutating them. The calculated
+    # state is reused when writing the state until an _attr_ property, the
+    # registry entry, the device entry or the availability changes.
+    _cache_calculated_state: bool = False
     # Union of _entity_component_unrecorded_attributes and _unrecorded_attributes,
     # set automatically by __init_subclass__
     __combined_unrecorded_attributes: frozenset[str] = (
@@ -516,6 +529,17 @@ class Entity(
 
     __capabilities_updated_at: deque[float]
     __capabilities_updated_at_reported: bool = False
+    # The registry entry, device entry, availability and the state calculated
+    # from them, only set when _cache_calculated_state is True
+    __calculated_state: (
+        tuple[
+            er.RegistryEntry | None,
+            dr.DeviceEntry | None,
+            bool,
+            tuple[str, dict[str, Any], Mapping[str, Any] | None, Mapping[str, Any]],
+        ]
+        | None
+    ) = None
     __remove_future: asyncio.Future[None] | None = None
 
     # Entity Properties
@@ -1123,10 +1147,20 @@ class Entity(
             return
 
         state_calculate_start = timer()
-        state, attr, capabilities, shadowed_attr = self.__async_calculate_state()
+        if (
+            (calculated := self.__calculated_state) is not None
+            and calculated[0] is entry
+            and calculated[1] is self.device_entry
+            and calculated[2] == self.available
+        ):
+            recalculated = False
+            state, attr, capabilities, shadowed_attr = calculated[3]
+        else:
+            recalculated = True
+            state, attr, capabilities, shadowed_attr = self.__async_calculate_state()
         time_now = timer()
 
-        if entry:
+        if entry and recalculated:
             # Make sure capabilities in the entity registry are up to date. Capabilities
             # include capability attributes, device class and supported features
             original_device_class: str | None = shadowed_attr[ATTR_DEVICE_CLASS]
@@ -1181,11 +1215,19 @@ class Entity(
                 report_issue,
             )
 
+        if recalculated and self._cache_calculated_state:
+            self.__calculated_state = (
+                self.registry_entry,
+                self.device_entry,
+                self.available,
+                (state, attr, capabilities, shadowed_attr),
+            )
+
         # Overwrite properties that have been set in the config file.
         if (customize := hass.data.get(DATA_CUSTOMIZE)) and (
             custom := customize.get(entity_id)
         ):
-            attr.update(custom)
+            attr = attr | custom
 
         if (
             self._context_set is not None
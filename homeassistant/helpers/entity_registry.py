@@ -417,9 +417,11 @@ class DeletedRegistryEntry:
         )
 
 
-class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
+class EntityRegistryStore(storage.JournaledStore[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
+    journal_collections = ("entities", "deleted_entities")
+
     async def _async_migrate_func(  # noqa: C901
         self,
         old_major_version: int,
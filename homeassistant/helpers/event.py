@@ -54,11 +54,6 @@ from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER: HassKey[Callable[[], None]] = HassKey(
-    "track_state_change_listener"
-)
-
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER: HassKey[Callable[[], None]] = HassKey(
     "track_state_added_domain_listener"
@@ -69,16 +64,6 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER: HassKey[Callable[[], None]] = HassKey(
     "track_state_removed_domain_listener"
 )
 
-TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
-TRACK_ENTITY_REGISTRY_UPDATED_LISTENER: HassKey[Callable[[], None]] = HassKey(
-    "track_entity_registry_updated_listener"
-)
-
-TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
-TRACK_DEVICE_REGISTRY_UPDATED_LISTENER: HassKey[Callable[[], None]] = HassKey(
-    "track_device_registry_updated_listener"
-)
-
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -323,45 +308,6 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action, job_type)
 
 
-@callback
-def _async_dispatch_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event: Event[EventStateChangedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_change_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
-
-_KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    listeners_key=TRACK_STATE_CHANGE_LISTENER,
-    callbacks_key=TRACK_STATE_CHANGE_CALLBACKS,
-    event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_change_filter,
-)
-
-
 @bind_hass
 def _async_track_state_change_event(
     hass: HomeAssistant,
@@ -370,8 +316,10 @@ def _async_track_state_change_event(
     job_type: HassJobType | None,
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
-        _KEYED_TRACK_STATE_CHANGE, hass, entity_ids, action, job_type
+    if not entity_ids:
+        return _remove_empty_listener
+    return hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, "entity_id", entity_ids, action, job_type=job_type
     )
 
 
@@ -449,47 +397,9 @@ def _async_track_event(
     return partial(_remove_listener, hass, listeners_key, keys, job, callbacks)
 
 
-@callback
-def _async_dispatch_old_entity_id_or_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
-    event: Event[EventEntityRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (
-        callbacks_list := callbacks.get(  # type: ignore[call-overload]  # mypy bug?
-            event.data.get("old_entity_id", event.data["entity_id"])
-        )
-    ):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data.get("old_entity_id", event.data["entity_id"]),
-                job,
-            )
-
-
-@callback
-def _async_entity_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
-    event_data: EventEntityRegistryUpdatedData,
-) -> bool:
-    """Filter entity registry updates by entity_id."""
-    return event_data.get("old_entity_id", event_data["entity_id"]) in callbacks
-
-
-_KEYED_TRACK_ENTITY_REGISTRY_UPDATED = _KeyedEventTracker(
-    listeners_key=TRACK_ENTITY_REGISTRY_UPDATED_LISTENER,
-    callbacks_key=TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS,
-    event_type=EVENT_ENTITY_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_old_entity_id_or_entity_id_event,
-    filter_callable=_async_entity_registry_updated_filter,
-)
+def _old_entity_id_or_entity_id(event_data: EventEntityRegistryUpdatedData) -> str:
+    """Return the entity_id an entity registry update is keyed by."""
+    return event_data.get("old_entity_id", event_data["entity_id"])  # type: ignore[return-value]
 
 
 @bind_hass
@@ -506,50 +416,17 @@ def async_track_entity_registry_updated_event(
 
     Similar to async_track_state_change_event.
     """
-    return _async_track_event(
-        _KEYED_TRACK_ENTITY_REGISTRY_UPDATED, hass, entity_ids, action, job_type
+    if not entity_ids:
+        return _remove_empty_listener
+    return hass.bus.async_listen_keyed(
+        EVENT_ENTITY_REGISTRY_UPDATED,
+        _old_entity_id_or_entity_id,
+        entity_ids,
+        action,
+        job_type=job_type,
     )
 
 
-@callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
-@callback
-def _async_dispatch_device_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event: Event[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
-
-
-_KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
-    listeners_key=TRACK_DEVICE_REGISTRY_UPDATED_LISTENER,
-    callbacks_key=TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS,
-    event_type=EVENT_DEVICE_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
-)
-
-
 @callback
 def async_track_device_registry_updated_event(
     hass: HomeAssistant,
@@ -561,8 +438,14 @@ def async_track_device_registry_updated_event(
 
     Similar to async_track_entity_registry_updated_event.
     """
-    return _async_track_event(
-        _KEYED_TRACK_DEVICE_REGISTRY_UPDATED, hass, device_ids, action, job_type
+    if not device_ids:
+        return _remove_empty_listener
+    return hass.bus.async_listen_keyed(
+        EVENT_DEVICE_REGISTRY_UPDATED,
+        "device_id",
+        device_ids,
+        action,
+        job_type=job_type,
     )
 
 
@@ -1920,7 +1803,14 @@ def _event_triggers_rerender(
     entity_id = event.data["entity_id"]
 
     if info.filter(entity_id):
-        return True
+        # A template that only reads state values renders the same
+        # result when only attributes or timestamps changed.
+        return not (
+            info.state_values_only
+            and (old_state := event.data["old_state"]) is not None
+            and (new_state := event.data["new_state"]) is not None
+            and old_state.state == new_state.state
+        )
 
     if event.data["new_state"] is not None and event.data["old_state"] is not None:
         return False
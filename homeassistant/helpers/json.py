@@ -171,6 +171,21 @@ def save_json(
     atomic_writes: bool = False,
 ) -> None:
     """Save JSON data to a file."""
+    json_data, mode = prepare_save_json(filename, data, encoder=encoder)
+    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
+    method(filename, json_data, private, mode=mode)
+
+
+def prepare_save_json(
+    filename: str,
+    data: list | dict,
+    *,
+    encoder: type[json.JSONEncoder] | None = None,
+) -> tuple[str | bytes, str]:
+    """Serialize JSON data like save_json does.
+
+    Returns the serialized data and the mode to write it with.
+    """
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -194,8 +209,7 @@ def save_json(
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
-    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
-    method(filename, json_data, private, mode=mode)
+    return json_data, mode
 
 
 def find_paths_unserializable_data(
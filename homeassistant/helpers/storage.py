@@ -6,7 +6,8 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
-from functools import cached_property
+from functools import cached_property, partial
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
@@ -31,7 +32,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
@@ -48,6 +49,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# A journaled store writes a new snapshot when its journal grows
+# larger than this fraction of the snapshot and the minimum size
+JOURNAL_MAX_SNAPSHOT_FRACTION = 0.25
+JOURNAL_MIN_COMPACT_SIZE = 64 * 1024
+
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
 
@@ -118,6 +124,7 @@ class _StoreManager:
         self._data_preload: dict[str, json_util.JsonValueType] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
+        self._pending_writes: list[tuple[Callable[[], None], asyncio.Future[None]]] = []
 
     async def async_initialize(self) -> None:
         """Initialize the storage manager."""
@@ -227,6 +234,70 @@ class _StoreManager:
         if self._storage_path.exists():
             self._files = set(os.listdir(self._storage_path))
 
+    async def async_write(self, target: Callable[..., None], *args: Any) -> None:
+        """Run a write of a store in the executor.
+
+        Writes requested in the same iteration of the event loop are
+        run one after another in a single executor job.
+        """
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        if not self._pending_writes:
+            self._hass.loop.call_soon(self._async_flush_writes)
+        self._pending_writes.append((partial(target, *args), future))
+        await future
+
+    @callback
+    def _async_flush_writes(self) -> None:
+        """Run the pending writes in the executor."""
+        writes = self._pending_writes
+        self._pending_writes = []
+        futures = [future for _, future in writes]
+        try:
+            job = self._hass.async_add_executor_job(
+                self._run_writes, [write for write, _ in writes]
+            )
+        except Exception as err:  # noqa: BLE001
+            for future in futures:
+                if not future.done():
+                    future.set_exception(err)
+            return
+        job.add_done_callback(partial(self._async_writes_done, futures))
+
+    @staticmethod
+    def _run_writes(writes: list[Callable[[], None]]) -> list[Exception | None]:
+        """Run writes and return their errors."""
+        errors: list[Exception | None] = []
+        for write in writes:
+            try:
+                write()
+            except Exception as err:  # noqa: BLE001
+                errors.append(err)
+            else:
+                errors.append(None)
+        return errors
+
+    @staticmethod
+    def _async_writes_done(
+        futures: list[asyncio.Future[None]],
+        job: asyncio.Future[list[Exception | None]],
+    ) -> None:
+        """Hand the result of each write to its caller."""
+        if job.cancelled():
+            for future in futures:
+                future.cancel()
+            return
+        if (job_error := job.exception()) is not None:
+            results: list[BaseException | None] = [job_error] * len(futures)
+        else:
+            results = list(job.result())
+        for future, error in zip(futures, results, strict=True):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
 
 @bind_hass
 class Store(Generic[_T]):
@@ -260,6 +331,9 @@ class Store(Generic[_T]):
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        # Digest of the data last written by this store, used to skip
+        # writing data which did not change
+        self._written_digest: bytes | None = None
 
     @cached_property
     def path(self):
@@ -320,6 +394,7 @@ class Store(Generic[_T]):
             exists, data = cache
             if not exists:
                 return None
+            data = await self._async_apply_journal(data)
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -381,6 +456,7 @@ class Store(Generic[_T]):
 
             if data == {}:
                 return None
+            data = await self._async_apply_journal(data)
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -415,6 +491,10 @@ class Store(Generic[_T]):
 
         return stored
 
+    async def _async_apply_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply changes journaled after the data was written."""
+        return data
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -537,7 +617,7 @@ class Store(Generic[_T]):
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        await self._manager.async_write(self._write_data, self.path, data)
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
@@ -546,14 +626,21 @@ class Store(Generic[_T]):
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
-        _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
+        json_data, mode = json_helper.prepare_save_json(
+            path, data, encoder=self._encoder
         )
+        written_digest = hashlib.sha256(
+            json_data.encode() if isinstance(json_data, str) else json_data
+        ).digest()
+        if written_digest == self._written_digest and os.path.exists(path):
+            _LOGGER.debug("Data for %s is unchanged, not writing it", self.key)
+            return
+
+        _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        self._written_digest = None
+        method = write_utf8_file_atomic if self._atomic_writes else write_utf8_file
+        method(path, json_data, self._private, mode=mode)
+        self._written_digest = written_digest
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -562,8 +649,208 @@ class Store(Generic[_T]):
     async def async_remove(self) -> None:
         """Remove all data."""
         self._manager.async_invalidate(self.key)
+        self._written_digest = None
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+
+class JournaledStore(Store[_T]):
+    """Store which journals the changes of its item collections.
+
+    The stored data is a dict of collections, lists of items which each have
+    a unique "id". Subclasses list the collections to journal in
+    journal_collections. The first write writes a snapshot of the whole data like
+    Store does. Later writes only append the items which were added, changed
+    or removed since to a journal next to the snapshot. Items are compared by
+    identity, so a collection should hold cached json fragments which are
+    only replaced when the item changes. A change of any other value of the
+    data writes a snapshot. Loading replays the journal on top of the
+    snapshot when the journal was written for the same snapshot content.
+    """
+
+    journal_collections: tuple[str, ...] = ()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize journaled storage class."""
+        super().__init__(*args, **kwargs)
+        # The collections as last written, None until a snapshot was written
+        self._journaled: dict[str, list[Any]] | None = None
+        # The serialized values which are not journaled, as last written
+        self._unjournaled: bytes = b""
+        self._journal_header: bytes = b""
+        self._journal_size = 0
+        self._snapshot_size = 0
+
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}.journal"
+
+    @staticmethod
+    def _snapshot_header(digest: bytes) -> bytes:
+        """Return the journal header identifying a snapshot by its content."""
+        return json_helper.json_bytes({"snapshot_sha256": digest.hex()})
+
+    @staticmethod
+    def _unjournaled_values(stored: dict[str, Any], journaled: Iterable[str]) -> bytes:
+        """Return the serialized values of the data which are not journaled."""
+        return json_helper.json_bytes(
+            {key: value for key, value in stored.items() if key not in journaled}
+        )
+
+    @staticmethod
+    def _item_id(item: Any) -> Any:
+        """Return the id of an item."""
+        if isinstance(item, json_helper.json_fragment):
+            item = json_util.json_loads(json_helper.json_bytes(item))
+        return item["id"]
+
+    def _journal_records(self, stored: dict[str, Any]) -> list[bytes] | None:
+        """Return the journal records for the changes since the last write.
+
+        Returns None when a snapshot should be written instead.
+        """
+        if self._journaled is None or self._journal_size > max(
+            self._snapshot_size * JOURNAL_MAX_SNAPSHOT_FRACTION,
+            JOURNAL_MIN_COMPACT_SIZE,
+        ):
+            return None
+        if (
+            self._unjournaled_values(stored, self._journaled.keys())
+            != self._unjournaled
+        ):
+            return None
+
+        records: list[bytes] = []
+        for collection, previous in self._journaled.items():
+            if not isinstance(items := stored.get(collection), list):
+                return None
+            previous_items = {id(item) for item in previous}
+            current_items = {id(item) for item in items}
+            changed = [item for item in items if id(item) not in previous_items]
+            removed = [item for item in previous if id(item) not in current_items]
+            # Rewriting most of a collection is cheaper as a snapshot
+            if len(changed) + len(removed) > len(items) // 2 + 1:
+                return None
+            changed_ids = set()
+            for item in changed:
+                if not isinstance(item, json_helper.json_fragment):
+                    return None
+                changed_ids.add(item_id := self._item_id(item))
+                records.append(
+                    json_helper.json_bytes(
+                        {"collection": collection, "id": item_id, "item": item}
+                    )
+                )
+            removed_ids = {self._item_id(item) for item in removed} - changed_ids
+            records.extend(
+                json_helper.json_bytes(
+                    {"collection": collection, "id": item_id, "item": None}
+                )
+                for item_id in removed_ids
+            )
+        return records
+
+    def _write_data(self, path: str, data: dict) -> None:
+        """Write the changes to the journal or write a snapshot."""
+        if "data_func" in data:
+            data["data"] = data.pop("data_func")()
+
+        stored = data["data"]
+        if (records := self._journal_records(stored)) is None:
+            self._journaled = None
+            super()._write_data(path, data)
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+            assert self._written_digest is not None
+            self._journal_header = self._snapshot_header(self._written_digest)
+            self._journal_size = 0
+            self._snapshot_size = os.path.getsize(path)
+        elif records:
+            _LOGGER.debug(
+                "Journaling %s changes for %s to %s",
+                len(records),
+                self.key,
+                self.journal_path,
+            )
+            chunks = [*records, b""]
+            if not self._journal_size:
+                chunks.insert(0, self._journal_header)
+            journal_data = b"\n".join(chunks)
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, journal_data)
+                if self._atomic_writes:
+                    os.fsync(fd)
+            except OSError as err:
+                # A partly written journal would be inconsistent
+                self._journaled = None
+                raise WriteError(err) from err
+            finally:
+                os.close(fd)
+            self._journal_size += len(journal_data)
+
+        self._journaled = {
+            collection: stored[collection]
+            for collection in self.journal_collections
+            if isinstance(stored.get(collection), list)
+        }
+        self._unjournaled = self._unjournaled_values(stored, self._journaled.keys())
+
+    def _replay_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal to the data of the snapshot."""
+        try:
+            with open(self.journal_path, "rb") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return data
+
+        with open(self.path, "rb") as snapshot:
+            digest = hashlib.sha256(snapshot.read()).digest()
+        if not lines or lines[0] != self._snapshot_header(digest):
+            _LOGGER.warning(
+                "Discarding the journal of %s as it was written for another snapshot",
+                self.key,
+            )
+            return data
+
+        stored = data["data"]
+        items: dict[str, dict[Any, Any]] = {}
+        for line in lines[1:]:
+            try:
+                record = json_util.json_loads_object(line)
+            except ValueError:
+                # The last record was not written completely
+                _LOGGER.warning("Ignoring incomplete journal record of %s", self.key)
+                break
+            collection = record["collection"]
+            if (collection_items := items.get(collection)) is None:
+                collection_items = items[collection] = {
+                    item["id"]: item for item in stored.get(collection, [])
+                }
+            if record["item"] is None:
+                collection_items.pop(record["id"], None)
+            else:
+                collection_items[record["id"]] = record["item"]
+
+        for collection, collection_items in items.items():
+            stored[collection] = list(collection_items.values())
+        return data
+
+    async def _async_apply_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply changes journaled after the snapshot was written."""
+        return await self.hass.async_add_executor_job(self._replay_journal, data)
+
+    async def async_remove(self) -> None:
+        """Remove all data."""
+        await super().async_remove()
+        self._journaled = None
+        with suppress(FileNotFoundError):
+            await self.hass.async_add_executor_job(os.unlink, self.journal_path)
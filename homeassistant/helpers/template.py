@@ -151,6 +151,13 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+#
+# COMPILED_TEMPLATE_CACHE_SIZE is the number of distinct template sources
+# whose compiled code is kept. Blueprints instantiated many times share
+# the same sources, so a hit avoids parsing and compiling the template
+# again on startup and reload.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
@@ -158,6 +165,59 @@ CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+
+# Template source, has hass, limited and strict
+type _CompiledTemplateKey = tuple[str, bool, bool, bool]
+
+
+class CompiledTemplateCache:
+    """LRU cache of compiled template code shared by all environments."""
+
+    __slots__ = ("_lru", "hits", "misses", "evictions")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self._lru: LRU[_CompiledTemplateKey, CodeType] = LRU(
+            size, callback=self._evicted
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _evicted(self, key: _CompiledTemplateKey, code: CodeType) -> None:
+        """Count an eviction."""
+        self.evictions += 1
+
+    def get(self, key: _CompiledTemplateKey) -> CodeType | None:
+        """Return the compiled code for a source and mode if cached."""
+        if (code := self._lru.get(key)) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return code
+
+    def __setitem__(self, key: _CompiledTemplateKey, code: CodeType) -> None:
+        """Cache the compiled code for a source and mode."""
+        self._lru[key] = code
+
+    def __contains__(self, key: _CompiledTemplateKey) -> bool:
+        """Return if the compiled code for a source and mode is cached."""
+        return key in self._lru
+
+    def __len__(self) -> int:
+        """Return the number of cached templates."""
+        return len(self._lru)
+
+    def clear(self) -> None:
+        """Clear the cache and its counters."""
+        self._lru.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+COMPILED_TEMPLATE_CACHE = CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -349,6 +409,7 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "state_values_only",
     )
 
     def __init__(self, template: Template) -> None:
@@ -367,6 +428,9 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
+        # Cleared as soon as the render reads anything from a state
+        # object other than its state value.
+        self.state_values_only = True
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -379,6 +443,7 @@ class RenderInfo:
             f" entities={self.entities}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
+            f" state_values_only={self.state_values_only}"
             f" exception={self.exception}"
             f" is_static={self.is_static}"
             ">"
@@ -433,6 +498,7 @@ class RenderInfo:
                 self.rate_limit = DOMAIN_STATES_RATE_LIMIT
 
         if self.exception:
+            self.state_values_only = False
             return
 
         if not self.all_states_lifecycle:
@@ -798,11 +864,14 @@ class Template:
         self._log_fn = log_fn
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        # Templates with the same source share one jinja2 template object
+        if (compiled := env.compiled_templates.get(self.template)) is None:
+            compiled = env.compiled_templates[self.template] = (
+                jinja2.Template.from_code(env, self._compiled_code, env.globals, None)
+            )
+        self._compiled = compiled
 
-        return self._compiled
+        return compiled
 
     def __eq__(self, other):
         """Compare template with another."""
@@ -989,17 +1058,30 @@ class TemplateStateBase(State):
         self._entity_id = entity_id
 
     def _collect_state(self) -> None:
+        if render_info := _render_info.get():
+            render_info.state_values_only = False  # type: ignore[attr-defined]
+            if self._collect:
+                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+
+    def _collect_state_value(self) -> None:
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
+    def _collect_state_repr(self) -> None:
+        if render_info := _render_info.get():
+            render_info.state_values_only = False  # type: ignore[attr-defined]
+
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            # _collect_state and _collect_state_value inlined here for performance
+            if render_info := _render_info.get():
+                if item != "state":
+                    render_info.state_values_only = False  # type: ignore[attr-defined]
+                if self._collect:
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1018,7 +1100,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.state
 
     @property
@@ -1111,6 +1193,7 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state_repr()
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -1132,6 +1215,7 @@ class TemplateStateFromEntityId(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state_repr()
         return f"<template TemplateStateFromEntityId({self._entity_id})>"
 
 
@@ -2719,9 +2803,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | str | None
-        ] = weakref.WeakValueDictionary()
+        # Filters and tests are resolved at compile time, so the compiled
+        # code depends on which of them this environment provides.
+        self.compile_mode = (hass is not None, bool(limited), bool(strict))
+        self.compiled_templates: weakref.WeakValueDictionary[str, jinja2.Template] = (
+            weakref.WeakValueDictionary()
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3057,6 +3144,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             or filename is not None
             or raw is not False
             or defer_init is not False
+            or not isinstance(source, str)
         ):
             # If there are any non-default keywords args, we do
             # not cache.  In prodution we currently do not have
@@ -3069,8 +3157,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        key = (source, *self.compile_mode)
+        if (cached := COMPILED_TEMPLATE_CACHE.get(key)) is None:
+            cached = COMPILED_TEMPLATE_CACHE[key] = super().compile(source)
 
         return cached
 
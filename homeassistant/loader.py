@@ -16,7 +16,9 @@ import importlib
 import logging
 import os
 import pathlib
+import stat
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -29,7 +31,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -47,6 +49,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -108,6 +111,10 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_INTEGRATION_INDEX: HassKey[IntegrationIndex] = HassKey("integration_index")
+INTEGRATION_INDEX_STORAGE_KEY = "core.integration_index"
+INTEGRATION_INDEX_STORAGE_VERSION = 1
+INTEGRATION_INDEX_SAVE_DELAY = 60
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -248,6 +255,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_INTEGRATION_INDEX] = IntegrationIndex(hass)
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -273,6 +281,8 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
+    await _async_load_integration_index(hass)
+
     def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
         """Return all sub directories in a set of paths."""
         return [
@@ -299,6 +309,12 @@ async def _async_get_custom_components(
     }
 
 
+async def _async_load_integration_index(hass: HomeAssistant) -> None:
+    """Load the integration index if it was set up."""
+    if (index := hass.data.get(DATA_INTEGRATION_INDEX)) is not None:
+        await index.async_load()
+
+
 async def async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -630,6 +646,119 @@ def async_register_preload_platform(hass: HomeAssistant, platform_name: str) ->
         preload_platforms.append(platform_name)
 
 
+class IntegrationIndex:
+    """Persistent index of the manifests and files of integrations.
+
+    Resolving an integration reads and parses its manifest and lists its
+    directory. The index keeps the result of that work between restarts,
+    keyed by the path of the manifest. An entry is only used while the
+    modification times of the manifest and of the integration directory
+    are unchanged, so an edited manifest or an added or removed platform
+    file is picked up on the next resolution. The index is dropped when
+    the version of Home Assistant changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self.loaded = False
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load_lock = asyncio.Lock()
+        self._store: Store[dict[str, Any]] | None = None
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the index from storage."""
+        if self.loaded:
+            return
+        async with self._load_lock:
+            if self.loaded:
+                return
+            # pylint: disable-next=import-outside-toplevel
+            from .helpers.storage import Store
+
+            self._store = Store(
+                self.hass,
+                INTEGRATION_INDEX_STORAGE_VERSION,
+                INTEGRATION_INDEX_STORAGE_KEY,
+            )
+            data = await self._store.async_load()
+            if data is not None and data.get("ha_version") == __version__:
+                self._entries = data["integrations"]
+            self.loaded = True
+
+    def get(
+        self, manifest_path: pathlib.Path, mtimes: tuple[int, int]
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and top level files if they did not change.
+
+        Can be called from any thread.
+        """
+        with self._lock:
+            entry = self._entries.get(str(manifest_path))
+        if entry is None or tuple(entry["mtimes"]) != mtimes:
+            return None
+        files: list[str] | None = entry["files"]
+        return (
+            cast(Manifest, dict(entry["manifest"])),
+            None if files is None else set(files),
+        )
+
+    def set(
+        self,
+        manifest_path: pathlib.Path,
+        mtimes: tuple[int, int],
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Store the manifest and top level files of an integration.
+
+        Can be called from any thread.
+        """
+        entry = {
+            "mtimes": list(mtimes),
+            "manifest": dict(manifest),
+            "files": None if top_level_files is None else sorted(top_level_files),
+        }
+        with self._lock:
+            self._entries[str(manifest_path)] = entry
+            if self._save_pending:
+                return
+            self._save_pending = True
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the index."""
+        if TYPE_CHECKING:
+            assert self._store is not None
+        with self._lock:
+            self._save_pending = False
+        self._store.async_delay_save(self._data_to_save, INTEGRATION_INDEX_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the index to store."""
+        with self._lock:
+            entries = self._entries.copy()
+        return {"ha_version": __version__, "integrations": entries}
+
+
+def _integration_mtimes(manifest_path: pathlib.Path) -> tuple[int, int] | None:
+    """Return the modification times of a manifest and its directory.
+
+    Returns None if the manifest is not a file.
+    """
+    try:
+        manifest_stat = manifest_path.stat()
+        directory_stat = manifest_path.parent.stat()
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISREG(manifest_stat.st_mode):
+        return None
+    return manifest_stat.st_mtime_ns, directory_stat.st_mtime_ns
+
+
 class Integration:
     """An integration in Home Assistant."""
 
@@ -638,30 +767,42 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        index = hass.data.get(DATA_INTEGRATION_INDEX)
+        if index is not None and not index.loaded:
+            index = None
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+            # The modification times are taken before reading so a change
+            # while reading invalidates the index entry on the next start
+            if (mtimes := _integration_mtimes(manifest_path)) is None:
                 continue
 
             file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
+            if index is not None and (cached := index.get(manifest_path, mtimes)):
+                manifest, top_level_files = cached
+            else:
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if index is not None:
+                    index.set(manifest_path, mtimes, manifest, top_level_files)
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -1381,6 +1522,7 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        await _async_load_integration_index(hass)
         integrations = await hass.async_add_executor_job(
             _resolve_integrations_from_root, hass, components, needed
         )
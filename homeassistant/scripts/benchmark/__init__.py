@@ -7,11 +7,13 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 
-from homeassistant import core
+from homeassistant import config_entries, core, loader
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
@@ -19,6 +21,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -225,6 +228,85 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_10k_filtered_listeners(hass):
+    """Run 10k state changed events through 10k listeners with event filters."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**4
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(10**4):
+        listener_entity_id = f"{entity_id}{idx}"
+
+        @core.callback
+        def event_filter(event_data, listener_entity_id=listener_entity_id):
+            """Filter event."""
+            return event_data["entity_id"] == listener_entity_id
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter=event_filter)
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def state_changed_10k_tracked_entities(hass):
+    """Run 10k state changed events with 10k entities tracked one by one.
+
+    This is how entities track the state of other entities, each with its
+    own call to async_track_state_change_event.
+    """
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**4
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(10**4):
+        async_track_state_change_event(hass, f"{entity_id}{idx}", listener)
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -312,6 +394,106 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def compile_statistics_1k_sensors(hass):
+    """Compile 5 minute statistics of 1k sensors with 30 recorded states each."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.components.sensor import recorder as sensor_recorder
+    from homeassistant.helpers import (
+        device_registry as dr,
+        entity_registry as er,
+        recorder as recorder_helper,
+    )
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    sensors = 1000
+    states_per_sensor = 30
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        await asyncio.gather(dr.async_load(hass), er.async_load(hass))
+        recorder_helper.async_initialize_recorder(hass)
+        assert await async_setup_component(hass, "recorder", {"recorder": {}})
+        await hass.async_start()
+        instance = get_instance(hass)
+
+        end = dt_util.utcnow().replace(second=0, microsecond=0)
+        start = end - timedelta(minutes=5)
+        step = (end - start).total_seconds() / states_per_sensor
+        attributes = {"unit_of_measurement": "W", "state_class": "measurement"}
+        for idx in range(states_per_sensor):
+            timestamp = start.timestamp() + step * idx
+            for sensor in range(sensors):
+                hass.states.async_set(
+                    f"sensor.power_{sensor}",
+                    str(sensor + idx % 7),
+                    attributes,
+                    timestamp=timestamp,
+                )
+            await instance.async_block_till_done()
+
+        def _compile_statistics() -> float:
+            with session_scope(hass=hass, read_only=True) as session:
+                start_timer = timer()
+                result = sensor_recorder.compile_statistics(hass, session, start, end)
+                runtime = timer() - start_timer
+            assert len(result.platform_stats) == sensors
+            return runtime
+
+        runtime = await instance.async_add_executor_job(_compile_statistics)
+        await hass.async_stop()
+
+    return runtime
+
+
+async def _write_10k_unchanged_entity_states(hass, cache_calculated_state):
+    """Write the unchanged state of 10k entities."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity import Entity
+
+    class BenchmarkEntity(Entity):
+        """Entity with a few attributes."""
+
+        _cache_calculated_state = cache_calculated_state
+        _attr_extra_state_attributes = {"battery": 90, "rssi": -60, "linkquality": 3}
+        _attr_icon = "mdi:thermometer"
+        _attr_state = "21.5"
+        _attr_unit_of_measurement = "°C"
+
+    entities = []
+    for idx in range(10**4):
+        entity = BenchmarkEntity()
+        entity.hass = hass
+        entity.entity_id = f"sensor.temperature_{idx}"
+        entity._attr_name = f"Temperature {idx}"  # noqa: SLF001
+        entity._async_write_ha_state()  # noqa: SLF001
+        entities.append(entity)
+
+    start = timer()
+    for entity in entities:
+        entity._async_write_ha_state()  # noqa: SLF001
+    return timer() - start
+
+
+@benchmark
+async def entity_write_10k_unchanged(hass):
+    """Write the unchanged state of 10k entities."""
+    return await _write_10k_unchanged_entity_states(hass, False)
+
+
+@benchmark
+async def entity_write_10k_unchanged_cached(hass):
+    """Write the unchanged state of 10k entities which cache their state."""
+    return await _write_10k_unchanged_entity_states(hass, True)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -7,6 +7,7 @@ from collections import defaultdict
 from collections.abc import Awaitable, Callable, Generator, Mapping
 import contextlib
 import contextvars
+from dataclasses import dataclass
 from enum import StrEnum
 from functools import partial
 import logging.handlers
@@ -73,6 +74,10 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_TIMELINE is a dict, indicating when the setup of a component
+# started and finished during startup and how long its import took.
+DATA_SETUP_TIMELINE: HassKey[dict[str, SetupTimeline]] = HassKey("setup_timeline")
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -94,6 +99,32 @@ class EventComponentLoaded(TypedDict):
     component: str
 
 
+@dataclass(slots=True)
+class SetupTimeline:
+    """Timeline of the setup of a component during startup."""
+
+    started: float
+    finished: float | None = None
+    import_time: float = 0.0
+
+
+class SetupReportIntegration(TypedDict):
+    """Timings of an integration in the setup report."""
+
+    started: float
+    finished: float
+    import_seconds: float
+    setup_seconds: float
+
+
+class SetupReport(TypedDict):
+    """Setup report with the critical path of the startup."""
+
+    seconds: float
+    critical_path: list[str]
+    integrations: dict[str, SetupReportIntegration]
+
+
 @callback
 def async_notify_setup_error(
     hass: HomeAssistant, component: str, display_link: str | None = None
@@ -162,8 +193,14 @@ async def async_setup_component(
     setup_future = hass.loop.create_future()
     setup_futures[domain] = setup_future
 
+    timeline: SetupTimeline | None = None
+    if not hass.is_stopping and hass.state is not core.CoreState.running:
+        timeline = _setup_timeline(hass)[domain] = SetupTimeline(time.monotonic())
+
     try:
         result = await _async_setup_component(hass, domain, config)
+        if timeline:
+            timeline.finished = time.monotonic()
         setup_future.set_result(result)
         if setup_done_future := setup_done_futures.pop(domain, None):
             setup_done_future.set_result(result)
@@ -317,11 +354,14 @@ async def _async_setup_component(
 
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
+    import_started = time.monotonic()
     try:
         component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
+    if timeline := hass.data.get(DATA_SETUP_TIMELINE, {}).get(domain):
+        timeline.import_time = time.monotonic() - import_started
 
     integration_config_info = await conf_util.async_process_component_config(
         hass, config, integration, component
@@ -719,6 +759,12 @@ def async_pause_setup(
         )
 
 
+@singleton.singleton(DATA_SETUP_TIMELINE)
+def _setup_timeline(hass: core.HomeAssistant) -> dict[str, SetupTimeline]:
+    """Return the setup timeline dict."""
+    return {}
+
+
 @singleton.singleton(DATA_SETUP_TIME)
 def _setup_times(
     hass: core.HomeAssistant,
@@ -811,3 +857,58 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
         domain_timings[domain] = total_top_level + group_max
 
     return domain_timings
+
+
+@callback
+def async_get_setup_report(hass: core.HomeAssistant) -> SetupReport:
+    """Return the timings of the startup and its critical path.
+
+    The critical path is the chain of integrations which held back the
+    startup the longest. It starts with the integration which finished its
+    setup last and follows the dependency which finished last for as long
+    as that dependency finished after the dependant started its setup.
+    Times are in seconds relative to the start of the first setup.
+    """
+    timeline = {
+        domain: (item.started, item.finished)
+        for domain, item in hass.data.get(DATA_SETUP_TIMELINE, {}).items()
+        if item.finished is not None
+    }
+    if not timeline:
+        return {"seconds": 0.0, "critical_path": [], "integrations": {}}
+
+    origin = min(started for started, _ in timeline.values())
+    setup_timings = async_get_setup_timings(hass)
+    import_times = hass.data[DATA_SETUP_TIMELINE]
+    integrations: dict[str, SetupReportIntegration] = {
+        domain: {
+            "started": round(started - origin, 3),
+            "finished": round(finished - origin, 3),
+            "import_seconds": round(import_times[domain].import_time, 3),
+            "setup_seconds": round(setup_timings.get(domain, 0.0), 3),
+        }
+        for domain, (started, finished) in timeline.items()
+    }
+
+    cache = hass.data[loader.DATA_INTEGRATIONS]
+    domain: str | None = max(timeline, key=lambda domain: timeline[domain][1])
+    last_finished = timeline[domain][1]
+    critical_path: list[str] = []
+    while domain is not None:
+        critical_path.append(domain)
+        started, finished = timeline[domain]
+        integration = cache.get(domain)
+        if type(integration) is not loader.Integration:
+            break
+        blocking = [
+            dep
+            for dep in (*integration.dependencies, *integration.after_dependencies)
+            if dep in timeline and started < timeline[dep][1] < finished
+        ]
+        domain = max(blocking, key=lambda dep: timeline[dep][1], default=None)
+
+    return {
+        "seconds": round(last_finished - origin, 3),
+        "critical_path": critical_path[::-1],
+        "integrations": integrations,
+    }
@@ -167,6 +167,9 @@ def get_test_home_assistant() -> Generator[HomeAssistant, None, None]:
     asyncio.set_event_loop(loop)
     context_manager = async_test_home_assistant(loop)
     hass = loop.run_until_complete(context_manager.__aenter__())
+    # Storage is not mocked for these tests, do not write the
+    # integration index to the test config directory
+    hass.data.pop(loader.DATA_INTEGRATION_INDEX)
 
     loop_stop_event = threading.Event()
 
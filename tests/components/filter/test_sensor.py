@@ -1,6 +1,8 @@
 """The test for the data filter sensor platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
+import math
+import statistics
 from unittest.mock import patch
 
 import pytest
@@ -493,6 +495,89 @@ def test_time_sma(values: list[State]) -> None:
     assert filtered.state == 21.5
 
 
+def test_outlier_non_finite_values() -> None:
+    """Test the outlier filter with nan and inf passing through the window."""
+    raw_values = [20, 19, math.nan, 21, 35, math.inf, 22, 19.5, 19.5, -math.inf]
+    raw_values += [21, 20, 20.5, 40, 19]
+    window_size = 3
+    filt = OutlierFilter(window_size=window_size, entity=None, radius=3.0)
+    timestamp = dt_util.utcnow()
+    for idx, value in enumerate(raw_values):
+        state = State("sensor.test_monitored", str(value), last_updated=timestamp)
+        timestamp += timedelta(seconds=1)
+        window = raw_values[max(0, idx - window_size) : idx]
+        expected = value
+        if len(window) == window_size and not any(map(math.isnan, window)):
+            median = statistics.median(window)
+            if abs(value - median) > 3:
+                expected = median
+        result = filt.filter_state(state).state
+        assert result == expected or (math.isnan(result) and math.isnan(expected))
+    assert result == 19
+
+
+def test_time_sma_non_finite_values() -> None:
+    """Test the time_sma filter recovers once nan and inf left the window."""
+    window = timedelta(seconds=5)
+    filt = TimeSMAFilter(window_size=window, entity=None, type="last", precision=6)
+    timestamp = dt_util.utcnow()
+    raw_values = [1.0, 2.0, math.inf, 3.0, -math.inf, 4.0, math.nan, 5.0]
+    raw_values += [float(idx % 5) for idx in range(20)]
+    for value in raw_values:
+        timestamp += timedelta(seconds=1)
+        state = State("sensor.test_monitored", str(value), last_updated=timestamp)
+        filtered = filt.filter_state(state).state
+
+    # The last five values are 0, 1, 2, 3, 4, one second each, with the
+    # value before the window (4) weighted for the first second
+    assert filtered == pytest.approx((4 + 0 + 1 + 2 + 3) / 5)
+
+
+def test_outlier_sliding_window() -> None:
+    """Test the outlier filter median follows the sliding window."""
+    raw_values = [20, 19, 18, 21, 35, 22, 0, 19.5, 19.5, 21, 20, -4, 20.5]
+    window_size = 4
+    filt = OutlierFilter(window_size=window_size, entity=None, radius=3.0)
+    timestamp = dt_util.utcnow()
+    for idx, value in enumerate(raw_values):
+        state = State("sensor.test_monitored", str(value), last_updated=timestamp)
+        timestamp += timedelta(seconds=1)
+        window = raw_values[max(0, idx - window_size) : idx]
+        expected = value
+        if len(window) == window_size and abs(value - statistics.median(window)) > 3:
+            expected = statistics.median(window)
+        assert filt.filter_state(state).state == expected
+
+
+def test_time_sma_sliding_window() -> None:
+    """Test the time_sma filter over a window which keeps leaking states."""
+    window = timedelta(seconds=10)
+    filt = TimeSMAFilter(window_size=window, entity=None, type="last", precision=6)
+    timestamp = dt_util.utcnow()
+    history: list[tuple[datetime, float]] = []
+    for idx in range(60):
+        value = float((idx * 7) % 11)
+        timestamp += timedelta(seconds=1 + idx % 3)
+        history.append((timestamp, value))
+        state = State("sensor.test_monitored", str(value), last_updated=timestamp)
+
+        # The value at the start of the window is the last one before it,
+        # or the first one if the window is not filled yet
+        start = timestamp - window
+        in_window = [(time, value) for time, value in history if time > start]
+        before = [value for time, value in history if time <= start]
+        current_value = before[-1] if before else in_window[0][1]
+        moving_sum = 0.0
+        last_time = start
+        for time, value in in_window:
+            moving_sum += (time - last_time).total_seconds() * current_value
+            last_time, current_value = time, value
+
+        assert filt.filter_state(state).state == pytest.approx(
+            moving_sum / window.total_seconds(), abs=1e-6
+        )
+
+
 async def test_reload(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Verify we can reload filter sensors."""
     hass.states.async_set("sensor.test_monitored", 12345)
@@ -16,6 +16,7 @@ from homeassistant.const import (
     ATTR_FRIENDLY_NAME,
     ATTR_ICON,
     EVENT_HOMEASSISTANT_START,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_CLOSED,
     STATE_HOME,
@@ -33,7 +34,6 @@ from homeassistant.const import (
 )
 from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 from homeassistant.setup import async_setup_component
 
 from . import common
@@ -901,10 +901,13 @@ async def test_reloading_groups(hass: HomeAssistant) -> None:
         "group.test_group",
     ]
     assert hass.bus.async_listeners()["state_changed"] == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["hello.world"]) == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
+    state_changed_jobs = hass.bus._keyed_listeners[  # noqa: SLF001
+        (EVENT_STATE_CHANGED, "entity_id")
+    ].jobs
+    assert len(state_changed_jobs["hello.world"]) == 1
+    assert len(state_changed_jobs["light.bowl"]) == 1
+    assert len(state_changed_jobs["test.one"]) == 1
+    assert len(state_changed_jobs["test.two"]) == 1
 
     with patch(
         "homeassistant.config.load_yaml_config_file",
@@ -920,9 +923,9 @@ async def test_reloading_groups(hass: HomeAssistant) -> None:
         "group.hello",
     ]
     assert hass.bus.async_listeners()["state_changed"] == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
+    assert len(state_changed_jobs["light.bowl"]) == 1
+    assert len(state_changed_jobs["test.one"]) == 1
+    assert len(state_changed_jobs["test.two"]) == 1
 
 
 async def test_modify_group(hass: HomeAssistant) -> None:
@@ -1,9 +1,13 @@
 """The tests the History component websocket_api."""
 
 import asyncio
+from collections.abc import Generator
 from datetime import timedelta
+import threading
+from typing import Any
 from unittest.mock import patch
 
+from aiohttp.http_websocket import WebSocketWriter
 from freezegun import freeze_time
 import pytest
 
@@ -12,6 +16,7 @@ from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_loads
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -172,6 +177,296 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends chunks as partial messages."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("on", "off", "on", "off", "on"):
+        hass.states.async_set("sensor.one", state)
+        hass.states.async_set("sensor.two", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "chunk_size": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["result"] is None
+
+    chunks = []
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        chunks.append(response["event"]["states"])
+        if not response["event"]["partial"]:
+            break
+
+    assert [
+        sum(len(entity_states) for entity_states in chunk.values()) for chunk in chunks
+    ] == [3, 3, 3, 1]
+    streamed: dict[str, list] = {}
+    for chunk in chunks:
+        for entity_id, entity_states in chunk.items():
+            streamed.setdefault(entity_id, []).extend(entity_states)
+    assert [state["s"] for state in streamed["sensor.one"]] == [
+        "on",
+        "off",
+        "on",
+        "off",
+        "on",
+    ]
+    assert [state["s"] for state in streamed["sensor.two"]] == [
+        "on",
+        "off",
+        "on",
+        "off",
+        "on",
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunk_size": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 2
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["event"] == {"states": {}, "partial": False}
+
+
+async def test_history_during_period_chunked_more_than_pending_limit(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test streaming more chunks than the websocket may have pending."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now) as freezer:
+        for idx in range(30):
+            freezer.tick(timedelta(seconds=1))
+            hass.states.async_set("sensor.one", str(idx))
+        await async_wait_recording_done(hass)
+
+    writer_send = WebSocketWriter.send
+
+    async def _slow_send(self: WebSocketWriter, *args: Any, **kwargs: Any) -> None:
+        await asyncio.sleep(0.02)
+        await writer_send(self, *args, **kwargs)
+
+    with (
+        patch.object(WebSocketWriter, "send", _slow_send),
+        patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 8),
+        patch.object(websocket_api, "MAX_PENDING_HISTORY_CHUNKS", 4),
+    ):
+        client = await hass_ws_client()
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+                "chunk_size": 1,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        streamed = []
+        while True:
+            response = await client.receive_json()
+            assert response["id"] == 1
+            streamed.extend(response["event"]["states"]["sensor.one"])
+            if not response["event"]["partial"]:
+                break
+
+    assert [state["s"] for state in streamed] == [str(idx) for idx in range(30)]
+
+
+class _SlowConnection:
+    """Connection whose messages are only written when the test consumes them."""
+
+    def __init__(self) -> None:
+        """Initialize the connection."""
+        self.queue: list[bytes] = []
+        self.max_pending = 0
+
+    def pending_messages(self) -> int:
+        """Return the number of messages not consumed yet."""
+        return len(self.queue)
+
+    def send_message(self, message: bytes) -> None:
+        """Queue a message."""
+        self.queue.append(message)
+        self.max_pending = max(self.max_pending, len(self.queue))
+
+
+async def test_stream_significant_states_backpressure(hass: HomeAssistant) -> None:
+    """Test the chunked stream waits for the writer and stops on close."""
+    read = 0
+    stream_closed = False
+
+    def _stream(*args: Any) -> Generator[dict[str, list[dict[str, Any]]]]:
+        nonlocal read, stream_closed
+        try:
+            for idx in range(40):
+                read += 1
+                yield {"sensor.one": [{"s": str(idx)}]}
+        finally:
+            stream_closed = True
+
+    async def _consume(
+        connection: _SlowConnection, task: asyncio.Future, limit: int | None
+    ) -> list[dict[str, Any]]:
+        events = []
+        while not task.done() and (limit is None or len(events) < limit):
+            await asyncio.sleep(0.005)
+            if connection.queue:
+                events.append(json_loads(connection.queue.pop(0))["event"])
+        events.extend(json_loads(message)["event"] for message in connection.queue)
+        return events
+
+    with (
+        patch.object(websocket_api.history, "stream_significant_states", _stream),
+        patch.object(websocket_api, "HISTORY_CHUNK_DRAIN_INTERVAL", 0.001),
+    ):
+        connection = _SlowConnection()
+        closed = threading.Event()
+        task = hass.async_add_executor_job(
+            websocket_api._ws_stream_significant_states,
+            hass,
+            connection,
+            1,
+            dt_util.utcnow(),
+            None,
+            ["sensor.one"],
+            True,
+            False,
+            True,
+            True,
+            1,
+            closed,
+        )
+        events = await _consume(connection, task, None)
+        await task
+
+        assert [event["states"]["sensor.one"][0]["s"] for event in events] == [
+            str(idx) for idx in range(40)
+        ]
+        assert [event["partial"] for event in events] == [True] * 39 + [False]
+        assert connection.max_pending <= websocket_api.MAX_PENDING_HISTORY_CHUNKS
+        assert stream_closed
+
+        read = 0
+        stream_closed = False
+        connection = _SlowConnection()
+        closed = threading.Event()
+        task = hass.async_add_executor_job(
+            websocket_api._ws_stream_significant_states,
+            hass,
+            connection,
+            1,
+            dt_util.utcnow(),
+            None,
+            ["sensor.one"],
+            True,
+            False,
+            True,
+            True,
+            1,
+            closed,
+        )
+        await _consume(connection, task, 3)
+        closed.set()
+        await task
+
+    assert stream_closed
+    assert read < 40
+    assert connection.max_pending <= websocket_api.MAX_PENDING_HISTORY_CHUNKS
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric series to max_points."""
+    start = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(start) as freezer:
+        for idx in range(100):
+            freezer.tick(timedelta(seconds=1))
+            hass.states.async_set("sensor.power", 500 if idx == 42 else idx % 10)
+            hass.states.async_set("sensor.text", f"text{idx}")
+        await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power", "sensor.text"],
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    power_history = response["result"]["sensor.power"]
+    assert len(power_history) <= 10
+    assert power_history[0]["s"] == "0"
+    assert power_history[-1]["s"] == "9"
+    assert "500" in [state["s"] for state in power_history]
+    assert power_history == sorted(power_history, key=lambda state: state["lu"])
+    assert len(response["result"]["sensor.text"]) == 100
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 10,
+            "chunk_size": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1,5 +1,6 @@
 """The test for the History Statistics sensor platform."""
 
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -9,6 +10,7 @@ import voluptuous as vol
 
 from homeassistant import config as hass_config
 from homeassistant.components.history_stats import DOMAIN
+from homeassistant.components.history_stats.data import HistoryBackfill
 from homeassistant.components.history_stats.sensor import (
     PLATFORM_SCHEMA as SENSOR_SCHEMA,
 )
@@ -1439,6 +1441,176 @@ async def test_measure_cet(recorder_mock: Recorder, hass: HomeAssistant) -> None
     assert hass.states.get("sensor.sensor4").state == "83.3"
 
 
+async def test_shared_backfill_and_sliding_period(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test sensors of the same entity share a backfill and slide without a query."""
+    now = dt_util.utcnow().replace(microsecond=0)
+
+    # now-2h    now-90m             now-30m   now
+    # |---off---|--------on---------|---off---|
+
+    def _fake_states(*args, **kwargs):
+        return {
+            "binary_sensor.test_id": [
+                ha.State(
+                    "binary_sensor.test_id",
+                    "off",
+                    last_changed=now - timedelta(hours=2),
+                ),
+                ha.State(
+                    "binary_sensor.test_id",
+                    "on",
+                    last_changed=now - timedelta(minutes=90),
+                ),
+                ha.State(
+                    "binary_sensor.test_id",
+                    "off",
+                    last_changed=now - timedelta(minutes=30),
+                ),
+            ]
+        }
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            side_effect=_fake_states,
+        ) as state_changes_during_period_mock,
+        freeze_time(now),
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "two_hours",
+                        "state": "on",
+                        "duration": {"hours": 2},
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    },
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "one_hour",
+                        "state": "on",
+                        "duration": {"hours": 1},
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+        assert state_changes_during_period_mock.call_count == 1
+        assert hass.states.get("sensor.two_hours").state == "1.0"
+        assert hass.states.get("sensor.one_hour").state == "0.5"
+
+    later = now + timedelta(minutes=10)
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            side_effect=_fake_states,
+        ) as state_changes_during_period_mock,
+        freeze_time(later),
+    ):
+        async_fire_time_changed(hass, later)
+        await hass.async_block_till_done()
+
+        assert state_changes_during_period_mock.call_count == 0
+        assert hass.states.get("sensor.two_hours").state == "1.0"
+        assert hass.states.get("sensor.one_hour").state == "0.33"
+
+
+async def test_period_in_the_past_rolls_over_from_the_database(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test a period ending in the past picks up the state changes made since then."""
+    start_of_today = dt_util.now().replace(
+        day=9, month=7, year=1986, hour=0, minute=0, second=0, microsecond=0
+    )
+    with freeze_time(start_of_today - timedelta(hours=1)):
+        await async_setup_recorder_instance(hass)
+        await hass.async_block_till_done()
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await async_wait_recording_done(hass)
+
+    with freeze_time(start_of_today + timedelta(hours=1)):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "yesterday",
+                        "state": "on",
+                        "end": "{{ today_at() }}",
+                        "duration": {"hours": 24},
+                        "type": "time",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.yesterday").state == "0.0"
+
+    turn_on_time = start_of_today + timedelta(hours=2)
+    with freeze_time(turn_on_time):
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await async_wait_recording_done(hass)
+        async_fire_time_changed(hass, turn_on_time)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert hass.states.get("sensor.yesterday").state == "0.0"
+
+    turn_off_time = start_of_today + timedelta(hours=5)
+    with freeze_time(turn_off_time):
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await async_wait_recording_done(hass)
+        async_fire_time_changed(hass, turn_off_time)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert hass.states.get("sensor.yesterday").state == "0.0"
+
+    # The state changes of the day are only in the database as they
+    # happened after the end of the period the sensor was tracking
+    after_midnight = start_of_today + timedelta(days=1, minutes=10)
+    with freeze_time(after_midnight):
+        async_fire_time_changed(hass, after_midnight)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert hass.states.get("sensor.yesterday").state == "3.0"
+
+
+async def test_shared_backfill_cancelled_before_query(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the backfills joining a cancelled backfill do not wait forever."""
+    backfill = HistoryBackfill(hass)
+    now = dt_util.utcnow().timestamp()
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        return_value={},
+    ) as state_changes_during_period_mock:
+        leader = hass.async_create_task(
+            backfill.async_get("binary_sensor.test_id", now - 3600, now)
+        )
+        follower = hass.async_create_task(
+            backfill.async_get("binary_sensor.test_id", now - 7200, now)
+        )
+        leader.cancel()
+        await asyncio.wait_for(asyncio.wait([leader, follower]), timeout=1)
+
+    assert leader.cancelled()
+    assert follower.cancelled()
+    assert state_changes_during_period_mock.call_count == 0
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "America/Chicago", "US/Hawaii"])
 async def test_end_time_with_microseconds_zeroed(
     time_zone: str,
@@ -6,6 +6,7 @@ from http import HTTPStatus
 import logging
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+from influxdb.line_protocol import make_line
 import pytest
 
 from homeassistant.components import influxdb
@@ -50,6 +51,14 @@ def mock_batch_timeout(hass, monkeypatch):
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_spool_file(tmp_path, monkeypatch):
+    """Spool events to a temporary file."""
+    spool_file = tmp_path / "influxdb.spool"
+    monkeypatch.setattr(f"{INFLUX_PATH}.SPOOL_FILE", str(spool_file))
+    return spool_file
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture(request):
     """Patch the InfluxDBClient object with mock for version under test."""
@@ -62,22 +71,76 @@ def mock_client_fixture(request):
         yield client
 
 
+class LineProtocolBody:
+    """Match written line protocol lines against the expected points.
+
+    The expected lines are encoded with the line protocol encoder of the
+    influxdb client. A point with an ANY time is matched without timestamp.
+    """
+
+    def __init__(self, body: list[dict], precision: str | None) -> None:
+        """Initialize the matcher."""
+        self.body = body
+        self.precision = precision
+
+    def _expected_line(self, point: dict) -> str:
+        """Return the expected line for a point."""
+        # The integration only writes float and string fields
+        fields = {
+            key: float(value) if isinstance(value, int) else value
+            for key, value in point["fields"].items()
+        }
+        if point["time"] is ANY:
+            return make_line(point["measurement"], point["tags"], fields)
+        return make_line(
+            point["measurement"],
+            point["tags"],
+            fields,
+            point["time"],
+            self.precision,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the written lines with the expected points."""
+        if not isinstance(other, list) or len(other) != len(self.body):
+            return False
+        for line, point in zip(other, self.body, strict=True):
+            if point["time"] is ANY:
+                line = line.rsplit(" ", 1)[0]
+            if line != self._expected_line(point):
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        """Return the expected lines."""
+        return repr([self._expected_line(point) for point in self.body])
+
+
 @pytest.fixture(name="get_mock_call")
 def get_mock_call_fixture(request):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {
+            "bucket": DEFAULT_BUCKET,
+            "record": LineProtocolBody(body, precision),
+        }
 
         if precision is not None:
             data["write_precision"] = precision
 
         return call(**data)
 
+    def v1_call(body, precision):
+        return call(
+            LineProtocolBody(body, precision),
+            time_precision=precision,
+            protocol="line",
+        )
+
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    # pylint: disable-next=unnecessary-lambda
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: v1_call(body, precision)
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1356,9 +1419,14 @@ async def test_event_listener_ignore_attributes_overlapping_entities(
     indirect=["mock_client", "get_mock_call"],
 )
 async def test_event_listener_scheduled_write(
-    hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
+    hass: HomeAssistant,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+    mock_spool_file,
 ) -> None:
-    """Test the event listener retries after a write failure."""
+    """Test the event listener retries and spools after a write failure."""
     config = {"max_retries": 1}
     config.update(config_ext)
     await _setup(hass, mock_client, config, get_write_api)
@@ -1372,15 +1440,86 @@ async def test_event_listener_scheduled_write(
         await async_wait_for_queue_to_process(hass)
         assert mock_sleep.called
     assert write_api.call_count == 2
+    assert mock_spool_file.exists()
 
-    # Write works again
+    # Write works again, the spooled event is replayed afterwards
     write_api.side_effect = None
     with patch.object(influxdb.time, "sleep") as mock_sleep:
         hass.states.async_set("entity.entity_id", "2")
         await hass.async_block_till_done()
         await async_wait_for_queue_to_process(hass)
         assert not mock_sleep.called
-    assert write_api.call_count == 3
+    assert write_api.call_count == 4
+    assert not mock_spool_file.exists()
+
+    body = [
+        {
+            "measurement": "entity.entity_id",
+            "tags": {"domain": "entity", "entity_id": "entity_id"},
+            "time": ANY,
+            "fields": {"value": value},
+        }
+        for value in (2, 1)
+    ]
+    assert write_api.call_args_list[2:] == [
+        get_mock_call(body[:1]),
+        get_mock_call(body[1:]),
+    ]
+
+
+@pytest.mark.parametrize("mock_client", [influxdb.DEFAULT_API_VERSION], indirect=True)
+async def test_spool_replayed_in_batches(
+    hass: HomeAssistant, mock_client, mock_spool_file, monkeypatch
+) -> None:
+    """Test the spool is limited in bytes and replayed one batch at a time."""
+    await _setup(hass, mock_client, BASE_V1_CONFIG, _get_write_api_mock_v1)
+    thread = hass.data[influxdb.DOMAIN]
+    monkeypatch.setattr(f"{INFLUX_PATH}.BATCH_BUFFER_BYTES", 20)
+    monkeypatch.setattr(f"{INFLUX_PATH}.SPOOL_MAX_BYTES", 60)
+
+    # 40 characters with the newline, but 70 bytes once encoded
+    assert await hass.async_add_executor_job(thread.spool, ['m value="' + "é" * 30])
+    assert not mock_spool_file.exists()
+
+    lines = [f"m value={idx}" for idx in range(5)]
+    assert await hass.async_add_executor_job(thread.spool, lines) == 0
+    assert mock_spool_file.stat().st_size == 50
+
+    with patch.object(thread.influx, "write") as write:
+        write.side_effect = ConnectionError
+        await hass.async_add_executor_job(thread.replay_spool)
+        assert thread.connection_lost
+        assert thread.spool_pending
+
+        thread.connection_lost = False
+        write.side_effect = None
+        write.reset_mock()
+        for _ in range(3):
+            assert mock_spool_file.exists()
+            await hass.async_add_executor_job(thread.replay_spool)
+
+    assert write.call_args_list == [call(lines[:2]), call(lines[2:4]), call(lines[4:])]
+    assert not mock_spool_file.exists()
+    assert not thread.spool_pending
+
+
+@pytest.mark.parametrize("mock_client", [influxdb.API_VERSION_2], indirect=True)
+async def test_v2_writes_synchronously(
+    hass: HomeAssistant, mock_client, mock_spool_file
+) -> None:
+    """Test V2 writes are synchronous so failed writes reach the spool."""
+    await _setup(hass, mock_client, BASE_V2_CONFIG, _get_write_api_mock_v2)
+    assert mock_client.return_value.write_api.call_args_list == [
+        call(write_options=influxdb.SYNCHRONOUS)
+    ]
+
+    write_api = _get_write_api_mock_v2(mock_client)
+    write_api.side_effect = OSError("foo")
+    with patch.object(influxdb.time, "sleep"):
+        hass.states.async_set("entity.entity_id", 1)
+        await hass.async_block_till_done()
+        await async_wait_for_queue_to_process(hass)
+    assert mock_spool_file.exists()
 
 
 @pytest.mark.parametrize(
@@ -1702,3 +1841,71 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call", "precision"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+            "ms",
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+            "s",
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_line_protocol_encoding(
+    hass: HomeAssistant,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+    precision,
+) -> None:
+    """Test events are encoded like the influxdb line protocol encoder does."""
+    config = {"precision": precision, "tags_attributes": ["room name"]}
+    config.update(config_ext)
+    await _setup(hass, mock_client, config, get_write_api)
+
+    attributes = {
+        "unit_of_measurement": "m,s=1 x",
+        "room name": "living room, east=1",
+        "quote": 'say "hi"\\\nbye',
+        "nan": float("nan"),
+    }
+    with patch.object(
+        influxdb.Event,
+        "time_fired",
+        datetime.datetime(2024, 2, 3, 4, 5, 6, 789012, tzinfo=datetime.UTC),
+    ):
+        hass.states.async_set("fake.entity_id", "12.5", attributes)
+        await hass.async_block_till_done()
+        await async_wait_for_queue_to_process(hass)
+
+    body = [
+        {
+            "measurement": "m,s=1 x",
+            "tags": {
+                "domain": "fake",
+                "entity_id": "entity_id",
+                "room name": "living room, east=1",
+            },
+            "time": datetime.datetime(2024, 2, 3, 4, 5, 6, 789012, tzinfo=datetime.UTC),
+            "fields": {
+                "value": 12.5,
+                "quote_str": 'say "hi"\\\nbye',
+            },
+        }
+    ]
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    assert write_api.call_args == get_mock_call(body, precision)
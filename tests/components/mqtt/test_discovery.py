@@ -7,6 +7,7 @@ from pathlib import Path
 import re
 from unittest.mock import AsyncMock, call, patch
 
+import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant import config_entries
@@ -37,6 +38,7 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
 from homeassistant.util.signal_type import SignalTypeFormat
@@ -580,6 +582,97 @@ async def test_non_duplicate_discovery(
     assert "Component has already been discovered: binary_sensor bla" in caplog.text
 
 
+async def test_unchanged_discovery_payload_skipped(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a retained discovery payload which did not change is not processed."""
+    await mqtt_mock_entry()
+    config = '{ "name": "Beer", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", config)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+    # The broker sends the retained payload again after reconnecting
+    updates: list[MQTTDiscoveryPayload] = []
+    async_dispatcher_connect(
+        hass, MQTT_DISCOVERY_UPDATED.format("binary_sensor", "bla"), updates.append
+    )
+    async_fire_mqtt_message(
+        hass, "homeassistant/binary_sensor/bla/config", config, retain=True
+    )
+    await hass.async_block_till_done()
+    assert not updates
+    assert "Ignoring unchanged discovery payload for binary_sensor bla" in caplog.text
+
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert len(updates) == 1
+    state = hass.states.get("binary_sensor.beer")
+    assert state is not None
+    assert state.name == "Milk"
+
+    # Removing and discovering the same payload again creates the entity
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is None
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.milk") is not None
+
+
+async def test_discovered_entities_added_at_once(
+    hass: HomeAssistant,
+    mqtt_client_mock: MqttMockPahoClient,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test entities discovered in a batch of messages are added at once."""
+    await mqtt_mock_entry()
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/sensor/first/config",
+        '{ "name": "First", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.first") is not None
+
+    messages = [
+        (
+            f"homeassistant/sensor/bla{index}/config",
+            f'{{ "name": "Beer{index}", "state_topic": "test-topic" }}',
+        )
+        for index in range(3)
+    ]
+
+    def loop_read() -> int:
+        if messages:
+            async_fire_mqtt_message(hass, *messages.pop(0))
+        return paho_mqtt.MQTT_ERR_SUCCESS
+
+    mqtt_client_mock.loop_read.side_effect = loop_read
+    with patch(
+        "homeassistant.helpers.entity_platform.EntityPlatform.async_add_entities",
+        autospec=True,
+        side_effect=EntityPlatform.async_add_entities,
+    ) as mock_add_entities:
+        hass.data["mqtt"].client._async_reader_callback(mqtt_client_mock)
+        await hass.async_block_till_done()
+
+    assert mock_add_entities.call_count == 1
+    assert len(mock_add_entities.call_args[0][1]) == 3
+    for index in range(3):
+        assert hass.states.get(f"sensor.beer{index}") is not None
+
+
 async def test_removal(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -28,6 +28,7 @@ from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import (
     MessageCallbackType,
     MqttCommandTemplateException,
+    MqttData,
     MqttValueTemplateException,
     ReceiveMessage,
 )
@@ -38,6 +39,7 @@ from homeassistant.const import (
     CONF_PROTOCOL,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
@@ -59,6 +61,7 @@ from .test_common import help_all_subscribe_calls
 from tests.common import (
     MockConfigEntry,
     MockEntity,
+    async_capture_events,
     async_fire_mqtt_message,
     async_fire_time_changed,
     mock_restore_cache,
@@ -934,6 +937,124 @@ async def test_handle_logging_on_writing_the_entity_state(
         assert "Exception raised when updating state of" in caplog.text
 
 
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                "sensor": [
+                    {
+                        "name": "test-sensor",
+                        "unique_id": "test-sensor",
+                        "state_topic": "test/state",
+                        "json_attributes_topic": "test/attributes",
+                    }
+                ]
+            }
+        }
+    ],
+)
+async def test_batch_of_messages_coalesces_attribute_writes(
+    hass: HomeAssistant,
+    mock_hass_config: None,
+    mqtt_client_mock: MqttMockPahoClient,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test the attribute updates of a batch are written with the next state."""
+    await mqtt_mock_entry()
+    await hass.async_block_till_done()
+    mqtt_data: MqttData = hass.data["mqtt"]
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    messages = [
+        ("test/attributes", b'{"battery": 90}'),
+        ("test/attributes", b'{"battery": 80}'),
+        ("test/state", b"2"),
+    ]
+
+    def loop_read() -> int:
+        if messages:
+            topic, payload = messages.pop(0)
+            async_fire_mqtt_message(hass, topic, payload)
+        return paho_mqtt.MQTT_ERR_SUCCESS
+
+    mqtt_client_mock.loop_read.side_effect = loop_read
+    mqtt_data.client._async_reader_callback(mqtt_client_mock)
+
+    # Three messages and one read without a message
+    assert mqtt_client_mock.loop_read.call_count == 4
+    assert len(state_changes) == 1
+    state = hass.states.get("sensor.test_sensor")
+    assert state.state == "2"
+    assert state.attributes["battery"] == 80
+
+
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                "binary_sensor": [
+                    {
+                        "name": "test-binary-sensor",
+                        "state_topic": "test/binary_state",
+                    }
+                ],
+                "sensor": [
+                    {
+                        "name": "test-sensor",
+                        "state_topic": "test/state",
+                        "json_attributes_topic": "test/attributes",
+                        "force_update": True,
+                    }
+                ],
+            }
+        }
+    ],
+)
+async def test_batch_of_messages_writes_every_state_change(
+    hass: HomeAssistant,
+    mock_hass_config: None,
+    mqtt_client_mock: MqttMockPahoClient,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test the state changes and forced updates of a batch are all written."""
+    await mqtt_mock_entry()
+    await hass.async_block_till_done()
+    mqtt_data: MqttData = hass.data["mqtt"]
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    messages = [
+        ("test/binary_state", b"ON"),
+        ("test/attributes", b'{"battery": 90}'),
+        ("test/binary_state", b"OFF"),
+        ("test/attributes", b'{"battery": 80}'),
+    ]
+
+    def loop_read() -> int:
+        if messages:
+            topic, payload = messages.pop(0)
+            async_fire_mqtt_message(hass, topic, payload)
+        return paho_mqtt.MQTT_ERR_SUCCESS
+
+    mqtt_client_mock.loop_read.side_effect = loop_read
+    mqtt_data.client._async_reader_callback(mqtt_client_mock)
+
+    assert [
+        (event.data["entity_id"], event.data["new_state"].state)
+        for event in state_changes
+        if event.data["entity_id"] == "binary_sensor.test_binary_sensor"
+    ] == [
+        ("binary_sensor.test_binary_sensor", "on"),
+        ("binary_sensor.test_binary_sensor", "off"),
+    ]
+    assert [
+        event.data["new_state"].attributes["battery"]
+        for event in state_changes
+        if event.data["entity_id"] == "sensor.test_sensor"
+    ] == [90, 80]
+
+
 async def test_receiving_non_utf8_message_gets_logged(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1158,6 +1279,42 @@ async def test_subscribe_topic_level_wildcard(
     assert calls[0].payload == "test-payload"
 
 
+@patch("homeassistant.components.mqtt.client.MATCHING_SUBSCRIPTIONS_CACHE_SIZE", 2)
+async def test_matching_subscriptions_cache(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test the cache of matching subscriptions is bounded and invalidated."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
+
+    # Evicts test-topic/a/on from the cache
+    for topic in ("test-topic/a/on", "test-topic/b/on", "test-topic/c/on"):
+        async_fire_mqtt_message(hass, topic, "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/a/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    # A new wildcard subscription invalidates the cached topics
+    unsub = await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    async_fire_mqtt_message(hass, "test-topic/c/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 6
+
+    # A simple subscription only invalidates its own topic
+    await mqtt.async_subscribe(hass, "test-topic/c/on", record_calls)
+    async_fire_mqtt_message(hass, "test-topic/c/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 9
+
+    unsub()
+    async_fire_mqtt_message(hass, "test-topic/c/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 11
+
+
 async def test_subscribe_topic_level_wildcard_no_subtree_match(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
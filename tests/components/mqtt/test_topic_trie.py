@@ -0,0 +1,81 @@
+"""The tests for the MQTT topic trie."""
+
+from paho.mqtt.matcher import MQTTMatcher
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+FILTERS = [
+    "#",
+    "+",
+    "+/+",
+    "/+",
+    "+/#",
+    "sport/#",
+    "sport/+",
+    "sport/tennis/#",
+    "sport/tennis/+",
+    "sport/tennis/player1",
+    "sport/+/player1",
+    "+/tennis/#",
+    "$SYS/#",
+    "$SYS/+/clients",
+    "homeassistant/+/+/config",
+]
+
+TOPICS = [
+    "sport",
+    "sport/",
+    "/sport",
+    "sport/tennis",
+    "sport/tennis/player1",
+    "sport/tennis/player1/ranking",
+    "sport/golf/player1",
+    "/",
+    "$SYS",
+    "$SYS/broker/clients",
+    "$SYS/monitor/clients/total",
+    "homeassistant/sensor/temperature/config",
+    "homeassistant/sensor/config",
+    "other",
+]
+
+
+@pytest.mark.parametrize("topic", TOPICS)
+def test_match_like_paho(topic: str) -> None:
+    """Test the trie matches the same filters as the paho matcher."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in FILTERS:
+        trie.add(topic_filter, topic_filter)
+
+    matches = trie.match(topic)
+    assert len(matches) == len(set(matches))
+    expected = set()
+    for topic_filter in FILTERS:
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = topic_filter
+        expected.update(matcher.iter_match(topic))
+    assert set(matches) == expected
+
+
+def test_multiple_values_and_remove() -> None:
+    """Test a filter can hold several values and removing prunes the tree."""
+    trie: TopicTrie[int] = TopicTrie()
+    trie.add("sport/+/player1", 1)
+    trie.add("sport/+/player1", 2)
+    trie.add("sport/#", 3)
+
+    assert trie.match("sport/tennis/player1") == [3, 1, 2]
+
+    trie.remove("sport/+/player1", 1)
+    assert trie.match("sport/tennis/player1") == [3, 2]
+
+    trie.remove("sport/+/player1", 2)
+    trie.remove("sport/#", 3)
+    assert trie.match("sport/tennis/player1") == []
+    assert not trie._root.children
+
+    with pytest.raises(ValueError):
+        trie.remove("sport/#", 3)
+    with pytest.raises(ValueError):
+        trie.remove("sport/+/player2", 1)
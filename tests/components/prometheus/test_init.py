@@ -36,6 +36,7 @@ from homeassistant.components.climate import (
     ATTR_TARGET_TEMP_LOW,
 )
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES
+from homeassistant.components.prometheus.exposition import MetricsExposition
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import (
     ATTR_BATTERY_LEVEL,
@@ -2061,3 +2062,61 @@ async def test_filtered_denylist(
         was_called = mock_client.labels.call_count == 1
         assert test.should_pass == was_called
         mock_client.labels.reset_mock()
+
+
+def test_exposition_renders_changed_families() -> None:
+    """Test the exposition only renders the changed metric families again."""
+    registry = prometheus_client.CollectorRegistry(auto_describe=True)
+    labels = ["entity", "friendly_name", "domain"]
+    gauge = prometheus_client.Gauge(
+        "test_gauge", "A gauge\nwith \\ escapes", labels, registry=registry
+    )
+    counter = prometheus_client.Counter(
+        "test_counter", "A counter", [*labels, "mode"], registry=registry
+    )
+    exposition = MetricsExposition()
+    exposition.add_metric(gauge)
+    exposition.add_metric(counter)
+
+    assert exposition.generate() == prometheus_client.generate_latest(registry)
+
+    gauge.labels(entity="sensor.one", friendly_name="One", domain="sensor").set(1.5)
+    counter.labels(
+        entity="sensor.one", friendly_name="One", domain="sensor", mode="a"
+    ).inc()
+    exposition.invalidate(gauge)
+    exposition.invalidate(counter)
+    assert exposition.generate() == prometheus_client.generate_latest(registry)
+
+    gauge.labels(entity="sensor.one", friendly_name="One", domain="sensor").set(
+        float("inf")
+    )
+    exposition.invalidate(gauge)
+    with mock.patch(
+        "homeassistant.components.prometheus.exposition.generate_latest",
+        wraps=prometheus_client.generate_latest,
+    ) as generate_latest:
+        assert exposition.generate() == prometheus_client.generate_latest(registry)
+    assert generate_latest.call_count == 1
+
+    gauge.remove("sensor.one", "One", "sensor")
+    exposition.invalidate(gauge)
+    assert exposition.generate() == prometheus_client.generate_latest(registry)
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_compression(
+    client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
+) -> None:
+    """Test the metrics are compressed when the client accepts it."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    body = await resp.text()
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body.split("\n")
+    )
@@ -592,6 +592,63 @@ async def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1024])
+async def test_stream_significant_states(
+    hass: HomeAssistant, minimal_response: bool, chunk_size: int
+) -> None:
+    """Test streaming significant states yields the same states in chunks."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids=list(states),
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+    chunks = list(
+        history.stream_significant_states(
+            hass,
+            zero,
+            four,
+            entity_ids=list(states),
+            minimal_response=minimal_response,
+            compressed_state_format=True,
+            chunk_size=chunk_size,
+        )
+    )
+    assert all(
+        sum(len(entity_states) for entity_states in chunk.values()) <= chunk_size
+        for chunk in chunks
+    )
+    assert all(
+        sum(len(entity_states) for entity_states in chunk.values()) == chunk_size
+        for chunk in chunks[:-1]
+    )
+    streamed: dict[str, list] = {}
+    for chunk in chunks:
+        for entity_id, entity_states in chunk.items():
+            streamed.setdefault(entity_id, []).extend(entity_states)
+    assert streamed == hist
+
+
+async def test_stream_significant_states_non_existent_entity_ids(
+    hass: HomeAssistant,
+) -> None:
+    """Test streaming significant states for unknown entities yields nothing."""
+    assert (
+        list(
+            history.stream_significant_states(
+                hass, dt_util.utcnow(), entity_ids=["sensor.not_real"]
+            )
+        )
+        == []
+    )
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 async def test_get_significant_states_with_initial(
     time_zone, hass: HomeAssistant
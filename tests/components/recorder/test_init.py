@@ -396,11 +396,12 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        # States are either added to the session or inserted in bulk
+        if instance.states_manager._pending_inserts or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -439,11 +440,12 @@ async def test_saving_state_with_sqlalchemy_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        # States are either added to the session or inserted in bulk
+        if instance.states_manager._pending_inserts or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -1467,6 +1469,62 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
+async def test_saving_sets_old_state_many_per_commit(
+    hass: HomeAssistant, setup_recorder: None, bulk_insert_states: bool
+) -> None:
+    """Test saving sets old state with many states per entity in a commit."""
+    instance = get_instance(hass)
+    instance._bulk_insert_states = bulk_insert_states
+    hass.states.async_set("test.one", "s1", {})
+    hass.states.async_set("test.one", "s2", {"attr": 1})
+    hass.states.async_set("test.two", "s3", {})
+    hass.states.async_set("test.one", "s4", {"attr": 2})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s5", {})
+    hass.states.async_set("test.two", "s6", {})
+    hass.states.async_set("test.two", "s7", {"attr": 1})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes,
+                States.attributes_id == StateAttributes.attributes_id,
+            )
+        )
+        assert len(states) == 7
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id is None
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state["s6"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s7"].old_state_id == states_by_state["s6"].state_id
+
+        for state, entity_id, shared_attrs in (
+            ("s1", "test.one", "{}"),
+            ("s2", "test.one", '{"attr":1}'),
+            ("s3", "test.two", "{}"),
+            ("s4", "test.one", '{"attr":2}'),
+            ("s5", "test.one", "{}"),
+            ("s6", "test.two", "{}"),
+            ("s7", "test.two", '{"attr":1}'),
+        ):
+            assert states_by_state[state].entity_id == entity_id
+            assert states_by_state[state].shared_attrs == shared_attrs
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 from freezegun import freeze_time
 import pytest
+from sqlalchemy import func
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
@@ -14,6 +15,7 @@ from voluptuous.error import MultipleInvalid
 from homeassistant.components import recorder
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
+    EventData,
     Events,
     EventTypes,
     RecorderRuns,
@@ -104,6 +106,150 @@ async def test_purge_big_database(
         assert state_attributes.count() == 1
 
 
+async def test_purge_states_and_events_by_id_range(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging the oldest states and events by id range."""
+    instance = await async_setup_recorder_instance(hass)
+    utcnow = dt_util.utcnow()
+
+    with freeze_time() as freezer:
+        for days_ago in (12, 11, 10, 9, 8, 1):
+            freezer.move_to(utcnow - timedelta(days=days_ago))
+            for idx in range(4):
+                hass.states.async_set(
+                    f"test.entity_{idx}", f"state_{days_ago}", {"days_ago": days_ago}
+                )
+                hass.bus.async_fire("test_event", {"days_ago": days_ago})
+            await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        # Remove the events fired while the recorder started up at the
+        # current time so the test events are the oldest ones
+        session.query(Events).filter(
+            Events.time_fired_ts > (utcnow - timedelta(hours=1)).timestamp()
+        ).delete()
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 24
+        assert session.query(Events).count() == 24
+        assert session.query(StateAttributes).count() == 6
+        assert (
+            session.query(EventData)
+            .filter(EventData.shared_data.like("%days_ago%"))
+            .count()
+            == 6
+        )
+
+    with (
+        patch.object(instance, "max_bind_vars", 8),
+        patch.object(instance.database_engine, "max_bind_vars", 8),
+        patch(
+            "homeassistant.components.recorder.purge._select_state_attributes_ids_to_purge",
+            wraps=recorder.purge._select_state_attributes_ids_to_purge,
+        ) as select_state_ids_mock,
+        patch(
+            "homeassistant.components.recorder.purge._select_event_data_ids_to_purge",
+            wraps=recorder.purge._select_event_data_ids_to_purge,
+        ) as select_event_ids_mock,
+        session_scope(hass=hass) as session,
+    ):
+        finished = purge_old_data(
+            instance,
+            utcnow - timedelta(days=5),
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        assert not finished
+        # The first 8 states and events are removed as one range
+        assert session.query(States).count() == 16
+        assert session.query(Events).count() == 16
+        assert session.query(StateAttributes).count() == 4
+        assert (
+            session.query(EventData)
+            .filter(EventData.shared_data.like("%days_ago%"))
+            .count()
+            == 4
+        )
+        assert select_state_ids_mock.call_count == 0
+        assert select_event_ids_mock.call_count == 0
+
+        for _ in range(5):
+            if purge_old_data(
+                instance,
+                utcnow - timedelta(days=5),
+                states_batch_size=1,
+                events_batch_size=1,
+                repack=False,
+            ):
+                break
+        else:
+            pytest.fail("Purge did not finish")
+
+        states = session.query(States).all()
+        assert [state.state for state in states] == ["state_1"] * 4
+        # The states are disconnected from the purged old states
+        assert all(state.old_state_id is None for state in states)
+        assert session.query(Events).count() == 4
+        assert session.query(StateAttributes).count() == 1
+        assert (
+            session.query(EventData)
+            .filter(EventData.shared_data.like("%days_ago%"))
+            .count()
+            == 1
+        )
+
+
+async def test_purge_by_id_range_keeps_rows_without_timestamp(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the id range purge keeps states and events without a timestamp."""
+    instance = await async_setup_recorder_instance(hass)
+    utcnow = dt_util.utcnow()
+
+    with freeze_time(utcnow - timedelta(days=10)):
+        for idx in range(4):
+            hass.states.async_set(f"test.entity_{idx}", "old")
+            hass.bus.async_fire("test_event", {"idx": idx})
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        session.query(Events).filter(
+            Events.time_fired_ts > (utcnow - timedelta(hours=1)).timestamp()
+        ).delete()
+        first_state_id = session.query(func.min(States.state_id)).scalar()
+        session.query(States).filter(States.state_id == first_state_id).update(
+            {States.last_updated_ts: None}
+        )
+        first_event_id = session.query(func.min(Events.event_id)).scalar()
+        session.query(Events).filter(Events.event_id == first_event_id).update(
+            {Events.time_fired_ts: None}
+        )
+
+    with (
+        patch.object(instance, "max_bind_vars", 8),
+        patch.object(instance.database_engine, "max_bind_vars", 8),
+        session_scope(hass=hass) as session,
+    ):
+        for _ in range(5):
+            if purge_old_data(
+                instance,
+                utcnow - timedelta(days=5),
+                states_batch_size=1,
+                events_batch_size=1,
+                repack=False,
+            ):
+                break
+        else:
+            pytest.fail("Purge did not finish")
+
+        states = session.query(States).all()
+        assert [state.state_id for state in states] == [first_state_id]
+        events = session.query(Events).all()
+        assert [event.event_id for event in events] == [first_event_id]
+
+
 async def test_purge_old_states(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
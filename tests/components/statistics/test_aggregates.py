@@ -0,0 +1,70 @@
+"""Test the incrementally maintained aggregates of the statistics sensor."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import math
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.aggregates import (
+    RunningArea,
+    RunningDifferences,
+    RunningSum,
+    RunningVariance,
+    SortedWindow,
+    WindowAggregate,
+)
+from homeassistant.util import dt as dt_util
+
+VALUES = [1.0, 2.0, math.inf, 3.0, -math.inf, 4.0, math.nan, 5.0, 6.0, 7.0, 9.0]
+
+
+@pytest.mark.parametrize(
+    ("factory", "read", "reference"),
+    [
+        (RunningSum, lambda aggregate: aggregate.value, math.fsum),
+        (RunningVariance, lambda aggregate: aggregate.variance, statistics.variance),
+        (
+            RunningDifferences,
+            lambda aggregate: aggregate.absolute,
+            lambda values: sum(
+                abs(j - i) for i, j in zip(values, values[1:], strict=False)
+            ),
+        ),
+        (
+            lambda: RunningArea(linear=False),
+            lambda aggregate: aggregate.area,
+            lambda values: sum(values[:-1]) * 60,
+        ),
+        (SortedWindow, lambda aggregate: aggregate.median, statistics.median),
+    ],
+)
+def test_aggregates_recover_from_non_finite_values(
+    factory: Callable[[], WindowAggregate],
+    read: Callable[[WindowAggregate], float],
+    reference: Callable[[list[float]], float],
+) -> None:
+    """Test the aggregates recover once non-finite samples leave the window."""
+    sampling_size = 3
+    aggregate = factory()
+    states: deque[float] = deque()
+    ages: deque[datetime] = deque()
+    start = dt_util.utcnow()
+
+    for idx, value in enumerate(VALUES):
+        if len(states) == sampling_size:
+            aggregate.remove(states, ages)
+            states.popleft()
+            ages.popleft()
+        states.append(value)
+        ages.append(start + timedelta(minutes=idx))
+        aggregate.add(states, ages)
+        if len(states) < 2 or not all(math.isfinite(state) for state in states):
+            continue
+        assert read(aggregate) == pytest.approx(
+            reference(list(states))
+        ), f"value mismatch on {list(states)}"
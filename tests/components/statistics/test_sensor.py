@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from datetime import datetime, timedelta
 import statistics
 from typing import Any
@@ -1432,6 +1432,71 @@ async def test_state_characteristic_mean_circular(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("characteristic", "reference"),
+    [
+        ("mean", statistics.mean),
+        ("median", statistics.median),
+        ("percentile", lambda values: statistics.quantiles(values, n=100)[49]),
+        ("standard_deviation", statistics.stdev),
+        ("variance", statistics.variance),
+        ("value_max", max),
+        ("value_min", min),
+        ("distance_absolute", lambda values: max(values) - min(values)),
+        ("sum", sum),
+        (
+            "sum_differences",
+            lambda values: sum(
+                abs(j - i) for i, j in zip(values, values[1:], strict=False)
+            ),
+        ),
+        (
+            "sum_differences_nonnegative",
+            lambda values: sum(
+                j - i if j >= i else j for i, j in zip(values, values[1:], strict=False)
+            ),
+        ),
+    ],
+)
+async def test_state_characteristics_sliding_window(
+    hass: HomeAssistant,
+    characteristic: str,
+    reference: Callable[[list[float]], float],
+) -> None:
+    """Test the incrementally maintained characteristics on a sliding buffer."""
+    sampling_size = 4
+    values = [*VALUES_NUMERIC, -3, *reversed(VALUES_NUMERIC), 1e6, 2, -2, 2]
+
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": sampling_size,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for idx, value in enumerate(values):
+        hass.states.async_set("sensor.test_monitored", str(value))
+        await hass.async_block_till_done()
+        window = values[max(0, idx + 1 - sampling_size) : idx + 1]
+        if len(window) < 2:
+            continue
+        state = hass.states.get("sensor.test")
+        assert state is not None
+        assert float(state.state) == pytest.approx(
+            round(reference(window), 2), abs=0.01
+        ), f"value mismatch for characteristic '{characteristic}' on {window}"
+
+
 async def test_invalid_state_characteristic(hass: HomeAssistant) -> None:
     """Test the detection of wrong state_characteristics selected."""
     assert await async_setup_component(
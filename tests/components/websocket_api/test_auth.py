@@ -1,6 +1,7 @@
 """Test auth of websocket API."""
 
 from unittest.mock import patch
+import zlib
 
 import aiohttp
 from aiohttp import WSMsgType
@@ -16,6 +17,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import (
+    FEATURE_COMPRESSED_MESSAGES,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
     URL,
@@ -23,6 +25,7 @@ from homeassistant.components.websocket_api.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.setup import async_setup_component
+from homeassistant.util.json import json_loads
 
 from tests.typing import ClientSessionGenerator
 
@@ -129,6 +132,52 @@ async def test_auth_active_with_token(
     assert auth_msg["type"] == TYPE_AUTH_OK
 
 
+@pytest.mark.parametrize("compress", [0, 15])
+async def test_auth_with_compressed_messages(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+    compress: int,
+) -> None:
+    """Test large messages are compressed when requested during auth."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    await hass.async_block_till_done()
+    for idx in range(200):
+        hass.states.async_set(f"sensor.test_{idx}", "on", {"data": "x" * 1024})
+
+    client = await hass_client_no_auth()
+    async with client.ws_connect(URL, compress=compress) as ws:
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_REQUIRED
+
+        await ws.send_json(
+            {
+                "type": TYPE_AUTH,
+                "access_token": hass_access_token,
+                "supported_features": {FEATURE_COMPRESSED_MESSAGES: 1},
+            }
+        )
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_OK
+
+        await ws.send_json({"id": 1, "type": "ping"})
+        msg = await ws.receive()
+        assert msg.type == WSMsgType.TEXT
+        assert json_loads(msg.data) == {"id": 1, "type": "pong"}
+
+        await ws.send_json({"id": 2, "type": "get_states"})
+        msg = await ws.receive()
+        if compress:
+            # permessage-deflate already compresses every frame
+            assert msg.type == WSMsgType.TEXT
+            result = json_loads(msg.data)
+        else:
+            assert msg.type == WSMsgType.BINARY
+            result = json_loads(zlib.decompress(msg.data))
+        assert result["id"] == 2
+        assert len(result["result"]) == 200
+
+
 async def test_auth_active_user_inactive(
     hass: HomeAssistant,
     hass_client_no_auth: ClientSessionGenerator,
@@ -5,6 +5,7 @@ from copy import deepcopy
 import logging
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -32,6 +33,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1027,6 +1029,82 @@ async def test_subscribe_entities_with_unserializable_state(
     }
 
 
+async def test_subscribe_entities_coalesce(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test subscribe entities merges changes while the client is behind."""
+    hass.states.async_set("light.kitchen", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.removed"}
+
+    with patch.object(const, "COALESCE_ENTITIES_PENDING_MSG", -1):
+        hass.states.async_set("light.kitchen", "on", {"color": "blue"})
+        hass.states.async_set("light.kitchen", "on", {"color": "green"})
+        hass.states.async_set("light.kitchen", "off", {"color": "green"})
+        hass.states.async_set("light.added", "on")
+        hass.states.async_set("light.added", "off")
+        hass.states.async_remove("light.removed")
+        hass.states.async_set("light.temporary", "on")
+        hass.states.async_remove("light.temporary")
+        await hass.async_block_till_done()
+
+        # Still behind, nothing is sent
+        freezer.tick(const.COALESCE_ENTITIES_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    freezer.tick(const.COALESCE_ENTITIES_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}},
+        "c": {
+            "light.kitchen": {
+                "+": {"a": {"color": "green"}, "c": ANY},
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    # Caught up, changes are sent as they happen again
+    hass.states.async_set("light.kitchen", "on", {"color": "green"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+
+    # Changes which cancel out are not sent
+    with patch.object(const, "COALESCE_ENTITIES_PENDING_MSG", -1):
+        hass.states.async_set("light.temporary", "on")
+        hass.states.async_remove("light.temporary")
+        await hass.async_block_till_done()
+    freezer.tick(const.COALESCE_ENTITIES_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+
 async def test_subscribe_unsubscribe_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2511,6 +2589,43 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_setup_report(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the integration setup report command."""
+    report = {
+        "seconds": 3.5,
+        "critical_path": ["http", "august"],
+        "integrations": {
+            "august": {
+                "started": 0.0,
+                "finished": 3.5,
+                "import_seconds": 0.5,
+                "setup_seconds": 1.0,
+            },
+            "http": {
+                "started": 0.0,
+                "finished": 2.0,
+                "import_seconds": 0.1,
+                "setup_seconds": 1.9,
+            },
+        },
+    }
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_setup_report",
+        return_value=report,
+    ):
+        await websocket_client.send_json({"id": 7, "type": "integration/setup_report"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == report
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
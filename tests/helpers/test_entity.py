@@ -2641,3 +2641,106 @@ async def test_async_write_ha_state_thread_safety_custom_component(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_cache_calculated_state(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the calculated state is reused until an _attr_ property changes."""
+
+    class CachedStateEntity(entity.Entity):
+        """Entity which caches its calculated state."""
+
+        _cache_calculated_state = True
+        _attr_name = "Cached"
+        _attr_state = "on"
+        _attr_unique_id = "cached"
+
+    platform = MockEntityPlatform(hass)
+    ent = CachedStateEntity()
+    await platform.async_add_entities([ent])
+    state = hass.states.get(ent.entity_id)
+    assert state.state == "on"
+    last_reported = state.last_reported
+    freezer.tick(1)
+
+    with patch.object(
+        ent,
+        "_Entity__async_calculate_state",
+        wraps=ent._Entity__async_calculate_state,
+    ) as mock_calculate:
+        ent.async_write_ha_state()
+        assert mock_calculate.call_count == 0
+        # The write is still reported
+        assert hass.states.get(ent.entity_id).last_reported > last_reported
+
+        # Setting an equal value keeps the calculated state
+        ent._attr_state = "on"
+        ent.async_write_ha_state()
+        assert mock_calculate.call_count == 0
+
+        ent._attr_state = "off"
+        ent._attr_extra_state_attributes = {"level": 5}
+        ent.async_write_ha_state()
+        assert mock_calculate.call_count == 1
+        state = hass.states.get(ent.entity_id)
+        assert state.state == "off"
+        assert state.attributes["level"] == 5
+
+        # Changing the registry entry calculates the state again
+        entity_registry.async_update_entity(ent.entity_id, name="Renamed")
+        await hass.async_block_till_done()
+        assert mock_calculate.call_count == 2
+        assert hass.states.get(ent.entity_id).name == "Renamed"
+
+        ent.async_write_ha_state()
+        assert mock_calculate.call_count == 2
+
+
+async def test_cache_calculated_state_availability(hass: HomeAssistant) -> None:
+    """Test the calculated state is not reused when the availability changes."""
+
+    class CachedStateEntity(entity.Entity):
+        """Entity which caches its calculated state."""
+
+        _cache_calculated_state = True
+        _attr_state = "on"
+        online = True
+
+        @property
+        def available(self) -> bool:
+            """Return if the entity is available."""
+            return self.online
+
+    platform = MockEntityPlatform(hass)
+    ent = CachedStateEntity()
+    ent.entity_id = "test.cached"
+    await platform.async_add_entities([ent])
+    assert hass.states.get(ent.entity_id).state == "on"
+
+    ent.online = False
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == STATE_UNAVAILABLE
+
+    ent.online = True
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == "on"
+
+
+async def test_calculated_state_not_cached_by_default(hass: HomeAssistant) -> None:
+    """Test the state is calculated on each write unless the entity opts in."""
+    platform = MockEntityPlatform(hass)
+    ent = entity.Entity()
+    ent.entity_id = "test.not_cached"
+    await platform.async_add_entities([ent])
+
+    with patch.object(
+        ent,
+        "_Entity__async_calculate_state",
+        wraps=ent._Entity__async_calculate_state,
+    ) as mock_calculate:
+        ent.async_write_ha_state()
+        ent.async_write_ha_state()
+    assert mock_calculate.call_count == 2
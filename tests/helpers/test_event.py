@@ -955,6 +955,69 @@ async def test_track_template_time_change(
     unsub()
 
 
+async def test_track_template_result_state_values_only(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test templates that only read state values skip attribute-only changes."""
+    hass.states.async_set("sensor.power", "1", {"unit": "W"})
+    hass.states.async_set("sensor.other", "1", {"unit": "W"})
+    state_template = Template(
+        "{{ states('sensor.power') }}"
+        "{% for state in states.sensor %}{{ state.state }}{% endfor %}",
+        hass,
+    )
+    attribute_template = Template("{{ state_attr('sensor.power', 'unit') }}", hass)
+    loop_attribute_template = Template(
+        "{% for state in states.sensor %}{{ state.attributes.unit }}{% endfor %}",
+        hass,
+    )
+    runs: list[TrackTemplateResult] = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend(updates)
+
+    infos = [
+        async_track_template_result(
+            hass, [TrackTemplate(template, None)], refresh_listener
+        )
+        for template in (state_template, attribute_template, loop_attribute_template)
+    ]
+    await hass.async_block_till_done()
+    runs.clear()
+    state_renders = state_template._renders
+    attribute_renders = attribute_template._renders
+
+    hass.states.async_set("sensor.power", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert state_template._renders == state_renders
+    assert attribute_template._renders > attribute_renders
+    assert [(run.template, run.result) for run in runs] == [
+        (attribute_template, "kW"),
+        (loop_attribute_template, "kWW"),
+    ]
+
+    hass.states.async_set("sensor.other", "1", {"unit": "kW"})
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert state_template._renders == state_renders
+    assert runs[-1].template is loop_attribute_template
+    assert runs[-1].result == "kWkW"
+
+    hass.states.async_set("sensor.power", "2", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert state_template._renders > state_renders
+    assert runs[-1].template is state_template
+    assert runs[-1].result == 221
+
+    for info in infos:
+        info.async_remove()
+
+
 async def test_track_template_result(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
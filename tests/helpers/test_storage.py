@@ -20,7 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1177,3 +1177,278 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_writes_are_batched_and_unchanged_data_skipped(
+    tmpdir: py.path.local,
+) -> None:
+    """Test writes of several stores share an executor job and skip unchanged data."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_1 = storage.Store(hass, MOCK_VERSION, "store_1")
+        store_2 = storage.Store(hass, MOCK_VERSION, "store_2", atomic_writes=True)
+        manager = storage.get_internal_store_manager(hass)
+
+        with (
+            patch.object(
+                manager, "_run_writes", wraps=manager._run_writes
+            ) as mock_run_writes,
+            patch(
+                "homeassistant.helpers.storage.write_utf8_file",
+                wraps=storage.write_utf8_file,
+            ) as mock_write,
+            patch(
+                "homeassistant.helpers.storage.write_utf8_file_atomic",
+                wraps=storage.write_utf8_file_atomic,
+            ) as mock_write_atomic,
+        ):
+            await asyncio.gather(
+                store_1.async_save(MOCK_DATA), store_2.async_save(MOCK_DATA2)
+            )
+            assert mock_run_writes.call_count == 1
+            assert len(mock_run_writes.call_args[0][0]) == 2
+            assert mock_write.call_count == 1
+            assert mock_write_atomic.call_count == 1
+
+            # Saving the same data again does not write the file
+            await store_1.async_save(MOCK_DATA)
+            assert mock_run_writes.call_count == 2
+            assert mock_write.call_count == 1
+
+            # Changed data is written
+            await store_1.async_save(MOCK_DATA2)
+            assert mock_write.call_count == 2
+
+            # The file is written again when it was removed
+            await hass.async_add_executor_job(os.unlink, store_1.path)
+            await store_1.async_save(MOCK_DATA2)
+            assert mock_write.call_count == 3
+
+        assert await store_1.async_load() == MOCK_DATA2
+        assert await store_2.async_load() == MOCK_DATA2
+
+        await hass.async_stop(force=True)
+
+
+async def test_batched_write_errors_are_raised_per_store(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing write in a batch does not fail the other writes."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_1 = storage.Store(hass, MOCK_VERSION, "store_1")
+        store_2 = storage.Store(hass, MOCK_VERSION, "store_2")
+
+        def data_func() -> dict[str, Any]:
+            raise ValueError("Boom")
+
+        store_1.async_delay_save(data_func)
+        with pytest.raises(ValueError, match="Boom"):
+            await asyncio.gather(
+                store_1._async_handle_write_data(), store_2.async_save(MOCK_DATA)
+            )
+        await hass.async_block_till_done()
+
+        assert await store_2.async_load() == MOCK_DATA
+        assert not os.path.exists(store_1.path)
+
+        await hass.async_stop(force=True)
+
+
+class MockJournaledStore(storage.JournaledStore):
+    """Journaled store with one collection."""
+
+    journal_collections = ("items",)
+
+
+async def test_journaled_store(tmpdir: py.path.local) -> None:
+    """Test a journaled store appends changes and replays them on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY, atomic_writes=True)
+        items = {
+            item_id: json_fragment(json_bytes({"id": item_id, "name": item_id}))
+            for item_id in ("a", "b", "c", "d", "e")
+        }
+
+        def data_func() -> dict[str, Any]:
+            return {"items": list(items.values()), "other": "value"}
+
+        def read_file(path: str) -> bytes:
+            with open(path, "rb") as file:
+                return file.read()
+
+        # The first write is a snapshot
+        store.async_delay_save(data_func)
+        await store._async_handle_write_data()
+        snapshot = await hass.async_add_executor_job(read_file, store.path)
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        # Later writes only append the changes to the journal
+        items["b"] = json_fragment(json_bytes({"id": "b", "name": "renamed"}))
+        del items["c"]
+        store.async_delay_save(data_func)
+        await store._async_handle_write_data()
+        items["f"] = json_fragment(json_bytes({"id": "f", "name": "f"}))
+        store.async_delay_save(data_func)
+        await store._async_handle_write_data()
+
+        assert await hass.async_add_executor_job(read_file, store.path) == snapshot
+        journal = await hass.async_add_executor_job(read_file, store.journal_path)
+        assert [json.loads(line) for line in journal.splitlines()[1:]] == [
+            {"collection": "items", "id": "b", "item": {"id": "b", "name": "renamed"}},
+            {"collection": "items", "id": "c", "item": None},
+            {"collection": "items", "id": "f", "item": {"id": "f", "name": "f"}},
+        ]
+
+        # Loading replays the journal, an incomplete record is ignored
+        def append_partial_record() -> None:
+            with open(store.journal_path, "ab") as file:
+                file.write(b'{"collection": "items", "id": "a", "it')
+
+        await hass.async_add_executor_job(append_partial_record)
+        expected = {
+            "items": [
+                {"id": "a", "name": "a"},
+                {"id": "b", "name": "renamed"},
+                {"id": "d", "name": "d"},
+                {"id": "e", "name": "e"},
+                {"id": "f", "name": "f"},
+            ],
+            "other": "value",
+        }
+        loaded_store = MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await loaded_store.async_load() == expected
+
+        # Writing a new snapshot removes the journal
+        loaded_store.async_delay_save(lambda: expected)
+        await loaded_store._async_handle_write_data()
+        assert not await hass.async_add_executor_job(
+            os.path.exists, loaded_store.journal_path
+        )
+        assert (
+            await MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY).async_load()
+            == expected
+        )
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_ignores_stale_journal(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a journal written for another snapshot is not replayed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        items = [json_fragment(json_bytes({"id": item_id})) for item_id in "abc"]
+        store.async_delay_save(lambda: {"items": items})
+        await store._async_handle_write_data()
+        store.async_delay_save(lambda: {"items": items[:2]})
+        await store._async_handle_write_data()
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        # The journal is still replayed after the snapshot was copied,
+        # for example when a backup was restored
+        await hass.async_add_executor_job(os.utime, store.path, (0, 0))
+        assert await MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY).async_load() == {
+            "items": [{"id": "a"}, {"id": "b"}]
+        }
+        assert "Discarding the journal" not in caplog.text
+
+        # The snapshot was replaced without removing the journal
+        await hass.async_add_executor_job(
+            storage.write_utf8_file,
+            store.path,
+            json_bytes(
+                {
+                    "version": MOCK_VERSION,
+                    "minor_version": 1,
+                    "key": MOCK_KEY,
+                    "data": {"items": [{"id": "x"}]},
+                }
+            ),
+            False,
+            "wb",
+        )
+
+        loaded_store = MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await loaded_store.async_load() == {"items": [{"id": "x"}]}
+        assert (
+            f"Discarding the journal of {MOCK_KEY} as it was written for another"
+            " snapshot" in caplog.text
+        )
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_snapshots_other_changes(
+    tmpdir: py.path.local,
+) -> None:
+    """Test a change of a value which is not journaled writes a snapshot."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        items = [json_fragment(json_bytes({"id": item_id})) for item_id in "abc"]
+        store.async_delay_save(lambda: {"items": items, "other": "value"})
+        await store._async_handle_write_data()
+        store.async_delay_save(lambda: {"items": items[:2], "other": "value"})
+        await store._async_handle_write_data()
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        store.async_delay_save(lambda: {"items": items[:2], "other": "changed"})
+        await store._async_handle_write_data()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        assert await MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY).async_load() == {
+            "items": [{"id": "a"}, {"id": "b"}],
+            "other": "changed",
+        }
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_compaction(tmpdir: py.path.local) -> None:
+    """Test a journaled store writes a snapshot when the journal grows large."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        items = [json_fragment(json_bytes({"id": item_id})) for item_id in "abcdef"]
+        store.async_delay_save(lambda: {"items": list(items)})
+        await store._async_handle_write_data()
+
+        with patch.object(storage, "JOURNAL_MIN_COMPACT_SIZE", 0):
+            # A change to a single item is journaled
+            items[0] = json_fragment(json_bytes({"id": "a", "name": "a"}))
+            store.async_delay_save(lambda: {"items": list(items)})
+            await store._async_handle_write_data()
+            assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+            # The journal is now larger than a quarter of the snapshot
+            items[1] = json_fragment(json_bytes({"id": "b", "name": "b"}))
+            store.async_delay_save(lambda: {"items": list(items)})
+            await store._async_handle_write_data()
+            assert not await hass.async_add_executor_job(
+                os.path.exists, store.journal_path
+            )
+
+        # Changing most items writes a snapshot
+        items[2:] = [
+            json_fragment(json_bytes({"id": item_id, "name": item_id}))
+            for item_id in "cdef"
+        ]
+        store.async_delay_save(lambda: {"items": list(items)})
+        await store._async_handle_write_data()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        assert await MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY).async_load() == {
+            "items": [{"id": item_id, "name": item_id} for item_id in "abcdef"]
+        }
+
+        await hass.async_stop(force=True)
@@ -4389,6 +4389,34 @@ def test_async_render_to_info_with_branching(hass: HomeAssistant) -> None:
     assert info.rate_limit is None
 
 
+def test_async_render_to_info_state_values_only(hass: HomeAssistant) -> None:
+    """Test async_render_to_info tracks if only state values were read."""
+    hass.states.async_set("light.a", "on", {"brightness": 100})
+    hass.states.async_set("light.b", "off")
+
+    for template_str in (
+        "{{ states('light.a') }}",
+        "{{ states.light.a.state }}",
+        "{{ is_state('light.a', 'on') }}",
+        "{% for state in states.light %}{{ state.state }}{% endfor %}",
+        "{{ states.light | map(attribute='state') | list }}",
+    ):
+        info = render_to_info(hass, template_str)
+        assert info.state_values_only is True, template_str
+
+    for template_str in (
+        "{{ state_attr('light.a', 'brightness') }}",
+        "{{ states.light.a.last_changed }}",
+        "{{ states.light.a }}",
+        "{% for state in states.light %}{{ state.name }}{% endfor %}",
+        "{{ states.light | map(attribute='attributes') | list }}",
+        "{{ states.light.a == states.light.b }}",
+        "{{ states('light.a') | invalid_filter }}",
+    ):
+        info = render_to_info(hass, template_str)
+        assert info.state_values_only is False, template_str
+
+
 def test_async_render_to_info_with_complex_branching(hass: HomeAssistant) -> None:
     """Test async_render_to_info function by domain."""
     hass.states.async_set("light.a", "off")
@@ -5065,27 +5093,52 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_compiled_template_cache() -> None:
+    """Test compiled template code is shared and LRU bounded."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
-    tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    key = (template_string, False, False, False)
+    cache = template.CompiledTemplateCache(2)
+    with patch.object(template, "COMPILED_TEMPLATE_CACHE", cache):
+        tpl = template.Template(template_string)
+        tpl.ensure_valid()
+        assert key in cache
+        assert (cache.hits, cache.misses) == (0, 1)
 
-    tpl2 = template.Template(
-        (template_string),
-    )
-    tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+        tpl2 = template.Template(template_string)
+        tpl2.ensure_valid()
+        assert tpl2._compiled_code is tpl._compiled_code
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        del tpl
+        del tpl2
+        assert key in cache
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+        template.Template("{{ 1 }}").ensure_valid()
+        template.Template("{{ 2 }}").ensure_valid()
+        assert key not in cache
+        assert len(cache) == 2
+        assert cache.evictions == 1
+
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+
+async def test_compiled_template_shared_between_templates(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates with the same source share the jinja2 template."""
+    tpl = template.Template("{{ states('sensor.test') }}", hass)
+    tpl2 = template.Template("{{ states('sensor.test') }}", hass)
+    limited_tpl = template.Template("{{ states('sensor.test') }}", hass)
+    assert tpl.async_render() == "unknown"
+    assert tpl2.async_render() == "unknown"
+    assert tpl._compiled is tpl2._compiled
+    with pytest.raises(TemplateError):
+        limited_tpl.async_render(limited=True)
+    assert limited_tpl._compiled is not tpl._compiled
 
 
 def test_is_template_string() -> None:
@@ -11,13 +11,22 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import CoreState, HomeAssistant, State, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import update_coordinator
 from homeassistant.util.dt import utcnow
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import (
+    MockConfigEntry,
+    MockEntityPlatform,
+    async_capture_events,
+    async_fire_time_changed,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -449,6 +458,45 @@ async def test_coordinator_entity(
     assert len(crd._listeners) == 0
 
 
+async def test_coordinator_entities_write_states_together(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the states written by the coordinator entities are set together."""
+
+    class DataEntity(update_coordinator.CoordinatorEntity):
+        """Entity with the data of the coordinator as state."""
+
+        @callback
+        def _handle_coordinator_update(self) -> None:
+            """Write the data of the coordinator."""
+            self._attr_state = self.coordinator.data
+            self.async_write_ha_state()
+
+    entities = [DataEntity(crd) for _ in range(3)]
+    for index, entity in enumerate(entities):
+        entity.entity_id = f"sensor.data_{index}"
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities(entities)
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    states_during_update: list[State | None] = []
+    crd.async_add_listener(
+        lambda: states_during_update.append(hass.states.get("sensor.data_0"))
+    )
+    crd.async_set_updated_data(5)
+    await hass.async_block_till_done()
+
+    # The states are set once all listeners were updated
+    assert states_during_update[0].state == STATE_UNKNOWN
+    assert len(events) == 3
+    states = [hass.states.get(entity.entity_id) for entity in entities]
+    assert {state.state for state in states} == {"5"}
+    assert len({state.last_updated for state in states}) == 1
+
+    await crd.async_shutdown()
+
+
 async def test_async_set_updated_data(
     crd: update_coordinator.DataUpdateCoordinator[int],
 ) -> None:
@@ -1466,6 +1466,84 @@ async def test_setup_does_base_platforms_first(hass: HomeAssistant) -> None:
     assert order[3:] == ["root", "first_dep", "second_dep"]
 
 
+async def test_setup_scheduler_priorities(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test domains on the longest chain of dependants get the highest priority."""
+    hass_storage[bootstrap.SETUP_REPORT_STORAGE_KEY] = {
+        "version": bootstrap.SETUP_REPORT_STORAGE_VERSION,
+        "key": bootstrap.SETUP_REPORT_STORAGE_KEY,
+        "data": {
+            "seconds": 5.0,
+            "critical_path": ["root", "slow"],
+            "integrations": {
+                "root": {
+                    "started": 0.0,
+                    "finished": 1.0,
+                    "import_seconds": 0.25,
+                    "setup_seconds": 0.75,
+                },
+                # Started with root, but waited for it to finish first
+                "slow": {
+                    "started": 0.0,
+                    "finished": 5.0,
+                    "import_seconds": 0.5,
+                    "setup_seconds": 3.5,
+                },
+                # Queued behind the other imports
+                "quick": {
+                    "started": 0.0,
+                    "finished": 3.0,
+                    "import_seconds": 0.5,
+                    "setup_seconds": 1.5,
+                },
+            },
+        },
+    }
+    integration_cache = {
+        "root": mock_integration(hass, MockModule(domain="root")),
+        "slow": mock_integration(
+            hass, MockModule(domain="slow", dependencies=["root"])
+        ),
+        "quick": mock_integration(hass, MockModule(domain="quick")),
+        "new": mock_integration(
+            hass,
+            MockModule(
+                domain="new", partial_manifest={"after_dependencies": ["quick"]}
+            ),
+        ),
+    }
+
+    scheduler = bootstrap._SetupScheduler(hass)
+    await scheduler.async_load()
+    scheduler.async_prioritize(set(integration_cache), integration_cache)
+
+    assert scheduler.priorities == {
+        "root": 5.0,
+        "slow": 4.0,
+        "quick": 2.0 + bootstrap.SETUP_PRIORITY_DEFAULT_SECONDS,
+        "new": bootstrap.SETUP_PRIORITY_DEFAULT_SECONDS,
+    }
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_report_saved(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the setup report is saved after the integrations are set up."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule(domain="root"))
+    mock_integration(hass, MockModule(domain="leaf", dependencies=["root"]))
+
+    with patch("homeassistant.bootstrap.DEFAULT_INTEGRATIONS", set()):
+        await bootstrap._async_set_up_integrations(hass, {"leaf": {}})
+    await hass.async_block_till_done()
+
+    report = hass_storage[bootstrap.SETUP_REPORT_STORAGE_KEY]["data"]
+    assert report["critical_path"][-1] == "leaf"
+    assert {"root", "leaf"} <= report["integrations"].keys()
+
+
 def test_should_rollover_is_always_false():
     """Test that shouldRollover always returns False."""
     assert (
@@ -1158,6 +1158,107 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can listen for events by the value of an event data key."""
+    calls_a = []
+    calls_ab = []
+
+    @ha.callback
+    def listener_a(event):
+        """Mock listener."""
+        calls_a.append(event)
+
+    async def listener_ab(event):
+        """Mock listener."""
+        calls_ab.append(event)
+
+    listeners_before = hass.bus.async_listeners().get("test", 0)
+    unsub_a = hass.bus.async_listen_keyed("test", "entity_id", "light.a", listener_a)
+    unsub_ab = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.a", "light.b"], listener_ab
+    )
+    # All keyed listeners for the same event type and key share one bus listener
+    assert hass.bus.async_listeners()["test"] == listeners_before + 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.c"})
+    hass.bus.async_fire("test", {"other": "light.a"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls_a) == 0
+    assert len(calls_ab) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(calls_a) == 1
+    assert len(calls_ab) == 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.b"})
+    await hass.async_block_till_done()
+    assert len(calls_a) == 1
+    assert len(calls_ab) == 2
+
+    unsub_a()
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(calls_a) == 1
+    assert len(calls_ab) == 3
+
+    unsub_ab()
+    assert hass.bus.async_listeners().get("test", 0) == listeners_before
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(calls_ab) == 3
+
+
+async def test_eventbus_keyed_listener_unsubscribe_during_dispatch(
+    hass: HomeAssistant,
+) -> None:
+    """Test keyed listeners can unsubscribe while being dispatched."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+        unsub()
+
+    @ha.callback
+    def listener2(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed("test", "device_id", "abc", listener)
+    unsub2 = hass.bus.async_listen_keyed("test", "device_id", "abc", listener2)
+
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    unsub2()
+
+
+async def test_eventbus_keyed_listener_remove_twice(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test removing a keyed listener twice logs."""
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", "light.a", ha.callback(lambda event: None)
+    )
+    unsub()
+    unsub()
+    assert "Unable to remove unknown keyed listener" in caplog.text
+
+
+async def test_eventbus_keyed_listener_match_all(hass: HomeAssistant) -> None:
+    """Test keyed listeners can not listen to all events."""
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(
+            MATCH_ALL, "entity_id", "light.a", ha.callback(lambda event: None)
+        )
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1533,6 +1634,71 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting several states at once."""
+    hass.states.async_set("light.bowl", "on", {})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [
+            ("light.bowl", "off", {"brightness": 0}, False, None, None),
+            ("Light.Kitchen", "on", None, False, None, None),
+        ]
+    )
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.kitchen",
+    ]
+    bowl = hass.states.get("light.bowl")
+    assert bowl.state == "off"
+    assert bowl.attributes == {"brightness": 0}
+    assert hass.states.get("light.kitchen").last_updated == bowl.last_updated
+
+
+async def test_statemachine_batch_writes(hass: HomeAssistant) -> None:
+    """Test states set in a batch are set when it exits."""
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_set("light.kitchen", "on", {})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with hass.states.async_batch_writes():
+        hass.states.async_set("light.bowl", "off")
+        with hass.states.async_batch_writes():
+            hass.states.async_set("light.porch", "off")
+        with pytest.raises(InvalidStateError):
+            hass.states.async_set("light.porch", "x" * 256)
+        hass.states.async_set("light.porch", "on")
+        assert hass.states.get("light.bowl").state == "on"
+        assert hass.states.get("light.porch") is None
+        # The state is set with the timestamp of the batch
+        hass.states.async_set("light.kitchen", "off", timestamp=1000.0)
+        # Removing an entity sets the collected states first
+        assert hass.states.async_remove("light.kitchen")
+        assert hass.states.get("light.bowl").state == "off"
+
+    await hass.async_block_till_done()
+    assert [
+        (
+            event.data["entity_id"],
+            event.data["new_state"] and event.data["new_state"].state,
+        )
+        for event in events
+    ] == [
+        ("light.bowl", "off"),
+        ("light.porch", "off"),
+        ("light.porch", "on"),
+        ("light.kitchen", "off"),
+        ("light.kitchen", None),
+    ]
+    assert {event.data["new_state"].last_updated_timestamp for event in events[:4]} == {
+        hass.states.get("light.bowl").last_updated_timestamp
+    }
+    assert hass.states.get("light.bowl").last_updated_timestamp != 1000.0
+    assert hass.states.get("light.porch").state == "on"
+    assert hass.states.get("light.kitchen") is None
+
+
 async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> None:
     """Test async_set avoids recreating ReadOnly dicts when possible."""
     attrs = {"some_attr": "attr_value"}
@@ -1,9 +1,12 @@
 """Test to verify that we can load components."""
 
 import asyncio
+import json
 import os
+import pathlib
 import sys
 import threading
+from types import ModuleType
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
@@ -13,6 +16,7 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, __version__
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 
@@ -1959,3 +1963,92 @@ async def test_hass_helpers_use_reported(
             "Detected that custom integration 'test_integration_frame' "
             "accesses hass.helpers.aiohttp_client. This is deprecated"
         ) in caplog.text
+
+
+def _make_index_root(tmp_path: pathlib.Path) -> ModuleType:
+    """Create a root module with an integration for the integration index."""
+    integration_dir = tmp_path / "index_test"
+    integration_dir.mkdir()
+    (integration_dir / "manifest.json").write_text(
+        json.dumps({"domain": "index_test", "name": "Index Test"})
+    )
+    (integration_dir / "light.py").write_text("")
+    root = ModuleType("homeassistant.components")
+    root.__path__ = [str(tmp_path)]
+    return root
+
+
+async def test_integration_index(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: pathlib.Path
+) -> None:
+    """Test the integration index skips reading unchanged integrations."""
+    root = _make_index_root(tmp_path)
+    await hass.data[loader.DATA_INTEGRATION_INDEX].async_load()
+
+    def resolve() -> loader.Integration | None:
+        return loader.Integration.resolve_from_root(hass, root, "index_test")
+
+    integration = await hass.async_add_executor_job(resolve)
+    assert integration.name == "Index Test"
+    assert integration.platforms_exists(["light", "switch"]) == ["light"]
+
+    with (
+        patch("homeassistant.loader.os.listdir") as mock_listdir,
+        patch("homeassistant.loader.json_loads") as mock_json_loads,
+    ):
+        integration = await hass.async_add_executor_job(resolve)
+    assert mock_listdir.call_count == 0
+    assert mock_json_loads.call_count == 0
+    assert integration.name == "Index Test"
+    assert integration.platforms_exists(["light", "switch"]) == ["light"]
+
+    # Adding a platform changes the modification time of the directory
+    integration_dir = tmp_path / "index_test"
+    (integration_dir / "sensor.py").write_text("")
+    directory_stat = integration_dir.stat()
+    os.utime(
+        integration_dir,
+        ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns + 1_000_000_000),
+    )
+    integration = await hass.async_add_executor_job(resolve)
+    assert integration.platforms_exists(["light", "sensor"]) == ["light", "sensor"]
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    data = hass_storage[loader.INTEGRATION_INDEX_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    entry = data["integrations"][str(integration_dir / "manifest.json")]
+    assert entry["manifest"] == {"domain": "index_test", "name": "Index Test"}
+    assert entry["files"] == ["light.py", "manifest.json", "sensor.py"]
+
+
+async def test_integration_index_other_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: pathlib.Path
+) -> None:
+    """Test the integration index is not used after an upgrade."""
+    root = _make_index_root(tmp_path)
+    manifest_path = tmp_path / "index_test" / "manifest.json"
+    hass_storage[loader.INTEGRATION_INDEX_STORAGE_KEY] = {
+        "version": loader.INTEGRATION_INDEX_STORAGE_VERSION,
+        "key": loader.INTEGRATION_INDEX_STORAGE_KEY,
+        "data": {
+            "ha_version": "0.1.0",
+            "integrations": {
+                str(manifest_path): {
+                    "mtimes": [
+                        manifest_path.stat().st_mtime_ns,
+                        manifest_path.parent.stat().st_mtime_ns,
+                    ],
+                    "manifest": {"domain": "index_test", "name": "Outdated"},
+                    "files": [],
+                }
+            },
+        },
+    }
+    await hass.data[loader.DATA_INTEGRATION_INDEX].async_load()
+
+    integration = await hass.async_add_executor_job(
+        loader.Integration.resolve_from_root, hass, root, "index_test"
+    )
+    assert integration.name == "Index Test"
+    assert integration.platforms_exists(["light"]) == ["light"]
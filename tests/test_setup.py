@@ -1104,6 +1104,56 @@ async def test_async_get_setup_timings(hass) -> None:
     }
 
 
+async def test_async_get_setup_report(hass: HomeAssistant) -> None:
+    """Test the setup report follows the dependencies which held back startup."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule("root"))
+    mock_integration(hass, MockModule("quick"))
+    mock_integration(hass, MockModule("middle", dependencies=["root"]))
+    mock_integration(hass, MockModule("leaf", dependencies=["middle", "quick"]))
+    for domain in ("root", "quick", "middle", "leaf"):
+        await loader.async_get_integration(hass, domain)
+
+    timeline = setup._setup_timeline(hass)
+    timeline.update(
+        {
+            "root": setup.SetupTimeline(100.0, 102.0, 0.5),
+            "quick": setup.SetupTimeline(100.0, 100.5),
+            "middle": setup.SetupTimeline(100.0, 103.0),
+            "leaf": setup.SetupTimeline(100.0, 104.0, 0.25),
+            # Started after startup, not part of the report
+            "late": setup.SetupTimeline(101.0),
+        }
+    )
+    setup._setup_times(hass)["leaf"][None][setup.SetupPhases.SETUP] = 0.75
+
+    report = setup.async_get_setup_report(hass)
+    assert report["seconds"] == 4.0
+    assert report["critical_path"] == ["root", "middle", "leaf"]
+    assert report["integrations"]["leaf"] == {
+        "started": 0.0,
+        "finished": 4.0,
+        "import_seconds": 0.25,
+        "setup_seconds": 0.75,
+    }
+    assert "late" not in report["integrations"]
+
+
+async def test_setup_timeline_recorded_during_startup(hass: HomeAssistant) -> None:
+    """Test the setup timeline is only recorded during startup."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule("comp"))
+    assert await setup.async_setup_component(hass, "comp", {})
+
+    hass.set_state(CoreState.running)
+    mock_integration(hass, MockModule("comp2"))
+    assert await setup.async_setup_component(hass, "comp2", {})
+
+    report = setup.async_get_setup_report(hass)
+    assert report["critical_path"] == ["comp"]
+    assert list(report["integrations"]) == ["comp"]
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None: